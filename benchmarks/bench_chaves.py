@@ -0,0 +1,180 @@
+"""
+Benchmark da classificação de chaves Pix em um corpus misto de formatos reais.
+
+Compara a cadeia sequencial original (`uuid.UUID` com exceção, regex de e-mail
+compilada a cada chamada, conjunto de DDDs recriado a cada chamada, CPF e CNPJ)
+com o classificador de passada única `validate._classificar_chave`, sem cache,
+e com `validate.classificar_chave`, que usa o cache LRU.
+
+Uso:
+    $ python benchmarks/bench_chaves.py
+"""
+import random
+import re
+import sys
+import timeit
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from pixcore import validate  # noqa: E402
+
+
+def _cpf_aleatorio(rng: random.Random) -> str:
+    base = [rng.randint(0, 9) for _ in range(9)]
+    for peso_inicial in (10, 11):
+        soma = sum(d * p for d, p in zip(base, range(peso_inicial, 1, -1)))
+        dv = 11 - soma % 11
+        base.append(0 if dv >= 10 else dv)
+    return "".join(map(str, base))
+
+
+def _cnpj_aleatorio(rng: random.Random) -> str:
+    base = [rng.randint(0, 9) for _ in range(8)] + [0, 0, 0, 1]
+    for pesos in ((5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2), (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)):
+        resto = sum(d * p for d, p in zip(base, pesos)) % 11
+        base.append(0 if resto < 2 else 11 - resto)
+    return "".join(map(str, base))
+
+
+def montar_corpus(tamanho: int = 5000, semente: int = 42):
+    """Gera chaves nos formatos encontrados em cobranças reais, incluindo inválidas."""
+    rng = random.Random(semente)
+    geradores = [
+        lambda: str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+        lambda: str(uuid.UUID(int=rng.getrandbits(128), version=4)).upper(),
+        lambda: f"cliente{rng.randint(1, 99999)}@empresa.com.br",
+        lambda: f"+55{rng.choice(['11', '21', '31', '61'])}9{rng.randint(10000000, 99999999)}",
+        lambda: f"({rng.choice(['11', '48', '85'])}) 9{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}",
+        lambda: _cpf_aleatorio(rng),
+        lambda: "{0}.{1}.{2}-{3}".format(*(lambda c: (c[:3], c[3:6], c[6:9], c[9:]))(_cpf_aleatorio(rng))),
+        lambda: _cnpj_aleatorio(rng),
+        lambda: "{0}.{1}.{2}/{3}-{4}".format(*(lambda c: (c[:2], c[2:5], c[5:8], c[8:12], c[12:]))(_cnpj_aleatorio(rng))),
+        lambda: f"{rng.randint(10000000000, 99999999999)}",
+        lambda: f"chave-invalida-{rng.randint(1, 999)}",
+    ]
+    return [rng.choice(geradores)() for _ in range(tamanho)]
+
+
+# Implementação original, usada como linha de base.
+
+def _cpf_original(cpf):
+    cpf = ''.join(filter(str.isdigit, cpf))
+    if len(cpf) != 11 or cpf == cpf[0] * 11:
+        return False
+    soma = 0
+    for i in range(9):
+        soma += int(cpf[i]) * (10 - i)
+    primeiro = 11 - (soma % 11)
+    if primeiro >= 10:
+        primeiro = 0
+    if int(cpf[9]) != primeiro:
+        return False
+    soma = 0
+    for i in range(10):
+        soma += int(cpf[i]) * (11 - i)
+    segundo = 11 - (soma % 11)
+    if segundo >= 10:
+        segundo = 0
+    return int(cpf[10]) == segundo
+
+
+def _cnpj_original(cnpj):
+    cnpj = "".join(re.findall(r'\d', str(cnpj)))
+    if len(cnpj) != 14 or cnpj in (c * 14 for c in "0123456789"):
+        return False
+    base = [int(d) for d in cnpj[:12]]
+    dvs = [int(d) for d in cnpj[12:]]
+    resto = sum(n * p for n, p in zip(base, [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2])) % 11
+    dv1 = 0 if resto < 2 else 11 - resto
+    if dv1 != dvs[0]:
+        return False
+    resto = sum(n * p for n, p in zip(base + [dv1], [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2])) % 11
+    return (0 if resto < 2 else 11 - resto) == dvs[1]
+
+
+def _email_original(email):
+    padrao = re.compile(r'^[\w\.-]+@[\w\.-]+\.[a-zA-Z]{2,}$')
+    return bool(re.match(padrao, email))
+
+
+def _telefone_original(telefone):
+    numeros = re.sub(r'\D', '', telefone)
+    if len(numeros) in (12, 13):
+        if not numeros.startswith('55'):
+            return False
+        numeros = numeros[2:]
+    if not (10 <= len(numeros) <= 11):
+        return False
+    ddds = {
+        '11', '12', '13', '14', '15', '16', '17', '18', '19', '21', '22', '24',
+        '27', '28', '31', '32', '33', '34', '35', '37', '38', '41', '42', '43',
+        '44', '45', '46', '47', '48', '49', '51', '53', '54', '55', '61', '62',
+        '63', '64', '65', '66', '67', '68', '69', '71', '73', '74', '75', '77',
+        '79', '81', '82', '83', '84', '85', '86', '87', '88', '89', '91', '92',
+        '93', '94', '95', '96', '97', '98', '99'
+    }
+    if numeros[:2] not in ddds:
+        return False
+    numero = numeros[2:]
+    if len(numero) == 9:
+        return numero[0] == '9'
+    if len(numero) == 8:
+        return numero[0] != '9'
+    return False
+
+
+def _uuid_original(chave):
+    try:
+        uuid.UUID(chave)
+        return True
+    except ValueError:
+        return False
+
+
+def classificar_original(chave):
+    if _uuid_original(chave):
+        return "Chave Aleatória (EVP)"
+    elif '@' in chave and _email_original(chave):
+        return "Email"
+    elif _telefone_original(chave):
+        return "Telefone"
+    elif _cpf_original(chave):
+        return "CPF"
+    elif _cnpj_original(chave):
+        return "CNPJ"
+    return "Tipo Desconhecido"
+
+
+def medir(funcao, corpus, repeticoes: int = 5) -> float:
+    """Retorna o melhor tempo médio por chave, em microssegundos."""
+    tempos = timeit.repeat(lambda: [funcao(chave) for chave in corpus], repeat=repeticoes, number=1)
+    return min(tempos) / len(corpus) * 1e6
+
+
+def main():
+    corpus = montar_corpus()
+    assert [classificar_original(c) for c in corpus] == [validate._classificar_chave(c)[0] for c in corpus]
+
+    # Cobranças reais repetem poucas chaves (as dos recebedores): 50 chaves distintas.
+    rng = random.Random(7)
+    recorrente = [rng.choice(corpus[:50]) for _ in range(len(corpus))]
+
+    for nome, chaves in (("variado", corpus), ("recorrente", recorrente)):
+        validate.limpar_cache_chaves()
+        base = medir(classificar_original, chaves)
+        resultados = [
+            ("cadeia sequencial (original)", base),
+            ("passada única, sem cache", medir(validate._classificar_chave, chaves)),
+            ("classificar_chave (com cache)", medir(validate.classificar_chave, chaves)),
+        ]
+
+        print(f"Corpus {nome}: {len(chaves)} chaves ({len(set(chaves))} distintas)")
+        for rotulo, tempo in resultados:
+            print(f"  {rotulo:<32} {tempo:6.2f} µs/chave  ({base / tempo:5.1f}x)")
+        print(f"  {validate.estatisticas_cache_chaves()}\n")
+
+
+if __name__ == "__main__":
+    main()
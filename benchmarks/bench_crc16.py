@@ -0,0 +1,71 @@
+"""
+Micro-benchmark do cálculo do CRC16 em payloads de tamanho típico do Pix.
+
+Compara o algoritmo bit a bit original com a tabela pré-calculada em Python
+e com o backend em C (`binascii.crc_hqx`), quando disponível.
+
+Uso:
+    $ python benchmarks/bench_crc16.py
+"""
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from pixcore import utils  # noqa: E402
+
+PAYLOADS = {
+    "mínimo": "00020126330014BR.GOV.BCB.PIX0111123456789005204000053039865802BR5905TESTE6008BRASILIA62070503***6304",
+    "típico": "00020126580014BR.GOV.BCB.PIX0136a1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d5204000053039865406150.755802BR5921Empresa Completa LTDA6009SAO PAULO61080100100062150511Pedido1234564460005en_US0120Complete Company LLC0209SAO PAULO6304",
+}
+
+
+def crc16_bit_a_bit(payload: str) -> str:
+    """Implementação original, bit a bit, usada como linha de base."""
+    crc = 0xFFFF
+    for byte in payload.encode('utf-8'):
+        crc ^= (byte << 8)
+        for _ in range(8):
+            if (crc & 0x8000):
+                crc = (crc << 1) ^ 0x1021
+            else:
+                crc <<= 1
+    return format(crc & 0xFFFF, 'X').zfill(4)
+
+
+def crc16_tabela(payload: str) -> str:
+    """Tabela pré-calculada em Python puro, sem o backend em C."""
+    return '%04X' % utils._crc16_table_update(payload.encode('utf-8'), 0xFFFF)
+
+
+def medir(funcao, argumento, repeticoes: int = 5, numero: int = 2000) -> float:
+    """Retorna o melhor tempo por chamada, em microssegundos."""
+    tempos = timeit.repeat(lambda: funcao(argumento), repeat=repeticoes, number=numero)
+    return min(tempos) / numero * 1e6
+
+
+def main():
+    backend = "binascii.crc_hqx" if utils._crc_hqx is not None else "tabela (Python)"
+    print(f"Backend ativo de calculate_crc16: {backend}\n")
+
+    for nome, payload in PAYLOADS.items():
+        assert crc16_bit_a_bit(payload) == crc16_tabela(payload) == utils.calculate_crc16(payload)
+        dados = payload.encode('utf-8')
+
+        base = medir(crc16_bit_a_bit, payload)
+        resultados = [
+            ("bit a bit (original)", base),
+            ("tabela (Python)", medir(crc16_tabela, payload)),
+            ("calculate_crc16(str)", medir(utils.calculate_crc16, payload)),
+            ("calculate_crc16(bytes)", medir(utils.calculate_crc16, dados)),
+        ]
+
+        print(f"Payload {nome} - {len(dados)} bytes")
+        for rotulo, tempo in resultados:
+            print(f"  {rotulo:<24} {tempo:8.2f} µs  ({base / tempo:6.1f}x)")
+        print()
+
+
+if __name__ == "__main__":
+    main()
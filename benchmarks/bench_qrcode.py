@@ -0,0 +1,80 @@
+"""
+Benchmark da renderização da matriz de módulos em imagem.
+
+Compara o caminho original do qrcode (`make_image`, que desenha um retângulo
+por módulo, seguido de `convert('RGB')`) com o renderizador direto
+`brcode._desenhar_matriz`, que monta os pixels por multiplicação de bytes e
+cria a imagem com um único `Image.frombuffer`. A matriz é calculada uma vez,
+de modo que apenas a renderização é medida. Ao final, compara o PNG completo
+(renderização e compressão) com o SVG vetorial de `brcode._svg_qrcode`.
+
+Uso:
+    $ python benchmarks/bench_qrcode.py
+"""
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import qrcode  # noqa: E402
+from qrcode.image.pil import PilImage  # noqa: E402
+
+from pixcore import brcode  # noqa: E402
+
+PAYLOAD = "00020126580014BR.GOV.BCB.PIX0136123e4567-e89b-12d3-a456-426655440000520400005303986540519.905802BR5914EMPRESA MODELO6009SAO PAULO62130509PEDIDO12363043A0E"
+
+CENARIOS = [
+    ("preto e branco, box 10", dict(cor_qr="black", cor_fundo="white", box_size=10)),
+    ("preto e branco, box 40", dict(cor_qr="black", cor_fundo="white", box_size=40)),
+    ("colorido, box 10", dict(cor_qr="navy", cor_fundo="#FFEECC", box_size=10)),
+]
+
+
+def make_image_original(matriz, cor_qr, cor_fundo, box_size, border=4):
+    """Renderização original: um `drawrect` por módulo e conversão para RGB."""
+    imagem = PilImage(border, len(matriz), box_size, qrcode_modules=matriz, fill_color=cor_qr, back_color=cor_fundo)
+    for linha, modulos in enumerate(matriz):
+        for coluna, modulo in enumerate(modulos):
+            if modulo:
+                imagem.drawrect(linha, coluna)
+    return imagem.get_image().convert('RGB')
+
+
+def medir(funcao, repeticoes: int = 5, numero: int = 20) -> float:
+    """Retorna o melhor tempo por chamada, em milissegundos."""
+    tempos = timeit.repeat(funcao, repeat=repeticoes, number=numero)
+    return min(tempos) / numero * 1e3
+
+
+def main():
+    matriz = brcode._gerar_matriz(PAYLOAD)
+    print(f"Payload de {len(PAYLOAD)} bytes: versão {brcode.info_qrcode(PAYLOAD).versao}, {len(matriz)} módulos\n")
+
+    for nome, opcoes in CENARIOS:
+        original = make_image_original(matriz, **opcoes)
+        direta = brcode._desenhar_matriz(matriz, **opcoes)
+        assert original.tobytes() == direta.convert('RGB').tobytes()
+
+        base = medir(lambda: make_image_original(matriz, **opcoes))
+        resultados = [
+            ("make_image + RGB (original)", base, original),
+            ("_desenhar_matriz", medir(lambda: brcode._desenhar_matriz(matriz, **opcoes)), direta),
+            ("_desenhar_matriz + RGB", medir(lambda: brcode._desenhar_matriz(matriz, **opcoes).convert('RGB')), original),
+        ]
+
+        print(f"{nome} - {original.size[0]}x{original.size[1]} pixels")
+        for rotulo, tempo, imagem in resultados:
+            memoria = len(imagem.tobytes()) / 1024
+            print(f"  {rotulo:<30} {tempo:7.2f} ms  ({base / tempo:5.1f}x)  {memoria:8.0f} KiB, modo {imagem.mode}")
+        print()
+
+    png = medir(lambda: brcode._codificar_png(brcode._desenhar_qrcode(matriz, None, "black", "white", 10, 4)))
+    svg = medir(lambda: brcode._svg_qrcode(matriz))
+    print("Arquivo completo (box 10)")
+    print(f"  {'PNG RGB (render + compressão)':<30} {png:7.2f} ms")
+    print(f"  {'SVG (_svg_qrcode)':<30} {svg:7.2f} ms  ({png / svg:5.1f}x)  {len(brcode._svg_qrcode(matriz)) / 1024:5.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark do tempo de inicialização da biblioteca e da CLI.
+
+Executa `import pixcore` e cada subcomando da CLI em um processo novo com
+`python -X importtime`, somando o tempo de importação dos módulos de primeiro
+nível e indicando quais dependências pesadas (Pillow, qrcode, pyfiglet e as
+tabelas/painéis do rich) foram carregadas.
+
+Uso:
+    $ python benchmarks/bench_startup.py
+    $ python benchmarks/bench_startup.py --repeticoes 10
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+PAYLOAD = "00020126580014BR.GOV.BCB.PIX0136123e4567-e89b-12d3-a456-426655440000520400005303986540519.905802BR5914EMPRESA MODELO6009SAO PAULO62130509PEDIDO12363043A0E"
+ARGS_PIX = ["--key", "123e4567-e89b-12d3-a456-426655440000", "--name", "EMPRESA MODELO", "--city", "SAO PAULO"]
+
+DEPENDENCIAS_PESADAS = ("PIL", "qrcode", "pyfiglet", "rich.table", "rich.panel")
+
+LINHA_IMPORTTIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def cenarios(diretorio: Path):
+    """Retorna os cenários medidos: (rótulo, código Python executado)."""
+    csv_path = diretorio / "cobrancas.csv"
+    csv_path.write_text(
+        "valor,txid\n" + "".join(f"{i}.50,TXID{i:04d}\n" for i in range(1, 51)),
+        encoding="utf-8",
+    )
+
+    def cli(*argv):
+        return (
+            "import sys\n"
+            "from pixcore.cli import app\n"
+            f"sys.argv = ['pixcore', *{list(argv)!r}]\n"
+            "try:\n"
+            "    app()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+        )
+
+    return [
+        ("import pixcore", "import pixcore"),
+        ("import pixcore.cli", "import pixcore.cli"),
+        ("pixcore --version", cli("--version")),
+        ("pixcore payload", cli("payload", *ARGS_PIX)),
+        ("pixcore decode", cli("decode", PAYLOAD)),
+        ("pixcore config show", cli("config", "show")),
+        ("pixcore qrcode", cli("qrcode", *ARGS_PIX, "--output", str(diretorio / "qr.png"))),
+        ("pixcore lote --formato payload", cli("lote", str(csv_path), str(diretorio / "payloads.csv"), *ARGS_PIX, "--formato", "payload")),
+        ("pixcore --help", cli("--help")),
+    ]
+
+
+def executar(codigo: str):
+    """Executa `codigo` em um processo novo e retorna (tempo total em ms, importações em ms, módulos)."""
+    ambiente = dict(os.environ, PYTHONPATH=str(SRC))
+    inicio = time.perf_counter()
+    processo = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", codigo],
+        capture_output=True, text=True, env=ambiente,
+    )
+    total = (time.perf_counter() - inicio) * 1000
+
+    importacoes = 0
+    modulos = set()
+    for linha in processo.stderr.splitlines():
+        encontrado = LINHA_IMPORTTIME.match(linha)
+        if not encontrado:
+            continue
+        modulos.add(encontrado.group(4))
+        if len(encontrado.group(3)) == 1:
+            importacoes += int(encontrado.group(2))
+
+    return total, importacoes / 1000, modulos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeticoes", type=int, default=5, help="Execuções por cenário (usa a mediana).")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        diretorio = Path(tmp)
+        print(f"{'Cenário':<32} {'total':>9} {'imports':>9}  dependências pesadas")
+        for rotulo, codigo in cenarios(diretorio):
+            medicoes = [executar(codigo) for _ in range(args.repeticoes)]
+            total = statistics.median(m[0] for m in medicoes)
+            importacoes = statistics.median(m[1] for m in medicoes)
+            carregadas = [d for d in DEPENDENCIAS_PESADAS if d in medicoes[-1][2]]
+            print(f"{rotulo:<32} {total:7.1f}ms {importacoes:7.1f}ms  {', '.join(carregadas) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
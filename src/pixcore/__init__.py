@@ -1,5 +1,41 @@
 from .exceptions import *
 
-from .brcode import Pix
-from .models import PixData
-from .decipher import decode
\ No newline at end of file
+# Equivale a `typing.TYPE_CHECKING`, sem o custo de importar o `typing`.
+_TYPE_CHECKING = False
+if _TYPE_CHECKING:
+    from .brcode import Pix, PixTemplate
+    from .models import DecodedPix, PixData
+    from .decipher import decode
+
+# Os objetos públicos são carregados na primeira vez em que são acessados, de
+# modo que `import pixcore` não paga pela importação de módulos não utilizados.
+_EXPORTS_TARDIOS = {
+    "Pix": "brcode",
+    "PixTemplate": "brcode",
+    "PixData": "models",
+    "DecodedPix": "models",
+    "decode": "decipher",
+}
+
+__all__ = [
+    "PixCoreError",
+    "ChavePixInvalidaError",
+    "GeracaoPayloadError",
+    "ProcessamentoImagemError",
+    "ErroDeESError",
+    "DecodificacaoPayloadError",
+    "CRCInvalidoError",
+    *_EXPORTS_TARDIOS,
+]
+
+def __getattr__(nome: str):
+    modulo = _EXPORTS_TARDIOS.get(nome)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    from importlib import import_module
+    valor = getattr(import_module(f".{modulo}", __name__), nome)
+    globals()[nome] = valor
+    return valor
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS_TARDIOS))
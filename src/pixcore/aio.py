@@ -0,0 +1,177 @@
+"""
+Módulo de Geração Assíncrona (asyncio).
+
+Em serviços HTTP baseados em asyncio, chamar `Pix.qrcode()` ou
+`Pix.save_qrcode()` diretamente bloqueia o event loop durante a codificação da
+matriz, a renderização e a compressão do PNG. Este módulo oferece versões
+`async` dessas operações que executam o trabalho pesado em um executor
+(threads ou processos) e limitam, com um semáforo, quantas renderizações
+acontecem ao mesmo tempo.
+
+As funções de módulo (`payload`, `qrcode_png` e `save_qrcode`) usam um
+`GeradorAssincrono` padrão, que pode ser ajustado com `configurar()`.
+
+Examples:
+    >>> dados = PixData(
+    ...     recebedor_nome="EMPRESA MODELO",
+    ...     recebedor_cidade="SAO PAULO",
+    ...     pix_key="123e4567-e89b-12d3-a456-426655440000",
+    ... )
+    >>> png = asyncio.run(qrcode_png(dados))
+    >>> png[:8]
+    b'\\x89PNG\\r\\n\\x1a\\n'
+"""
+from . import brcode
+from .brcode import Pix
+from .models import PixData
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Optional, Union
+import asyncio
+import functools
+import os
+
+def _pix(pix: Union[Pix, PixData]) -> Pix:
+    return pix if isinstance(pix, Pix) else Pix(pix)
+
+def _gerar_png(payload: str, caminho_logo, cor_qr, cor_fundo, box_size: int, border: int, modo: str, compress_level: int, optimize: bool, cache) -> bytes:
+    """Renderiza e codifica o PNG (executada no executor)."""
+    if cache:
+        from .cache import _resolver
+        return _resolver(cache).png(payload, caminho_logo, cor_qr, cor_fundo, box_size, border, modo, compress_level, optimize)
+    imagem = brcode._render_qrcode(payload, caminho_logo, cor_qr, cor_fundo, box_size, border, modo)
+    return brcode._codificar_png(imagem, compress_level, optimize)
+
+class GeradorAssincrono:
+    """
+    Executa a geração de QR Codes fora do event loop, com concorrência limitada.
+
+    Args:
+        executor (concurrent.futures.Executor, optional): O executor usado na
+            renderização. Um `ThreadPoolExecutor` mantém o event loop livre;
+            um `ProcessPoolExecutor` também evita a disputa pelo GIL. Se `None`,
+            usa o executor padrão do event loop. Defaults to None.
+        max_concorrencia (int, optional): Quantidade máxima de renderizações
+            simultâneas; as demais aguardam sem ocupar o executor. Se `None`, usa
+            o número de CPUs com um `ProcessPoolExecutor` e 1 com threads: a
+            codificação da matriz é Python puro e não roda em paralelo com o GIL,
+            então mais threads apenas aumentam o tempo em que o event loop espera
+            pelo GIL. Defaults to None.
+
+    Raises:
+        ValueError: Se `max_concorrencia` for menor que 1.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None, max_concorrencia: Optional[int] = None):
+        if max_concorrencia is None:
+            max_concorrencia = (os.cpu_count() or 1) if isinstance(executor, ProcessPoolExecutor) else 1
+        if max_concorrencia < 1:
+            raise ValueError("A concorrência máxima deve ser de pelo menos 1.")
+        self.executor = executor
+        self.max_concorrencia = max_concorrencia
+        self._semaforo: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _obter_semaforo(self) -> asyncio.Semaphore:
+        # Um semáforo pertence a um único event loop; outro loop recebe um novo.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._semaforo = asyncio.Semaphore(self.max_concorrencia)
+            self._loop = loop
+        return self._semaforo
+
+    async def _executar(self, funcao, *args):
+        async with self._obter_semaforo():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, functools.partial(funcao, *args))
+
+    async def payload(self, pix: Union[Pix, PixData]) -> str:
+        """
+        Retorna o payload (Copia e Cola) da cobrança.
+
+        A montagem do payload leva microssegundos, menos que o envio a um
+        executor, por isso é feita diretamente no event loop.
+
+        Args:
+            pix (Pix | PixData): A cobrança.
+
+        Returns:
+            str: O payload completo.
+        """
+        return _pix(pix).payload()
+
+    async def qrcode_png(self, pix: Union[Pix, PixData], caminho_logo=None, cor_qr: str = "black", cor_fundo: str = "white", box_size: int = 10, border: int = 4, modo: str = "RGB", compress_level: int = 6, optimize: bool = False, cache=None) -> bytes:
+        """
+        Gera o QR Code da cobrança e retorna o arquivo PNG já codificado.
+
+        Args:
+            pix (Pix | PixData): A cobrança.
+            caminho_logo, cor_qr, cor_fundo, box_size, border, modo: As mesmas opções de `Pix.qrcode()`.
+            compress_level, optimize: As opções de compressão de `Pix.save_qrcode()`.
+            cache (CacheQRCode | bool, optional): Um `pixcore.cache.CacheQRCode`, ou `True`
+                para o cache compartilhado. Não pode ser usado com um `ProcessPoolExecutor`,
+                pois cada processo teria a sua própria cópia. Defaults to None.
+
+        Returns:
+            bytes: O conteúdo do arquivo PNG.
+
+        Raises:
+            exceptions.ProcessamentoImagemError: Se ocorrer um erro ao processar o logo.
+            ValueError: Se o modo for inválido, ou se `cache` for usado com processos.
+        """
+        payload = _pix(pix).payload()
+        brcode._validar_modo(modo, cor_qr, cor_fundo)
+        if cache and isinstance(self.executor, ProcessPoolExecutor):
+            raise ValueError("O cache de QR Codes não pode ser compartilhado com um ProcessPoolExecutor.")
+        return await self._executar(
+            _gerar_png, payload, caminho_logo, cor_qr, cor_fundo, box_size, border, modo, compress_level, optimize, cache
+        )
+
+    async def save_qrcode(self, pix: Union[Pix, PixData], caminho_arquivo_saida: str, caminho_logo=None, cor_qr: str = "black", cor_fundo: str = "white", box_size: int = 10, border: int = 4, modo: str = "RGB", compress_level: int = 6, optimize: bool = False) -> bool:
+        """
+        Gera e salva o QR Code em um arquivo, sem bloquear o event loop.
+
+        Equivale a `Pix.save_qrcode()`, inclusive nos formatos aceitos e nas exceções.
+
+        Returns:
+            bool: `True` se o arquivo foi salvo.
+
+        Raises:
+            exceptions.ErroDeESError: Se ocorrer um erro ao salvar o arquivo.
+            ValueError: Se o modo for inválido.
+        """
+        pix = _pix(pix)
+        if not str(caminho_arquivo_saida).lower().endswith(".svg"):
+            brcode._validar_modo(modo, cor_qr, cor_fundo)
+        return await self._executar(
+            functools.partial(
+                pix.save_qrcode, caminho_arquivo_saida, caminho_logo, cor_qr, cor_fundo, box_size, border,
+                modo=modo, compress_level=compress_level, optimize=optimize,
+            )
+        )
+
+_GERADOR_PADRAO = GeradorAssincrono()
+
+def configurar(executor: Optional[Executor] = None, max_concorrencia: Optional[int] = None):
+    """
+    Substitui o executor e o limite de concorrência usados pelas funções do módulo.
+
+    Args:
+        executor (concurrent.futures.Executor, optional): O executor da renderização.
+            Se `None`, usa o executor padrão do event loop. Defaults to None.
+        max_concorrencia (int, optional): Renderizações simultâneas. Se `None`, usa o
+            padrão de `GeradorAssincrono`. Defaults to None.
+    """
+    global _GERADOR_PADRAO
+    _GERADOR_PADRAO = GeradorAssincrono(executor, max_concorrencia)
+
+async def payload(pix: Union[Pix, PixData]) -> str:
+    """Versão assíncrona de `Pix.payload()` (veja `GeradorAssincrono.payload`)."""
+    return await _GERADOR_PADRAO.payload(pix)
+
+async def qrcode_png(pix: Union[Pix, PixData], **opcoes) -> bytes:
+    """Gera o PNG do QR Code fora do event loop (veja `GeradorAssincrono.qrcode_png`)."""
+    return await _GERADOR_PADRAO.qrcode_png(pix, **opcoes)
+
+async def save_qrcode(pix: Union[Pix, PixData], caminho_arquivo_saida: str, **opcoes) -> bool:
+    """Salva o QR Code em um arquivo fora do event loop (veja `GeradorAssincrono.save_qrcode`)."""
+    return await _GERADOR_PADRAO.save_qrcode(pix, caminho_arquivo_saida, **opcoes)
@@ -0,0 +1,194 @@
+"""
+Módulo de Geração de Payloads em Lote.
+
+Gera milhares de payloads "Copia e Cola" de um mesmo recebedor a partir de
+colunas de valores e TXIDs (listas, `array.array` ou arrays do NumPy), sem
+criar um `PixData` nem um `Pix` por cobrança.
+
+As partes fixas do payload são serializadas uma única vez por um
+`PixTemplate`, e cada linha custa apenas a formatação do valor, a
+concatenação das partes e o CRC16 do sufixo. Erros de uma linha não
+interrompem o lote: eles são reportados em uma máscara de erros.
+"""
+from . import constants as const
+from . import exceptions
+from . import models
+from . import utils
+from .brcode import Pix, PixTemplate
+from .models import PixData
+from typing import Any, List, NamedTuple, Optional, Sequence, Union
+import math
+
+class ResultadoLote(NamedTuple):
+    """
+    Resultado da geração de payloads em lote.
+
+    As três colunas são paralelas às entradas: a posição `i` de cada uma
+    corresponde à linha `i` do lote. Quando os valores de entrada são um
+    `numpy.ndarray`, `payloads` e `erros` também são arrays do NumPy.
+
+    Attributes:
+        payloads (List[str]): O payload gerado para cada linha, ou uma string
+                              vazia se a linha apresentou erro.
+        erros (List[bool]): Máscara de erros. `True` indica que a linha não
+                            pôde ser gerada.
+        motivos (List[Optional[str]]): O motivo do erro de cada linha, ou `None`
+                                       para as linhas geradas com sucesso.
+    """
+    payloads: List[str]
+    erros: List[bool]
+    motivos: List[Optional[str]]
+
+    @property
+    def total_erros(self) -> int:
+        """Quantidade de linhas que não puderam ser geradas."""
+        return int(sum(self.erros))
+
+def _formatar_centavos(valores: List[Any], motivos: List[Optional[str]]) -> List[str]:
+    """
+    Formata uma coluna de centavos inteiros no campo TLV 54, sem conversões para `float`.
+
+    `None` representa um valor aberto (campo omitido).
+    """
+    campos = []
+    for i, valor in enumerate(valores):
+        if valor is None:
+            campos.append("")
+            continue
+        if type(valor) is not int:
+            motivos[i] = f"Valor '{valor}' é inválido."
+            campos.append("")
+            continue
+        if valor <= 0:
+            motivos[i] = "O valor (valor), se presente, deve ser positivo."
+            campos.append("")
+            continue
+        valor_str = utils.format_cents(valor)
+        campos.append(f"{const.ID_TRANSACTION_AMOUNT}{len(valor_str):02d}{valor_str}")
+    return campos
+
+def _formatar_valores(valores: List[Any], motivos: List[Optional[str]]) -> List[str]:
+    """
+    Formata a coluna de valores no campo TLV 54, registrando os erros em `motivos`.
+
+    Apenas `None` e strings vazias representam um valor aberto (campo omitido).
+    `NaN` e infinitos (ex: uma coluna numérica corrompida) são erros da linha,
+    e não cobranças sem valor.
+    """
+    campos = []
+    for i, valor in enumerate(valores):
+        if valor is None or (isinstance(valor, str) and valor == ""):
+            campos.append("")
+            continue
+        try:
+            if not math.isfinite(valor):
+                motivos[i] = f"Valor '{valor}' é inválido."
+                campos.append("")
+                continue
+            if valor <= 0:
+                motivos[i] = "O valor (valor), se presente, deve ser positivo."
+                campos.append("")
+                continue
+            valor_str = f"{valor:.2f}"
+        except (TypeError, ValueError):
+            motivos[i] = f"Valor '{valor}' é inválido."
+            campos.append("")
+            continue
+        campos.append(f"{const.ID_TRANSACTION_AMOUNT}{len(valor_str):02d}{valor_str}")
+    return campos
+
+def generate_payloads(
+    template: Union[PixTemplate, Pix, PixData],
+    valores: Sequence[Any],
+    txids: Optional[Sequence[str]] = None,
+    em_centavos: bool = False,
+) -> ResultadoLote:
+    """
+    Gera os payloads de um lote de cobranças de um mesmo recebedor.
+
+    Args:
+        template (PixTemplate | Pix | PixData): O modelo do recebedor. Objetos `Pix`
+            e `PixData` são compilados automaticamente em um `PixTemplate`.
+        valores (Sequence): Coluna com o valor de cada cobrança. Aceita listas,
+            tuplas, `array.array` ou `numpy.ndarray`. `None` gera um payload com
+            valor aberto; `NaN` e infinitos são reportados como erros da linha.
+        txids (Optional[Sequence[str]], optional): Coluna com o TXID de cada cobrança.
+            Se `None`, todas as cobranças usam "***". Defaults to None.
+        em_centavos (bool, optional): Se `True`, `valores` contém centavos inteiros
+            (ex: um array `int64`), formatados sem passar por `float`. Defaults to False.
+
+    Returns:
+        ResultadoLote: Os payloads gerados, a máscara de erros e os motivos.
+
+    Raises:
+        exceptions.GeracaoPayloadError: Se as colunas `valores` e `txids` tiverem
+                                        tamanhos diferentes.
+
+    Examples:
+        >>> dados = PixData(
+        ...     recebedor_nome="EMPRESA MODELO",
+        ...     recebedor_cidade="SAO PAULO",
+        ...     pix_key="123e4567-e89b-12d3-a456-426655440000",
+        ... )
+        >>> resultado = generate_payloads(dados, [19.90, -1.0], ["PEDIDO123", "PEDIDO124"])
+        >>> resultado.erros
+        [False, True]
+        >>> resultado.motivos[1]
+        'O valor (valor), se presente, deve ser positivo.'
+        >>> generate_payloads(dados, [1990], ["PEDIDO123"], em_centavos=True).payloads == resultado.payloads[:1]
+        True
+    """
+    if not isinstance(template, PixTemplate):
+        template = PixTemplate(template.pix_data if isinstance(template, Pix) else template)
+
+    como_numpy = utils._is_ndarray(valores)
+    lista_valores = utils._as_list(valores)
+    total = len(lista_valores)
+
+    if txids is None:
+        lista_txids = ["***"] * total
+    else:
+        lista_txids = utils._as_list(txids)
+        if len(lista_txids) != total:
+            raise exceptions.GeracaoPayloadError(
+                'txids',
+                f"A coluna de TXIDs tem {len(lista_txids)} linhas, mas a de valores tem {total}."
+            )
+
+    motivos: List[Optional[str]] = [None] * total
+    if em_centavos:
+        campos_valor = _formatar_centavos(lista_valores, motivos)
+    else:
+        campos_valor = _formatar_valores(lista_valores, motivos)
+
+    prefixo = template._prefixo
+    crc_prefixo = template._crc_prefixo.value
+    crc16_update = utils._crc16_update
+    local = template._local
+    idioma_crc = f"{template._idioma}{const.ID_CRC16}04"
+    padrao_txid = models._PADRAO_TXID
+
+    payloads = []
+    for i in range(total):
+        txid = lista_txids[i]
+        if motivos[i] is None and txid != "***" and not (isinstance(txid, str) and padrao_txid.match(txid)):
+            motivos[i] = "O ID da Transação (transacao_id) deve ser alfanumérico com até 25 caracteres."
+        if motivos[i] is not None:
+            payloads.append("")
+            continue
+
+        sufixo = (
+            f"{campos_valor[i]}{local}"
+            f"{const.ID_ADDITIONAL_DATA_FIELD_TEMPLATE}{len(txid) + 4:02d}"
+            f"{const.ID_TRANSACTION_ID}{len(txid):02d}{txid}{idioma_crc}"
+        )
+        crc = crc16_update(sufixo.encode('utf-8'), crc_prefixo)
+        payloads.append(f"{prefixo}{sufixo}{crc:04X}")
+
+    erros = [motivo is not None for motivo in motivos]
+
+    if como_numpy:
+        numpy = utils._import_numpy()
+        return ResultadoLote(numpy.array(payloads, dtype=str), numpy.array(erros, dtype=bool), motivos)
+
+    return ResultadoLote(payloads, erros, motivos)
@@ -1,9 +1,351 @@
 from . import constants as const
 from . import exceptions
 from . import utils
+from . import models
 from .models import PixData
-from PIL import Image
-import qrcode
+from decimal import Decimal
+from typing import NamedTuple, Optional, Tuple, TYPE_CHECKING, Union
+import io
+import re
+
+# Pillow e qrcode são importados apenas quando uma imagem é gerada, para que a
+# geração de payloads (ex: `pixcore lote --formato payload`) não pague esse custo.
+if TYPE_CHECKING:
+    from PIL import Image
+
+Matriz = Tuple[Tuple[bool, ...], ...]
+
+# Modos de imagem aceitos na geração do QR Code: 1 bit por pixel (preto e
+# branco), paleta de cores e RGB de 24 bits (o padrão).
+MODOS_IMAGEM = ("1", "P", "RGB")
+
+# Formatos aceitos por `Pix.qrcode_bytes()`.
+FORMATOS_BYTES = ("png", "svg", "webp")
+
+# Capacidade, em bytes de dados, de cada versão do QR Code (1 a 40) no nível de
+# correção de erros H (ISO/IEC 18004, tabela 7). O índice 0 não é usado.
+_CAPACIDADE_NIVEL_H = (
+    0, 9, 16, 26, 36, 46, 60, 66, 86, 100, 122, 140, 158, 180, 197, 223, 253, 283,
+    313, 341, 385, 406, 442, 464, 514, 538, 596, 628, 661, 701, 745, 793, 845, 901,
+    961, 986, 1054, 1096, 1142, 1222, 1276,
+)
+
+# Bits do indicador de comprimento por modo (numérico, alfanumérico, byte) para
+# as faixas de versão 1-9, 10-26 e 27-40.
+_BITS_COMPRIMENTO = ((10, 9, 8), (12, 11, 16), (14, 13, 16))
+
+# O qrcode divide os dados em trechos: sequências de 20 ou mais dígitos usam o
+# modo numérico e, no restante, sequências de 20 ou mais caracteres do alfabeto
+# alfanumérico usam esse modo; o resto é codificado em bytes. Payloads de até
+# 20 caracteres usam um único modo para a string inteira.
+_MINIMO_TRECHO = 20
+_ALFANUMERICO = "0-9A-Z $%*+\\-./:"
+_PADRAO_TRECHO_NUMERICO = re.compile(f"[0-9]{{{_MINIMO_TRECHO},}}")
+_PADRAO_TRECHO_ALFANUMERICO = re.compile(f"[{_ALFANUMERICO}]{{{_MINIMO_TRECHO},}}")
+_PADRAO_SO_NUMERICO = re.compile("[0-9]+")
+_PADRAO_SO_ALFANUMERICO = re.compile(f"[{_ALFANUMERICO}]+")
+
+class InfoQRCode(NamedTuple):
+    """
+    Dimensões do QR Code de um payload, no nível de correção de erros H.
+
+    Attributes:
+        versao (int): A versão do QR Code (1 a 40).
+        modulos (int): A quantidade de módulos por lado, sem a borda (`4 * versao + 17`).
+    """
+    versao: int
+    modulos: int
+
+def _bits_trecho(modo: int, tamanho: int) -> int:
+    """Bits ocupados pelos dados de um trecho, sem o cabeçalho (modo e comprimento)."""
+    if modo == 0:
+        return 10 * (tamanho // 3) + (0, 4, 7)[tamanho % 3]
+    if modo == 1:
+        return 11 * (tamanho // 2) + 6 * (tamanho % 2)
+    return 8 * tamanho
+
+def _trechos(dados: bytes):
+    """Divide os dados nos mesmos trechos `(modo, tamanho)` usados pelo qrcode."""
+    texto = dados.decode('latin-1')
+    if len(texto) <= _MINIMO_TRECHO:
+        if _PADRAO_SO_NUMERICO.fullmatch(texto):
+            return [(0, len(texto))]
+        if _PADRAO_SO_ALFANUMERICO.fullmatch(texto):
+            return [(1, len(texto))]
+        return [(2, len(texto))] if texto else []
+
+    trechos = []
+    inicio = 0
+    for numerico in _PADRAO_TRECHO_NUMERICO.finditer(texto):
+        trechos.extend(_trechos_alfanumericos(texto, inicio, numerico.start()))
+        trechos.append((0, numerico.end() - numerico.start()))
+        inicio = numerico.end()
+    trechos.extend(_trechos_alfanumericos(texto, inicio, len(texto)))
+    return trechos
+
+def _trechos_alfanumericos(texto: str, inicio: int, fim: int):
+    trechos = []
+    for alfanumerico in _PADRAO_TRECHO_ALFANUMERICO.finditer(texto, inicio, fim):
+        if alfanumerico.start() > inicio:
+            trechos.append((2, alfanumerico.start() - inicio))
+        trechos.append((1, alfanumerico.end() - alfanumerico.start()))
+        inicio = alfanumerico.end()
+    if fim > inicio:
+        trechos.append((2, fim - inicio))
+    return trechos
+
+def _faixa(versao: int) -> int:
+    return 0 if versao < 10 else 1 if versao < 27 else 2
+
+def info_qrcode(payload: str) -> InfoQRCode:
+    """
+    Calcula a versão mínima e o tamanho do QR Code de um payload, sem gerá-lo.
+
+    O resultado é exatamente a versão que o qrcode escolheria com `fit=True`,
+    mas é obtido somando os bits de cada trecho, sem codificar os dados.
+
+    Args:
+        payload (str): O payload (Copia e Cola) a ser codificado.
+
+    Returns:
+        InfoQRCode: A versão e a quantidade de módulos por lado.
+
+    Raises:
+        exceptions.GeracaoPayloadError: Se o payload não couber em um QR Code.
+
+    Examples:
+        >>> info_qrcode("00020126580014BR.GOV.BCB.PIX0136123e4567-e89b-12d3-a456-426655440000520400005303986540519.905802BR5914EMPRESA MODELO6009SAO PAULO62130509PEDIDO12363043A0E")
+        InfoQRCode(versao=10, modulos=57)
+    """
+    trechos = _trechos(payload.encode('utf-8'))
+    inicio = 1
+    while True:
+        # O tamanho do indicador de comprimento depende da faixa da versão: se a
+        # versão encontrada muda de faixa, a conta é refeita a partir dela.
+        faixa = _faixa(inicio)
+        comprimentos = _BITS_COMPRIMENTO[faixa]
+        bits = sum(4 + comprimentos[modo] + _bits_trecho(modo, tamanho) for modo, tamanho in trechos)
+        versao = inicio
+        while versao <= 40 and _CAPACIDADE_NIVEL_H[versao] * 8 < bits:
+            versao += 1
+        if versao > 40:
+            raise exceptions.GeracaoPayloadError(
+                'payload',
+                f"O payload precisa de {(bits + 7) // 8} bytes e não cabe em um QR Code (máximo: {_CAPACIDADE_NIVEL_H[40]})."
+            )
+        if _faixa(versao) == faixa:
+            return InfoQRCode(versao, 4 * versao + 17)
+        inicio = versao
+
+def _gerar_matriz(payload_str: str) -> Matriz:
+    """
+    Codifica o payload e retorna a matriz de módulos do QR Code (sem a borda).
+
+    A versão é calculada por `info_qrcode()`, evitando a busca do qrcode. A
+    etapa mais cara que resta (avaliação das máscaras) não depende das opções
+    de renderização, por isso a matriz pode ser reaproveitada.
+    """
+    import qrcode
+
+    qr = qrcode.QRCode(
+        version=info_qrcode(payload_str).versao,
+        error_correction=qrcode.constants.ERROR_CORRECT_H,
+    )
+    qr.add_data(payload_str)
+    qr.make(fit=False)
+    return tuple(tuple(linha) for linha in qr.modules)
+
+def _cores_qrcode(cor_qr, cor_fundo) -> Tuple[Optional[Tuple[int, int, int]], Optional[Tuple[int, int, int]]]:
+    """
+    Resolve as cores do QR Code como o `PilImage` do qrcode as desenharia.
+
+    Retorna `(None, None)` para o caso preto e branco, que usa uma imagem de 1 bit.
+    Com fundo "transparent", o fundo fica preto após a conversão para RGB.
+    """
+    from PIL import ImageColor
+
+    qr = cor_qr.lower() if isinstance(cor_qr, str) else cor_qr
+    fundo = cor_fundo.lower() if isinstance(cor_fundo, str) else cor_fundo
+    if qr == "black" and fundo == "white":
+        return None, None
+
+    def rgb(cor, modo):
+        if isinstance(cor, str):
+            return ImageColor.getcolor(cor, modo)[:3]
+        return tuple(cor)[:3]
+
+    if fundo == "transparent":
+        return rgb(qr, "RGBA"), (0, 0, 0)
+    return rgb(qr, "RGB"), rgb(fundo, "RGB")
+
+def _desenhar_matriz(matriz: Matriz, cor_qr="black", cor_fundo="white", box_size: int = 10, border: int = 4, paleta: bool = False) -> "Image.Image":
+    """
+    Converte a matriz de módulos em uma imagem, sem desenhar retângulo por retângulo.
+
+    Cada linha de pixels é montada por multiplicação de bytes e a imagem inteira
+    é criada por um único `Image.frombuffer`. O resultado tem modo "1" (preto e
+    branco, exceto com `paleta=True`) ou "P" (paleta com as duas cores) e os
+    mesmos pixels do `PilImage`.
+    """
+    from PIL import Image
+
+    # 0 = módulo escuro, 1 = fundo: em modo "1", 0 é preto e qualquer outro valor é branco.
+    escuro = b"\x00" * box_size
+    claro = b"\x01" * box_size
+    borda = claro * border
+    tamanho = (len(matriz) + 2 * border) * box_size
+    margem = b"\x01" * (tamanho * border * box_size)
+
+    linhas = [margem]
+    for modulos in matriz:
+        linha = b"".join([borda, *[escuro if modulo else claro for modulo in modulos], borda])
+        linhas.append(linha * box_size)
+    linhas.append(margem)
+    pixels = b"".join(linhas)
+
+    cor_escura, cor_clara = _cores_qrcode(cor_qr, cor_fundo)
+    if cor_escura is None:
+        if not paleta:
+            return Image.frombuffer("1", (tamanho, tamanho), pixels, "raw", "1;8", 0, 1)
+        cor_escura, cor_clara = (0, 0, 0), (255, 255, 255)
+
+    imagem = Image.frombuffer("P", (tamanho, tamanho), pixels, "raw", "P", 0, 1)
+    imagem.putpalette((*cor_escura, *cor_clara))
+    return imagem
+
+def _validar_modo(modo: str, cor_qr, cor_fundo):
+    """Verifica se o modo de imagem pedido é suportado e compatível com as cores."""
+    if modo not in MODOS_IMAGEM:
+        raise ValueError(f"Modo de imagem '{modo}' inválido. Use um destes: {', '.join(MODOS_IMAGEM)}.")
+    if modo == "1" and _cores_qrcode(cor_qr, cor_fundo)[0] is not None:
+        raise ValueError("O modo '1' só representa QR Codes em preto e branco. Use o modo 'P' para cores.")
+
+def _desenhar_qrcode(matriz: Matriz, caminho_logo: str = None, cor_qr: str = "black", cor_fundo: str = "white", box_size: int = 10, border: int = 4, modo: str = "RGB") -> "Image.Image":
+    """
+    Desenha a imagem do QR Code a partir de uma matriz de módulos, aplicando o logo.
+
+    Sem logo, os modos "1" e "P" são gerados diretamente, sem conversão para RGB.
+    Com logo, a composição é feita em RGB e convertida no final: para "P", com uma
+    paleta adaptativa de até 256 cores; para "1", com o pontilhado do Pillow.
+
+    `caminho_logo` pode ser um caminho (preparado uma única vez pelo cache de
+    `pixcore.logo`), uma imagem do Pillow ou um `LogoAsset`.
+    """
+    from PIL import Image
+
+    _validar_modo(modo, cor_qr, cor_fundo)
+    img_qr = _desenhar_matriz(matriz, cor_qr, cor_fundo, box_size, border, paleta=(modo == "P"))
+    if not caminho_logo:
+        return img_qr if modo != "RGB" else img_qr.convert('RGB')
+
+    from .logo import _obter_logo
+    img_qr = _obter_logo(caminho_logo).aplicar(img_qr.convert('RGB'))
+
+    if modo == "1":
+        return img_qr.convert("1")
+    if modo == "P":
+        return img_qr.convert("P", palette=Image.Palette.ADAPTIVE)
+    return img_qr
+
+def _render_qrcode(payload_str: str, caminho_logo: str = None, cor_qr: str = "black", cor_fundo: str = "white", box_size: int = 10, border: int = 4, modo: str = "RGB") -> "Image.Image":
+    """
+    Gera a imagem do QR Code a partir de um payload já montado.
+
+    É a implementação de `Pix.qrcode()`, separada para que o payload possa ser
+    gerado em um processo e a imagem renderizada em outro (ex: `pixcore.lote`).
+    """
+    return _desenhar_qrcode(_gerar_matriz(payload_str), caminho_logo, cor_qr, cor_fundo, box_size, border, modo)
+
+def _codificar_png(imagem: "Image.Image", compress_level: int = 6, optimize: bool = False) -> bytes:
+    """Codifica a imagem em PNG com o nível de compressão zlib informado."""
+    buffer = io.BytesIO()
+    _codificar_imagem(imagem, "png", buffer, compress_level, optimize)
+    return buffer.getvalue()
+
+def _codificar_imagem(imagem: "Image.Image", formato: str, destino, compress_level: int = 6, optimize: bool = False):
+    """
+    Codifica a imagem em PNG ou WebP diretamente no objeto de arquivo `destino`.
+
+    O WebP é sempre sem perdas: a compressão com perdas borra as bordas dos
+    módulos e prejudica a leitura do QR Code.
+    """
+    if formato == "png":
+        imagem.save(destino, format='PNG', compress_level=compress_level, optimize=optimize)
+    else:
+        imagem.save(destino, format='WEBP', lossless=True)
+
+class _EscritaContada:
+    """Repassa as escritas a outro objeto de arquivo, contando os bytes escritos."""
+    __slots__ = ('destino', 'total')
+
+    def __init__(self, destino):
+        self.destino = destino
+        self.total = 0
+
+    def write(self, dados) -> int:
+        self.destino.write(dados)
+        self.total += len(dados)
+        return len(dados)
+
+def _modo_automatico(caminho_logo, cor_qr, cor_fundo) -> str:
+    """O menor modo de imagem que representa o QR Code sem perdas."""
+    if caminho_logo:
+        return "RGB"
+    return "1" if _cores_qrcode(cor_qr, cor_fundo)[0] is None else "P"
+
+def _cor_svg(cor) -> str:
+    if isinstance(cor, str):
+        return cor
+    return "#{:02x}{:02x}{:02x}".format(*tuple(cor)[:3])
+
+_PADRAO_TRECHO_ESCURO = re.compile(b'\x01+')
+
+def _obter_matriz(payload_str: str, cache=None) -> Matriz:
+    """Retorna a matriz de módulos do payload, do `CacheQRCode` informado ou gerada na hora."""
+    if cache:
+        from .cache import _resolver
+        return _resolver(cache).matriz(payload_str)
+    return _gerar_matriz(payload_str)
+
+def _svg_qrcode(matriz: Matriz, cor_qr="black", cor_fundo="white", box_size: int = 10, border: int = 4, caminho_logo=None) -> str:
+    """
+    Gera o QR Code em SVG, percorrendo a matriz uma única vez e sem passar pelo Pillow.
+
+    As coordenadas são em módulos (`viewBox`) e a largura e a altura em pixels,
+    equivalentes às da imagem. Os módulos escuros consecutivos de cada linha
+    viram um único retângulo, e todos os retângulos formam um só `<path>`. Com
+    fundo "transparent", o fundo é omitido. O logo, se houver, é embutido como
+    PNG (base64) com o mesmo tamanho e posição da imagem rasterizada.
+    """
+    from xml.sax.saxutils import quoteattr
+
+    lado = len(matriz) + 2 * border
+    pixels = lado * box_size
+    trechos = []
+    for y, modulos in enumerate(matriz, start=border):
+        for trecho in _PADRAO_TRECHO_ESCURO.finditer(bytes(modulos)):
+            n = trecho.end() - trecho.start()
+            trechos.append(f"M{trecho.start() + border},{y}h{n}v1h-{n}z")
+
+    partes = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n',
+        f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+        f'width="{pixels}" height="{pixels}" viewBox="0 0 {lado} {lado}" shape-rendering="crispEdges">',
+    ]
+    if not (isinstance(cor_fundo, str) and cor_fundo.lower() == "transparent"):
+        partes.append(f'<rect width="{lado}" height="{lado}" fill={quoteattr(_cor_svg(cor_fundo))}/>')
+    partes.append(f'<path fill={quoteattr(_cor_svg(cor_qr))} d="{"".join(trechos)}"/>')
+    if caminho_logo:
+        from .logo import _obter_logo
+
+        largura, altura, uri = _obter_logo(caminho_logo).data_uri(int(pixels * 0.25))
+        x, y = (pixels - largura) // 2, (pixels - altura) // 2
+        partes.append(
+            f'<image x="{x / box_size:g}" y="{y / box_size:g}" width="{largura / box_size:g}" '
+            f'height="{altura / box_size:g}" xlink:href="{uri}"/>'
+        )
+    partes.append('</svg>\n')
+    return "".join(partes)
 
 class Pix:
     """
@@ -19,6 +361,7 @@ class Pix:
     """
     def __init__(self, pix_data: PixData):
         self.pix_data = pix_data
+        self._prefixo = None
 
     def _build_merchant_account_info(self) -> str:
         gui = utils.format_tlv(const.ID_GUI, const.GUI_BR_BCB_PIX)
@@ -46,23 +389,8 @@ class Pix:
 
         return utils.format_tlv(const.ID_MERCHANT_INFO_LANGUAGE_TEMPLATE, "".join(parts))
 
-    def payload(self) -> str:
-        """
-        Gera o payload completo do BR Code no formato TLV (Copia e Cola).
-
-        O payload é a string que será codificada no QR Code, contendo todas as
-        informações da transação formatadas segundo o padrão EMV® QRCPS.
-
-        Returns:
-            str: O payload completo e formatado, incluindo o CRC16.
-
-        Examples:
-            >>> pix_data = PixData(...)
-            >>> pix_generator = Pix(pix_data)
-            >>> br_code = pix_generator.payload()
-            >>> print(br_code)
-            '00020126580014br.gov.bcb.pix0136123e4567-e89b-12d3-a456-426655440000520400005303986540510.005802BR5913NOME DO LOJA6008SAO PAULO62290525txid-gerado-pelo-sistema63041A29'
-        """
+    def _build_prefix(self) -> str:
+        """Monta os campos iniciais do payload, fixos para um mesmo recebedor (IDs 00 a 53)."""
         payload_parts = [
             utils.format_tlv(const.ID_PAYLOAD_FORMAT_INDICATOR, const.PAYLOAD_FORMAT_INDICATOR_VALUE),
         ]
@@ -76,44 +404,142 @@ class Pix:
             utils.format_tlv(const.ID_TRANSACTION_CURRENCY, const.TRANSACTION_CURRENCY_BRL),
         ])
 
-        if self.pix_data.valor:
-            amount_str = f"{self.pix_data.valor:.2f}"
-            payload_parts.append(utils.format_tlv(const.ID_TRANSACTION_AMOUNT, amount_str))
+        return "".join(payload_parts)
 
-        payload_parts.extend([
+    def _build_amount(self) -> str:
+        valor_str = models._formatar_valor(self.pix_data.valor, self.pix_data.valor_centavos)
+        if valor_str is None:
+            return ""
+        return utils.format_tlv(const.ID_TRANSACTION_AMOUNT, valor_str)
+
+    def _build_merchant_location(self) -> str:
+        parts = [
             utils.format_tlv(const.ID_COUNTRY_CODE, const.COUNTRY_CODE_BR),
             utils.format_tlv(const.ID_MERCHANT_NAME, self.pix_data.recebedor_nome),
             utils.format_tlv(const.ID_MERCHANT_CITY, self.pix_data.recebedor_cidade),
-        ])
+        ]
 
         if self.pix_data.recebedor_cep:
-            payload_parts.append(utils.format_tlv(const.ID_POSTAL_CODE, self.pix_data.recebedor_cep))
+            parts.append(utils.format_tlv(const.ID_POSTAL_CODE, self.pix_data.recebedor_cep))
 
-        payload_parts.extend([
+        return "".join(parts)
+
+    def _build_suffix(self) -> str:
+        """Monta os campos do payload a partir do valor (ID 54), sem o campo do CRC16."""
+        return "".join([
+            self._build_amount(),
+            self._build_merchant_location(),
             self._build_additional_data(),
-            self._build_language_template()
+            self._build_language_template(),
         ])
-        
-        payload = "".join(filter(None, payload_parts))
-        
-        crc = utils.calculate_crc16(payload + const.ID_CRC16 + "04")
-        payload += utils.format_tlv(const.ID_CRC16, crc)
-        
-        return payload
+
+    def _prefixo_e_crc(self) -> Tuple[str, utils.CRC16]:
+        """
+        Retorna o prefixo fixo e uma cópia do estado do CRC16 após ele.
+
+        Ambos são guardados na instância, indexados pelos campos de que o prefixo
+        depende (método de iniciação, chave e MCC). Chamadas repetidas de
+        `payload()` apenas comparam esses campos e montam e processam o sufixo
+        variável; alterar um deles (ou trocar o `pix_data`) refaz o prefixo.
+        """
+        dados = self.pix_data
+        chave = (dados.ponto_iniciacao_metodo, dados.pix_key, dados.receptor_categoria_code)
+        if self._prefixo is None or self._prefixo[0] != chave:
+            prefixo = self._build_prefix()
+            self._prefixo = (chave, prefixo, utils.CRC16(prefixo))
+        return self._prefixo[1], self._prefixo[2].copy()
+
+    def payload(self) -> str:
+        """
+        Gera o payload completo do BR Code no formato TLV (Copia e Cola).
+
+        O payload é a string que será codificada no QR Code, contendo todas as
+        informações da transação formatadas segundo o padrão EMV® QRCPS.
+
+        Returns:
+            str: O payload completo e formatado, incluindo o CRC16.
+
+        Examples:
+            >>> pix_data = PixData(
+            ...     recebedor_nome="EMPRESA MODELO",
+            ...     recebedor_cidade="SAO PAULO",
+            ...     pix_key="123e4567-e89b-12d3-a456-426655440000",
+            ...     valor=19.90,
+            ...     transacao_id="PEDIDO123",
+            ... )
+            >>> pix_generator = Pix(pix_data)
+            >>> br_code = pix_generator.payload()
+            >>> print(br_code)
+            00020126580014BR.GOV.BCB.PIX0136123e4567-e89b-12d3-a456-426655440000520400005303986540519.905802BR5914EMPRESA MODELO6009SAO PAULO62130509PEDIDO12363043A0E
+        """
+        prefixo, crc = self._prefixo_e_crc()
+        sufixo = self._build_suffix() + const.ID_CRC16 + "04"
+        crc.update(sufixo)
+
+        return f"{prefixo}{sufixo}{crc.digest()}"
     
-    def qrcode(self, caminho_logo: str = None, cor_qr: str = "black", cor_fundo: str = "white", box_size: int = 10, border: int = 4) -> Image.Image:
+    def compile(self) -> "PixTemplate":
+        """
+        Pré-compila as partes fixas do payload deste recebedor em um `PixTemplate`.
+
+        Returns:
+            PixTemplate: Um modelo capaz de gerar payloads informando apenas o
+                         valor e o ID da transação.
+        """
+        return PixTemplate(self.pix_data)
+
+    def payload_many(self, valores, txids=None, em_centavos: bool = False):
+        """
+        Gera os payloads de um lote de cobranças com os dados fixos deste recebedor.
+
+        Atalho para `pixcore.batch.generate_payloads(self.compile(), valores, txids, em_centavos)`.
+        Erros de uma linha não interrompem o lote; eles são reportados na máscara
+        de erros do resultado.
+
+        Args:
+            valores (Sequence): Coluna com o valor de cada cobrança (lista, `array.array`
+                                ou `numpy.ndarray`).
+            txids (Optional[Sequence[str]], optional): Coluna com o TXID de cada cobrança.
+                                                       Defaults to None ("***").
+            em_centavos (bool, optional): Se `True`, os valores são centavos inteiros.
+                                          Defaults to False.
+
+        Returns:
+            batch.ResultadoLote: Os payloads gerados, a máscara de erros e os motivos.
+        """
+        from . import batch
+        return batch.generate_payloads(self.compile(), valores, txids, em_centavos)
+
+    def info_qrcode(self) -> InfoQRCode:
+        """
+        Retorna a versão e a quantidade de módulos do QR Code deste Pix, sem gerá-lo.
+
+        Returns:
+            InfoQRCode: A versão (1 a 40) e a quantidade de módulos por lado, sem a borda.
+        """
+        return info_qrcode(self.payload())
+
+    def qrcode(self, caminho_logo: str = None, cor_qr: str = "black", cor_fundo: str = "white", box_size: int = 10, border: int = 4, cache=None, modo: str = "RGB") -> "Image.Image":
         """
         Gera um objeto de imagem (Pillow) do QR Code a partir do payload.
 
         Args:
-            caminho_logo (str, optional): O caminho para um arquivo de imagem (ex: .png)
-                                          a ser centralizado no QR Code. Defaults to None.
+            caminho_logo (str | Image.Image | LogoAsset, optional): O caminho para um arquivo
+                                          de imagem (ex: .png) a ser centralizado no QR Code,
+                                          uma imagem do Pillow já carregada ou um
+                                          `pixcore.logo.LogoAsset`. Arquivos são decodificados
+                                          uma única vez e reaproveitados. Defaults to None.
             cor_qr (str, optional): A cor dos módulos do QR Code. Pode ser um nome de cor
                                     (ex: "navy") ou um código hexadecimal (ex: "#000080").
                                     Defaults to "black".
             cor_fundo (str, optional): A cor de fundo do QR Code. Defaults to "white".
             box_size (int, optional): O tamanho em pixels de cada "box" do QR Code. Defaults to 10.
             border (int, optional): A largura da borda em "boxes". Defaults to 4.
+            cache (CacheQRCode | bool, optional): Um `pixcore.cache.CacheQRCode` de onde a
+                                    matriz de módulos é reaproveitada, ou `True` para usar
+                                    o cache compartilhado. Defaults to None (sem cache).
+            modo (str, optional): O modo da imagem: "1" (1 bit por pixel, apenas preto e
+                                  branco), "P" (paleta de cores) ou "RGB". Defaults to "RGB".
 
         Returns:
             Image.Image: Um objeto de imagem da biblioteca Pillow contendo o QR Code.
@@ -121,79 +547,205 @@ class Pix:
         Raises:
             exceptions.ProcessamentoImagemError: Se ocorrer um erro ao processar o
                                                  arquivo de logo (ex: não encontrado, corrompido).
+            ValueError: Se o modo for inválido, ou "1" com cores diferentes de preto e branco.
         """
-        payload_str = self.payload()
-        
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_H,
+        if cache:
+            from .cache import _resolver
+            return _resolver(cache).imagem(self.payload(), caminho_logo, cor_qr, cor_fundo, box_size, border, modo)
+
+        return _render_qrcode(
+            self.payload(),
+            caminho_logo=caminho_logo,
+            cor_qr=cor_qr,
+            cor_fundo=cor_fundo,
             box_size=box_size,
             border=border,
+            modo=modo
         )
-        qr.add_data(payload_str)
-        qr.make(fit=True)
-
-        img_qr = qr.make_image(fill_color=cor_qr, back_color=cor_fundo).convert('RGB')
-
-        if caminho_logo:
-            try:
-                logo = Image.open(caminho_logo)
-                tamanho_max_logo = int(img_qr.size[0] * 0.25)
-                logo.thumbnail((tamanho_max_logo, tamanho_max_logo))
-                
-                pos_x = (img_qr.size[0] - logo.size[0]) // 2
-                pos_y = (img_qr.size[1] - logo.size[1]) // 2
-                
-                img_qr.paste(logo, (pos_x, pos_y), mask=logo)
-            except FileNotFoundError:
-                raise exceptions.ProcessamentoImagemError(
-                    caminho_imagem=caminho_logo,
-                    motivo="Arquivo não encontrado."
-                ) from None
-            
-            except Exception as e:
-                # Erro genérico de processamento.
-                raise exceptions.ProcessamentoImagemError(
-                    caminho_imagem=caminho_logo,
-                    motivo=f"Erro desconhecido ao processar o logo: {e}"
-                ) from e
-        
-        return img_qr
     
-    def save_qrcode(self, caminho_arquivo_saida: str, caminho_logo: str = None, cor_qr: str = "black", cor_fundo: str = "white", box_size: int = 10, border: int = 4):
+    def qrcode_svg(self, caminho_logo=None, cor_qr: str = "black", cor_fundo: str = "white", box_size: int = 10, border: int = 4, cache=None) -> str:
+        """
+        Gera o QR Code como uma imagem vetorial (SVG), independente de resolução.
+
+        O SVG é montado diretamente a partir da matriz de módulos, sem o Pillow,
+        e custa uma fração da renderização em PNG. Ideal para impressão e para a
+        web, onde a imagem pode ser ampliada sem perder a nitidez.
+
+        Args:
+            caminho_logo, cor_qr, cor_fundo, box_size, border: As mesmas opções de `qrcode()`.
+                O logo é embutido no SVG como PNG (base64); `box_size` define
+                apenas a largura e a altura em pixels.
+            cache (CacheQRCode | bool, optional): Reaproveita a matriz de módulos
+                                    (veja `qrcode()`). Defaults to None.
+
+        Returns:
+            str: O documento SVG.
+
+        Raises:
+            exceptions.ProcessamentoImagemError: Se ocorrer um erro ao processar o logo.
+
+        Examples:
+            >>> dados = PixData(
+            ...     recebedor_nome="EMPRESA MODELO",
+            ...     recebedor_cidade="SAO PAULO",
+            ...     pix_key="123e4567-e89b-12d3-a456-426655440000",
+            ... )
+            >>> svg = Pix(dados).qrcode_svg(cor_qr="#000080")
+            >>> svg.count("<path")
+            1
+        """
+        return _svg_qrcode(_obter_matriz(self.payload(), cache), cor_qr, cor_fundo, box_size, border, caminho_logo)
+
+    def qrcode_bytes(self, formato: str = "png", buffer=None, caminho_logo=None, cor_qr: str = "black", cor_fundo: str = "white", box_size: int = 10, border: int = 4, modo: Optional[str] = None, compress_level: int = 6, optimize: bool = False, cache=None) -> Union[bytes, int]:
+        """
+        Gera o QR Code já codificado em PNG, SVG ou WebP, sem passar pelo disco.
+
+        Ideal para respostas HTTP: os bytes podem ser enviados diretamente ao
+        cliente, ou escritos em um buffer (ex: `io.BytesIO`, um socket ou a
+        resposta de um framework web) informado pelo chamador.
+
+        Args:
+            formato (str, optional): "png", "svg" ou "webp" (sempre sem perdas). Defaults to "png".
+            buffer (optional): Um objeto com o método `write()`. Se informado, o QR Code é
+                               escrito nele em vez de ser retornado. Defaults to None.
+            caminho_logo, cor_qr, cor_fundo, box_size, border: As mesmas opções de `qrcode()`.
+            modo (str, optional): O modo da imagem (veja `qrcode()`). Se `None`, usa o menor
+                                  modo sem perdas: "1" para preto e branco, "P" para cores
+                                  e "RGB" com logo, evitando a conversão para RGB.
+                                  Ignorado no SVG. Defaults to None.
+            compress_level (int, optional): O nível de compressão do PNG (0 a 9). Defaults to 6.
+            optimize (bool, optional): Procura a menor codificação do PNG. Defaults to False.
+            cache (CacheQRCode | bool, optional): Reaproveita a matriz e, no PNG, os bytes já
+                                    codificados (veja `qrcode()`). Defaults to None.
+
+        Returns:
+            bytes | int: O conteúdo do arquivo ou, com `buffer`, a quantidade de bytes escritos.
+
+        Raises:
+            exceptions.ProcessamentoImagemError: Se ocorrer um erro ao processar o logo.
+            ValueError: Se o formato ou o modo forem inválidos.
+
+        Examples:
+            >>> dados = PixData(
+            ...     recebedor_nome="EMPRESA MODELO",
+            ...     recebedor_cidade="SAO PAULO",
+            ...     pix_key="123e4567-e89b-12d3-a456-426655440000",
+            ... )
+            >>> Pix(dados).qrcode_bytes()[:8]
+            b'\\x89PNG\\r\\n\\x1a\\n'
+            >>> Pix(dados).qrcode_bytes("svg")[:5]
+            b'<?xml'
+        """
+        if formato not in FORMATOS_BYTES:
+            raise ValueError(f"Formato '{formato}' inválido. Use um destes: {', '.join(FORMATOS_BYTES)}.")
+
+        payload = self.payload()
+        if formato == "svg":
+            conteudo = _svg_qrcode(_obter_matriz(payload, cache), cor_qr, cor_fundo, box_size, border, caminho_logo).encode('utf-8')
+        else:
+            if modo is None:
+                modo = _modo_automatico(caminho_logo, cor_qr, cor_fundo)
+            _validar_modo(modo, cor_qr, cor_fundo)
+
+            if cache and formato == "png":
+                from .cache import _resolver
+                conteudo = _resolver(cache).png(payload, caminho_logo, cor_qr, cor_fundo, box_size, border, modo, compress_level, optimize)
+            else:
+                imagem = _desenhar_qrcode(_obter_matriz(payload, cache), caminho_logo, cor_qr, cor_fundo, box_size, border, modo)
+                if buffer is not None:
+                    # Codifica direto no buffer do chamador, sem uma cópia intermediária.
+                    escrita = _EscritaContada(buffer)
+                    _codificar_imagem(imagem, formato, escrita, compress_level, optimize)
+                    return escrita.total
+                destino = io.BytesIO()
+                _codificar_imagem(imagem, formato, destino, compress_level, optimize)
+                conteudo = destino.getvalue()
+
+        if buffer is None:
+            return conteudo
+        buffer.write(conteudo)
+        return len(conteudo)
+
+    def save_qrcode(self, caminho_arquivo_saida: str, caminho_logo: str = None, cor_qr: str = "black", cor_fundo: str = "white", box_size: int = 10, border: int = 4, cache=None, modo: str = "RGB", compress_level: int = 6, optimize: bool = False):
         """
         Gera e salva a imagem do QR Code diretamente em um arquivo.
 
         Args:
             caminho_arquivo_saida (str): O caminho e nome do arquivo onde a imagem
                                          do QR Code será salva (ex: 'output/pix.png').
-            caminho_logo (str, optional): O caminho para um arquivo de imagem a ser
-                                          centralizado no QR Code. Defaults to None.
+                                         Arquivos `.svg` são gerados como imagem vetorial
+                                         (veja `qrcode_svg()`); nesse caso, `modo`,
+                                         `compress_level` e `optimize` são ignorados.
+            caminho_logo (str | Image.Image | LogoAsset, optional): O logo a ser centralizado
+                                          no QR Code (veja `qrcode()`). Defaults to None.
             cor_qr (str, optional): A cor dos módulos do QR Code. Defaults to "black".
             cor_fundo (str, optional): A cor de fundo do QR Code. Defaults to "white".
             box_size (int, optional): O tamanho em pixels de cada "box" do QR Code. Defaults to 10.
             border (int, optional): A largura da borda em "boxes". Defaults to 4.
+            cache (CacheQRCode | bool, optional): Um `pixcore.cache.CacheQRCode`, ou `True`
+                                    para usar o cache compartilhado. Em arquivos `.png`, os
+                                    bytes em cache são gravados diretamente. Defaults to None.
+            modo (str, optional): O modo da imagem: "1" (1 bit por pixel, apenas preto e
+                                  branco), "P" (paleta de cores) ou "RGB". Os modos "1" e "P"
+                                  geram arquivos PNG muito menores. Defaults to "RGB".
+            compress_level (int, optional): O nível de compressão zlib do PNG, de 0 (sem
+                                            compressão, mais rápido) a 9. Defaults to 6.
+            optimize (bool, optional): Se `True`, o Pillow procura a menor codificação
+                                       possível do PNG (mais lento). Defaults to False.
         
         Raises:
             exceptions.ErroDeESError: Se ocorrer um erro ao salvar o arquivo
                                       (ex: permissão negada, caminho inválido).
             exceptions.ProcessamentoImagemError: Se ocorrer um erro ao processar o
                                                  arquivo de logo.
+            ValueError: Se o modo for inválido, ou "1" com cores diferentes de preto e branco
+                        (não se aplica a arquivos `.svg`).
 
         Examples:
-            >>> pix_data = PixData(...)
+            >>> import os, tempfile
+            >>> from PIL import Image
+            >>> pix_data = PixData(
+            ...     recebedor_nome="EMPRESA MODELO",
+            ...     recebedor_cidade="SAO PAULO",
+            ...     pix_key="123e4567-e89b-12d3-a456-426655440000",
+            ... )
             >>> pix_generator = Pix(pix_data)
-            >>> pix_generator.save_qrcode("meu_pix_qr.png", caminho_logo="logo.png")
+            >>> logo = Image.new("RGBA", (100, 100), "red")
+            >>> with tempfile.TemporaryDirectory() as pasta:
+            ...     pix_generator.save_qrcode(os.path.join(pasta, "meu_pix_qr.png"), caminho_logo=logo)
+            ...     pix_generator.save_qrcode(os.path.join(pasta, "meu_pix_1bit.png"), modo="1", compress_level=9)
+            ...     sorted(os.listdir(pasta))
+            True
+            True
+            ['meu_pix_1bit.png', 'meu_pix_qr.png']
         """
+        vetorial = str(caminho_arquivo_saida).lower().endswith(".svg")
+        if not vetorial:
+            _validar_modo(modo, cor_qr, cor_fundo)
         try:
+            if vetorial:
+                svg = self.qrcode_svg(caminho_logo, cor_qr, cor_fundo, box_size, border, cache=cache)
+                with open(caminho_arquivo_saida, 'w', encoding='utf-8') as arquivo:
+                    arquivo.write(svg)
+                return True
+
+            if cache and str(caminho_arquivo_saida).lower().endswith(".png"):
+                from .cache import _resolver
+                conteudo = _resolver(cache).png(self.payload(), caminho_logo, cor_qr, cor_fundo, box_size, border, modo, compress_level, optimize)
+                with open(caminho_arquivo_saida, 'wb') as arquivo:
+                    arquivo.write(conteudo)
+                return True
+
             imagem_qr = self.qrcode(
                 caminho_logo=caminho_logo, 
                 cor_qr=cor_qr, 
                 cor_fundo=cor_fundo,
                 box_size=box_size,
-                border=border
+                border=border,
+                cache=cache,
+                modo=modo
             )
-            imagem_qr.save(caminho_arquivo_saida)
+            imagem_qr.save(caminho_arquivo_saida, compress_level=compress_level, optimize=optimize)
             return True
         except (IOError, PermissionError) as e:
             raise exceptions.ErroDeESError(
@@ -204,4 +756,86 @@ class Pix:
             raise exceptions.ErroDeESError(
                 caminho_arquivo=caminho_arquivo_saida,
                 motivo=f"Ocorreu um erro inesperado ao salvar o QR Code: {e}"
-            ) from e
\ No newline at end of file
+            ) from e
+
+
+class PixTemplate:
+    """
+    Modelo pré-compilado do payload Pix para um recebedor fixo.
+
+    Para um mesmo recebedor, os campos de conta (chave Pix), MCC, moeda, país,
+    nome, cidade, CEP e dados em outro idioma nunca mudam. Esta classe valida
+    e serializa essas partes uma única vez e guarda o estado do CRC16 após o
+    prefixo, de modo que cada payload gerado por `render()` custa apenas a
+    concatenação das partes e o CRC16 do sufixo variável.
+
+    O valor e o ID da transação eventualmente presentes em `pix_data` são
+    ignorados; eles devem ser informados a cada chamada de `render()`.
+
+    Parameters:
+        pix_data (PixData): Dados do recebedor. A validação completa é feita
+                            uma única vez, na criação do `PixData`.
+
+    Examples:
+        >>> dados = PixData(
+        ...     recebedor_nome="EMPRESA MODELO",
+        ...     recebedor_cidade="SAO PAULO",
+        ...     pix_key="123e4567-e89b-12d3-a456-426655440000",
+        ... )
+        >>> modelo = PixTemplate(dados)
+        >>> modelo.render(valor=19.90, transacao_id="PEDIDO123")
+        '00020126580014BR.GOV.BCB.PIX0136123e4567-e89b-12d3-a456-426655440000520400005303986540519.905802BR5914EMPRESA MODELO6009SAO PAULO62130509PEDIDO12363043A0E'
+    """
+    __slots__ = ('pix_data', '_prefixo', '_crc_prefixo', '_local', '_idioma')
+
+    def __init__(self, pix_data: PixData):
+        self.pix_data = pix_data
+
+        pix = Pix(pix_data)
+        self._prefixo = pix._build_prefix()
+        self._crc_prefixo = utils.CRC16(self._prefixo)
+        self._local = pix._build_merchant_location()
+        self._idioma = pix._build_language_template()
+
+    def render(
+        self,
+        valor: Optional[Union[float, Decimal]] = None,
+        transacao_id: str = "***",
+        valor_centavos: Optional[int] = None,
+    ) -> str:
+        """
+        Gera o payload completo (Copia e Cola) para o valor e o TXID informados.
+
+        Apenas o valor e o ID da transação são validados; os dados do
+        recebedor já foram validados na criação do modelo.
+
+        Args:
+            valor (Optional[float | Decimal], optional): O valor da transação, em reais. Se for `None`,
+                                               o payload é gerado com valor aberto. Defaults to None.
+            transacao_id (str, optional): O ID da transação (TXID). Defaults to "***".
+            valor_centavos (Optional[int], optional): O valor em centavos inteiros, alternativa
+                                                      exata a `valor`. Defaults to None.
+
+        Returns:
+            str: O payload completo e formatado, incluindo o CRC16.
+
+        Raises:
+            exceptions.GeracaoPayloadError: Se o valor não for positivo ou se o
+                                            TXID não for alfanumérico com até 25 caracteres.
+        """
+        models._validar_valor(valor)
+        models._validar_centavos(valor, valor_centavos)
+        models._validar_transacao_id(transacao_id)
+
+        valor_str = models._formatar_valor(valor, valor_centavos)
+        valor_tlv = utils.format_tlv(const.ID_TRANSACTION_AMOUNT, valor_str) if valor_str is not None else ""
+        txid_tlv = utils.format_tlv(
+            const.ID_ADDITIONAL_DATA_FIELD_TEMPLATE,
+            utils.format_tlv(const.ID_TRANSACTION_ID, transacao_id)
+        )
+        sufixo = f"{valor_tlv}{self._local}{txid_tlv}{self._idioma}{const.ID_CRC16}04"
+
+        crc = self._crc_prefixo.copy()
+        crc.update(sufixo)
+
+        return f"{self._prefixo}{sufixo}{crc.digest()}"
@@ -0,0 +1,218 @@
+"""
+Módulo de Cache de QR Codes.
+
+Gerar um QR Code tem duas etapas caras: a codificação do payload na matriz de
+módulos (escolha da versão e avaliação das oito máscaras) e a renderização e
+compressão da imagem PNG. Para cobranças estáticas servidas repetidamente
+(ex: o QR Code fixo de doações de uma loja), as duas etapas produzem sempre o
+mesmo resultado.
+
+`CacheQRCode` memoriza cada etapa em um `LRUCache` próprio:
+
+- a **matriz**, indexada apenas pelo payload, é reaproveitada por qualquer
+  combinação de cores, tamanhos e logos;
+- o **PNG**, indexado pelo payload e pelas opções de renderização, é devolvido
+  já codificado, sem passar pelo Pillow.
+
+Opcionalmente, os PNGs também são gravados em um diretório, sobrevivendo ao
+reinício do processo e podendo ser compartilhados entre processos.
+
+O cache é opcional: `Pix.qrcode()` e `Pix.save_qrcode()` só o utilizam quando
+recebem o argumento `cache`.
+"""
+from . import brcode
+from .logo import _identificar_logo
+from .utils import EstatisticasCache, LRUCache
+from typing import NamedTuple, Optional, Tuple, TYPE_CHECKING
+import hashlib
+import os
+import re
+import tempfile
+import threading
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Os PNGs gravados no diretório são nomeados pelo SHA-256 (hexadecimal) da chave.
+_NOME_ARQUIVO_CACHE = re.compile(r"[0-9a-f]{64}\.png")
+
+class EstatisticasCacheQRCode(NamedTuple):
+    """
+    Contadores de uso de um `CacheQRCode`.
+
+    Attributes:
+        matrizes (EstatisticasCache): Uso do cache de matrizes de módulos.
+        pngs (EstatisticasCache): Uso do cache em memória de PNGs codificados.
+        disco_hits (int): PNGs lidos do diretório de cache.
+        disco_misses (int): PNGs que não estavam no diretório e foram gravados.
+    """
+    matrizes: EstatisticasCache
+    pngs: EstatisticasCache
+    disco_hits: int
+    disco_misses: int
+
+class CacheQRCode:
+    """
+    Cache em memória (LRU), com diretório opcional em disco, de QR Codes Pix.
+
+    Args:
+        max_matrizes (int, optional): Quantidade máxima de matrizes em memória. Defaults to 256.
+        max_pngs (int, optional): Quantidade máxima de PNGs em memória. Defaults to 256.
+        diretorio (str, optional): Diretório onde os PNGs também são gravados. Se `None`,
+                                   o cache fica apenas em memória. Defaults to None.
+
+    Examples:
+        >>> cache = CacheQRCode(max_pngs=16)
+        >>> payload = "00020126580014BR.GOV.BCB.PIX0136123e4567-e89b-12d3-a456-426655440000520400005303986540519.905802BR5914EMPRESA MODELO6009SAO PAULO62130509PEDIDO12363043A0E"
+        >>> cache.png(payload) is cache.png(payload)
+        True
+        >>> cache.estatisticas().pngs
+        EstatisticasCache(hits=1, misses=1, evictions=0, tamanho=1, tamanho_maximo=16)
+    """
+
+    def __init__(self, max_matrizes: int = 256, max_pngs: int = 256, diretorio: Optional[str] = None):
+        self._matrizes = LRUCache(max_matrizes)
+        self._pngs = LRUCache(max_pngs)
+        self.diretorio = diretorio
+        self._lock = threading.Lock()
+        self._disco_hits = 0
+        self._disco_misses = 0
+
+        if diretorio is not None:
+            os.makedirs(diretorio, exist_ok=True)
+
+    def matriz(self, payload: str) -> "brcode.Matriz":
+        """
+        Retorna a matriz de módulos do QR Code do payload, sem a borda.
+
+        Args:
+            payload (str): O payload (Copia e Cola) a ser codificado.
+
+        Returns:
+            Tuple[Tuple[bool, ...], ...]: As linhas da matriz; `True` indica um módulo escuro.
+        """
+        return self._matrizes.obter_ou_calcular(payload, brcode._gerar_matriz)
+
+    def imagem(self, payload: str, caminho_logo: str = None, cor_qr: str = "black", cor_fundo: str = "white", box_size: int = 10, border: int = 4, modo: str = "RGB") -> "Image.Image":
+        """
+        Renderiza a imagem do QR Code reaproveitando a matriz em cache.
+
+        A imagem não é guardada (objetos do Pillow são mutáveis); use `png()`
+        para obter o arquivo já codificado a partir do cache.
+
+        Args:
+            payload (str): O payload (Copia e Cola) a ser codificado.
+            caminho_logo, cor_qr, cor_fundo, box_size, border, modo: As mesmas opções de `Pix.qrcode()`.
+
+        Returns:
+            Image.Image: Um objeto de imagem da biblioteca Pillow contendo o QR Code.
+
+        Raises:
+            exceptions.ProcessamentoImagemError: Se ocorrer um erro ao processar o logo.
+        """
+        return brcode._desenhar_qrcode(self.matriz(payload), caminho_logo, cor_qr, cor_fundo, box_size, border, modo)
+
+    def png(self, payload: str, caminho_logo: str = None, cor_qr: str = "black", cor_fundo: str = "white", box_size: int = 10, border: int = 4, modo: str = "RGB", compress_level: int = 6, optimize: bool = False) -> bytes:
+        """
+        Retorna o QR Code codificado em PNG, consultando a memória e depois o disco.
+
+        A chave inclui o payload e todas as opções de renderização. Para um logo
+        informado por caminho, também entram a data de modificação e o tamanho do
+        arquivo, de modo que substituir o logo invalida as entradas antigas; para
+        uma imagem ou `LogoAsset`, um resumo (SHA-256) dos seus pixels.
+
+        Args:
+            payload (str): O payload (Copia e Cola) a ser codificado.
+            caminho_logo, cor_qr, cor_fundo, box_size, border, modo: As mesmas opções de `Pix.qrcode()`.
+            compress_level, optimize: As opções de compressão de `Pix.save_qrcode()`.
+
+        Returns:
+            bytes: O conteúdo do arquivo PNG.
+
+        Raises:
+            exceptions.ProcessamentoImagemError: Se ocorrer um erro ao processar o logo.
+        """
+        chave = (payload, _identificar_logo(caminho_logo), cor_qr, cor_fundo, box_size, border, modo, compress_level, optimize)
+
+        def codificar() -> bytes:
+            imagem = self.imagem(payload, caminho_logo, cor_qr, cor_fundo, box_size, border, modo)
+            return brcode._codificar_png(imagem, compress_level, optimize)
+
+        return self._pngs.obter_ou_calcular(chave, lambda _chave: self._png_do_disco(chave, codificar))
+
+    def _png_do_disco(self, chave: Tuple, gerar) -> bytes:
+        """Lê o PNG do diretório de cache ou o gera com `gerar()` e grava atomicamente."""
+        if self.diretorio is None:
+            return gerar()
+
+        nome = hashlib.sha256(repr(chave).encode('utf-8')).hexdigest() + ".png"
+        caminho = os.path.join(self.diretorio, nome)
+        try:
+            with open(caminho, 'rb') as arquivo:
+                conteudo = arquivo.read()
+        except FileNotFoundError:
+            pass
+        else:
+            with self._lock:
+                self._disco_hits += 1
+            return conteudo
+
+        conteudo = gerar()
+        with self._lock:
+            self._disco_misses += 1
+
+        descritor, temporario = tempfile.mkstemp(dir=self.diretorio, suffix=".tmp")
+        try:
+            with os.fdopen(descritor, 'wb') as arquivo:
+                arquivo.write(conteudo)
+            os.replace(temporario, caminho)
+        except OSError:
+            # Uma falha ao gravar o cache não deve impedir a entrega do QR Code.
+            try:
+                os.remove(temporario)
+            except OSError:
+                pass
+        return conteudo
+
+    def limpar(self, disco: bool = False):
+        """
+        Esvazia os caches em memória e zera os contadores.
+
+        Args:
+            disco (bool, optional): Se `True`, também remove do diretório os PNGs gravados
+                                    pelo cache (outros arquivos são preservados). Defaults to False.
+        """
+        self._matrizes.limpar()
+        self._pngs.limpar()
+        with self._lock:
+            self._disco_hits = self._disco_misses = 0
+
+        if disco and self.diretorio is not None:
+            for nome in os.listdir(self.diretorio):
+                if _NOME_ARQUIVO_CACHE.fullmatch(nome):
+                    os.remove(os.path.join(self.diretorio, nome))
+
+    def estatisticas(self) -> EstatisticasCacheQRCode:
+        """Retorna os contadores de uso (hits, misses e evictions) de cada nível do cache."""
+        with self._lock:
+            disco = (self._disco_hits, self._disco_misses)
+        return EstatisticasCacheQRCode(self._matrizes.estatisticas(), self._pngs.estatisticas(), *disco)
+
+_CACHE_PADRAO: Optional[CacheQRCode] = None
+
+def cache_padrao() -> CacheQRCode:
+    """
+    Retorna o cache compartilhado usado quando `Pix.qrcode()` recebe `cache=True`.
+
+    É criado na primeira chamada, apenas em memória e com os tamanhos padrão.
+    """
+    global _CACHE_PADRAO
+    if _CACHE_PADRAO is None:
+        _CACHE_PADRAO = CacheQRCode()
+    return _CACHE_PADRAO
+
+def _resolver(cache) -> Optional[CacheQRCode]:
+    """Converte o argumento `cache` de `Pix.qrcode()` (None/False, True ou um `CacheQRCode`)."""
+    if cache is True:
+        return cache_padrao()
+    return cache or None
@@ -1,31 +1,43 @@
 import typer
 import os
-import csv
+import sys
+import time
 from typing import Optional
 from . import brcode, models
 from . import exceptions
 from . import decipher
 from . import config_manager
+from . import utils
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-import pyfiglet
-from importlib.metadata import version, PackageNotFoundError
+from rich.markup import escape
+
+# pyfiglet, as tabelas e painéis do rich, o motor do `lote` e os metadados do
+# pacote são importados dentro das funções que os usam: a maioria das execuções
+# (ex: `pixcore payload`, `pixcore decode`) nunca precisa deles.
 
 console = Console()
 app = typer.Typer(
     add_completion=False
 )
 
-try:
-    __version__ = version("pixcore")
-except PackageNotFoundError:
-    __version__ = "dev"
+def _versao() -> str:
+    """Lê a versão instalada do pacote."""
+    from importlib.metadata import version, PackageNotFoundError
+    try:
+        return version("pixcore")
+    except PackageNotFoundError:
+        return "dev"
+
+def __getattr__(nome: str):
+    """Resolve `__version__` sob demanda, sem carregar `importlib.metadata` na importação."""
+    if nome == "__version__":
+        return _versao()
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
 
 def version_callback(value: bool):
     """Exibe a versão do programa e encerra."""
     if value:
-        console.print(f"PixCore CLI Versão: [cyan][b]{__version__}")
+        console.print(f"PixCore CLI Versão: [cyan][b]{_versao()}")
         raise typer.Exit()
     
 def help_callback(value: bool):
@@ -33,6 +45,10 @@ def help_callback(value: bool):
     if not value:
         return
 
+    import pyfiglet
+    from rich.panel import Panel
+    from rich.table import Table
+
     table_comandos = Table(
         show_header=False, 
         header_style="bold magenta",
@@ -122,6 +138,7 @@ def help_callback(value: bool):
 
 def panel(titulo, mensagem, color="red"):
     """Cria um painel formatado para exibição de mensagens."""
+    from rich.panel import Panel
     return Panel(
         renderable=mensagem,
         title=titulo,
@@ -251,7 +268,7 @@ def payload(
     help="Gera um QR Code PIX.",
 )
 def qrcode(
-    output: Optional[str] = typer.Option(None, "--output", "-o", help="Caminho e nome do arquivo de saída (ex: 'output/pix.png')."),
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Caminho e nome do arquivo de saída (ex: 'output/pix.png'). Use '-' para escrever o PNG na saída padrão."),
     key: str = typer.Option(None, "--key", "-k", help="Chave PIX (CPF/CNPJ, e-mail, celular ou aleatória)."),
     name: str = typer.Option(None, "--name", "-n", help="Nome do beneficiário."),
     city: str = typer.Option(None, "--city", "-c", help="Cidade do beneficiário (maiúsculas, sem acentos)."),
@@ -276,7 +293,9 @@ def qrcode(
         aberta no visualizador de imagens padrão do seu sistema operacional.
 
     2.  Salvar em arquivo: Ao usar a opção '--output', a imagem é salva no
-        caminho especificado. O formato é inferido pela extensão do arquivo (ex: .png).
+        caminho especificado. O formato é inferido pela extensão do arquivo (ex: .png
+        ou .svg, para uma imagem vetorial).
+        Com '--output -', o PNG é escrito na saída padrão.
 
     É possível customizar o QR Code, por exemplo, adicionando um logo no centro.
 
@@ -319,7 +338,12 @@ def qrcode(
         )
         
         transacao = brcode.Pix(data)
-        if output:
+        if output == "-":
+            # Escreve o PNG direto na saída padrão, sem arquivo temporário (ex: para um pipe).
+            saida = sys.stdout.buffer
+            transacao.qrcode_bytes(buffer=saida, caminho_logo=caminho_logo)
+            saida.flush()
+        elif output:
             output_dir = os.path.dirname(output)
             if output_dir:
                 os.makedirs(output_dir, exist_ok=True)
@@ -374,8 +398,10 @@ def decode(
     - Decodificar um payload recebido:
         $ pixcore decode "00020126580014br.gov.bcb.pix0136..."
     """
+    from rich.table import Table
+
     try:
-        dados_decodificados = decipher.decode(payload)
+        dados_decodificados = decipher.decode(payload, como_registro=True).to_dict()
         
         tabela_resultados = Table(title="Dados do PIX", show_header=False)
         tabela_resultados.add_column("Campo", style="cyan", no_wrap=True)
@@ -397,7 +423,9 @@ def decode(
             if chave in dados_decodificados:
                 valor = dados_decodificados[chave]
                 
-                if chave == "transaction_amount":
+                if chave == "transaction_amount" and dados_decodificados.get('transaction_amount_cents') is not None:
+                    valor_str = f"R$ {utils.format_cents(dados_decodificados['transaction_amount_cents'])}"
+                elif chave == "transaction_amount":
                     valor_str = f"R$ {valor:.2f}"
                 else:
                     valor_str = str(valor)
@@ -423,10 +451,21 @@ def decode(
 )
 def lote(
     arquivo_csv: str = typer.Argument(..., help="Caminho para o arquivo CSV com os dados."),
-    diretorio_saida: str = typer.Argument(..., help="Diretório onde os QR Codes serão salvos."),
+    diretorio_saida: Optional[str] = typer.Argument(None, help="Diretório onde os QR Codes serão salvos, ou um arquivo .zip, .tar, .tar.gz ou .pdf que os reúne. Com '--formato payload', o arquivo de saída ('-' ou omitido: saída padrão)."),
     key: str = typer.Option(None, "--key", "-k", help="Chave PIX padrão (usada se não especificada no CSV)."),
     name: str = typer.Option(None, "--name", "-n", help="Nome do beneficiário padrão (usado se não especificado no CSV)."),
     city: str = typer.Option(None, "--city", "-c", help="Cidade padrão do beneficiário (usada se não especificada no CSV)."),
+    workers: Optional[int] = typer.Option(None, "--workers", "-w", help="Quantidade de processos usados na geração. Padrão: número de CPUs."),
+    buffer_size: int = typer.Option(256, "--buffer-size", min=1, help="Quantidade máxima de linhas em cada fila entre os estágios (leitura, renderização e escrita)."),
+    resume: bool = typer.Option(False, "--resume", help="Registra o progresso em um journal no diretório de saída e retoma uma execução interrompida."),
+    formato: str = typer.Option("png", "--formato", "-f", help="Formato da saída: 'png' ou 'svg' (um QR Code por linha) ou 'payload' (apenas os códigos Copia e Cola, sem imagens)."),
+    jsonl: bool = typer.Option(False, "--jsonl", help="Com '--formato payload', escreve JSON Lines em vez de CSV. Automático para arquivos '.jsonl' e '.ndjson'."),
+    modo: str = typer.Option("RGB", "--modo", "-m", help="Modo dos PNGs: '1' (1 bit, preto e branco), 'P' (paleta) ou 'RGB'. Os modos '1' e 'P' geram arquivos muito menores."),
+    compress_level: int = typer.Option(6, "--compress-level", min=0, max=9, help="Nível de compressão dos PNGs, de 0 (mais rápido) a 9 (menor arquivo)."),
+    optimize: bool = typer.Option(False, "--optimize", help="Procura a menor codificação possível de cada PNG (mais lento)."),
+    caminho_logo: Optional[str] = typer.Option(None, "--logo", "-l", help="Caminho para um logo centralizado em todos os QR Codes. É preparado uma única vez por processo."),
+    container: Optional[str] = typer.Option(None, "--container", help="Como agrupar os QR Codes: 'diretorio', 'zip', 'tar', 'pdf' ou 'folhas' (sprite sheets PNG com um índice JSON). Padrão: deduzido pela extensão da saída."),
+    por_pagina: int = typer.Option(12, "--por-pagina", min=1, help="Quantidade de QR Codes por página do PDF ou por folha."),
 ):
     """
     Processa um arquivo CSV para gerar múltiplos QR Codes PIX de uma só vez.
@@ -441,78 +480,184 @@ def lote(
     não estiverem no CSV, serão usados os valores passados como opção ou do arquivo de configuração.
 
     Os arquivos de imagem gerados serão nomeados com o valor da coluna 'txid' de cada linha
-    (ex: `[txid].png`).
+    (ex: `[txid].png`). Com `--formato svg`, são gravadas imagens vetoriais (`[txid].svg`).
+
+    As linhas são distribuídas entre vários processos (opção `--workers`), mas as
+    mensagens de progresso e de erro são exibidas na ordem das linhas do arquivo.
+    O arquivo é lido sob demanda e no máximo `--buffer-size` linhas aguardam em
+    cada estágio, então o uso de memória não depende do tamanho do CSV.
+
+    Com `--resume`, as linhas concluídas são registradas em um journal no diretório
+    de saída. Se o comando for interrompido, basta executá-lo novamente com
+    `--resume`: a leitura continua a partir da primeira linha não concluída, e os
+    QR Codes que já existem com o mesmo payload não são gerados de novo.
+
+    Para lotes grandes, a saída pode ser um único arquivo em vez de um diretório:
+    um ZIP ou TAR (ex: 'qrcodes.zip'), um PDF com `--por-pagina` QR Codes e as suas
+    legendas (TXID e valor) por página, ou, com `--container folhas`, folhas PNG
+    com vários QR Codes e um índice `indice.json` com a posição de cada um.
+
+    Com `--formato payload`, nenhuma imagem é gerada: as linhas `txid,payload` são
+    escritas em CSV (ou JSON Lines) no arquivo informado ou na saída padrão. Esse
+    modo não carrega as bibliotecas de imagem e é muito mais rápido.
+
+    Os PNGs são RGB por padrão. Com `--modo 1` (preto e branco) ou `--modo P`
+    (paleta), cada arquivo ocupa uma fração do tamanho e é gravado mais rápido;
+    `--compress-level` e `--optimize` ajustam a compressão.
 
     Exemplo de uso:
 
     - Gerar QR Codes a partir de 'cobrancas.csv' e salvar na pasta 'qrcodes/':
         $ pixcore lote "cobrancas.csv" "qrcodes/" --name "Minha Empresa" --city "RIO DE JANEIRO" --key "meu-cnpj"
+
+    - Usar apenas 4 processos:
+        $ pixcore lote "cobrancas.csv" "qrcodes/" --workers 4
+
+    - Retomar um lote interrompido:
+        $ pixcore lote "cobrancas.csv" "qrcodes/" --resume
+
+    - Gerar apenas os payloads em um arquivo JSON Lines:
+        $ pixcore lote "cobrancas.csv" "payloads.jsonl" --formato payload
+
+    - Adicionar o logo da empresa a todos os QR Codes:
+        $ pixcore lote "cobrancas.csv" "qrcodes/" --logo "logo.png"
+
+    - Gerar PNGs de 1 bit, com compressão máxima:
+        $ pixcore lote "cobrancas.csv" "qrcodes/" --modo 1 --compress-level 9
+
+    - Gerar QR Codes vetoriais (SVG), para impressão:
+        $ pixcore lote "cobrancas.csv" "qrcodes/" --formato svg
+
+    - Reunir os QR Codes em um PDF, com 20 por página:
+        $ pixcore lote "cobrancas.csv" "cobrancas.pdf" --por-pagina 20
     """
+    from . import containers
+    from . import lote as lote_engine
+
+    if formato not in ("png", "svg", "payload"):
+        console.print(panel("❌ Formato inválido", f"O formato [bold]{escape(formato)}[/] não é suportado. Use 'png', 'svg' ou 'payload'."))
+        raise typer.Exit(code=1)
+    if modo not in brcode.MODOS_IMAGEM:
+        console.print(panel("❌ Modo inválido", f"O modo [bold]{escape(modo)}[/] não é suportado. Use '1', 'P' ou 'RGB'."))
+        raise typer.Exit(code=1)
+    if container is not None and container not in containers.CONTAINERS:
+        console.print(panel("❌ Container inválido", f"O container [bold]{escape(container)}[/] não é suportado. Use um destes: {', '.join(containers.CONTAINERS)}."))
+        raise typer.Exit(code=1)
+    if formato != "payload" and not diretorio_saida:
+        console.print(panel("❌ Diretório de saída ausente", "Informe o diretório onde os QR Codes serão salvos."))
+        raise typer.Exit(code=1)
+
     try:
         config = config_manager.read_config()
-        os.makedirs(diretorio_saida, exist_ok=True)
-
-        with open(arquivo_csv, mode='r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            
-            console.rule(f'Geração em Lote - [cyan]{arquivo_csv}', style='blue')
-            console.print('')
-            
-            for i, row in enumerate(reader):
-                linha_num = i + 2
-                try:
-                    final_key = row.get('chave') or key or config.get('default', 'key', fallback=None)
-                    final_name = row.get('nome') or name or config.get('default', 'name', fallback=None)
-                    final_city = row.get('cidade') or city or config.get('default', 'city', fallback=None)
-                    
-                    amount_str = row.get('valor')
-                    txid = row.get('txid')
+        padroes = {
+            'key': key or config.get('default', 'key', fallback=None),
+            'name': name or config.get('default', 'name', fallback=None),
+            'city': city or config.get('default', 'city', fallback=None),
+        }
 
-                    if not all([final_key, final_name, final_city, amount_str, txid]):
-                        console.print(panel(f"⚠️ Linha {linha_num} Ignorada", "Dados essenciais (chave, nome, cidade, valor, txid) estão faltando."))
-                        continue
-                    
-                    try:
-                        amount = float(amount_str.replace(',', '.'))
-                    except (ValueError, TypeError):
-                        console.print(panel(f"⚠️ Linha {linha_num} Ignorada", f"Valor '[bold]{amount_str}[/]' é inválido."))
-                        continue
-
-                    info = row.get('info_adicional')
-                    cep = row.get('cep')
-                    mcc = row.get('mcc', '0000')
-
-                    data = models.PixData(
-                        recebedor_nome=final_name,
-                        recebedor_cidade=final_city,
-                        pix_key=final_key,
-                        valor=amount,
-                        transacao_id=txid,
-                        receptor_categoria_code=mcc,
-                        recebedor_cep=cep,
-                        info_adicional=info,
-                    )
-                    
-                    transacao = brcode.Pix(data)
-                    nome_arquivo = f"{txid}.png"
-                    caminho_arquivo = os.path.join(diretorio_saida, nome_arquivo)
-                    
-                    if transacao.save_qrcode(caminho_arquivo_saida=caminho_arquivo):
-                        console.print(f"  ✅ [green]Sucesso:[/] QR Code para txid '[bold]{txid}[/]'")
-                    
-                except Exception as e:
-                    console.print(panel(f"❌ Erro na Linha {linha_num}", f"Não foi possível gerar o QR Code para txid '[bold]{txid}[/]'.\nMotivo: {e}"))
+        if not os.path.isfile(arquivo_csv):
+            raise FileNotFoundError(arquivo_csv)
+
+        if formato == "payload":
+            _lote_payloads(arquivo_csv, diretorio_saida, padroes, jsonl)
+            return
+
+        console.rule(f'Geração em Lote - [cyan]{arquivo_csv}', style='blue')
+        console.print('')
+
+        contagem = {lote_engine.SUCESSO: 0, lote_engine.IGNORADA: 0, lote_engine.ERRO: 0, lote_engine.JA_GERADA: 0}
+        primeira_linha = None
+        inicio = time.perf_counter()
+
+        for resultado in lote_engine.processar_csv(
+            arquivo_csv, diretorio_saida, padroes, workers=workers, tamanho_buffer=buffer_size, retomar=resume,
+            modo=modo, compress_level=compress_level, optimize=optimize, caminho_logo=caminho_logo, formato=formato,
+            container=container, por_pagina=por_pagina,
+        ):
+            contagem[resultado.status] += 1
+            if primeira_linha is None:
+                primeira_linha = resultado.linha
+                if primeira_linha > 2:
+                    console.print(f"  ⏩ Retomando a partir da linha [bold]{primeira_linha}[/]")
+
+            if resultado.status == lote_engine.SUCESSO:
+                console.print(f"  ✅ [green]Sucesso:[/] QR Code para txid '[bold]{escape(resultado.txid)}[/]'")
+            elif resultado.status == lote_engine.JA_GERADA:
+                console.print(f"  ⏭️  [dim]Já gerado:[/] QR Code para txid '[bold]{escape(resultado.txid)}[/]'")
+            elif resultado.status == lote_engine.IGNORADA:
+                console.print(panel(f"⚠️ Linha {resultado.linha} Ignorada", escape(resultado.motivo)))
+            else:
+                console.print(panel(f"❌ Erro na Linha {resultado.linha}", f"Não foi possível gerar o QR Code para txid '[bold]{escape(str(resultado.txid))}[/]'.\nMotivo: {escape(resultado.motivo)}"))
+
+        duracao = time.perf_counter() - inicio
+        total = sum(contagem.values())
+        vazao = total / duracao if duracao > 0 else 0.0
 
         console.print('')
-        console.print(panel("✅ Geração em lote concluída!", f"QR Codes salvos em: [cyan]{diretorio_saida}", "green"))
+        console.print(panel(
+            "✅ Geração em lote concluída!",
+            f"QR Codes salvos em: [cyan]{diretorio_saida}[/]\n"
+            f"Linhas processadas: [bold]{total}[/] "
+            f"(sucesso: [green]{contagem[lote_engine.SUCESSO]}[/], "
+            f"ignoradas: [yellow]{contagem[lote_engine.IGNORADA]}[/], "
+            f"erros: [red]{contagem[lote_engine.ERRO]}[/], "
+            f"já gerados: [dim]{contagem[lote_engine.JA_GERADA]}[/])\n"
+            f"Tempo: {duracao:.2f}s ({vazao:.1f} linhas/s)",
+            "green"
+        ))
 
     except FileNotFoundError:
         console.print(panel("❌ Arquivo não encontrado", f"O arquivo [bold]{arquivo_csv}[/] não foi encontrado."))
         raise typer.Exit(code=1)
+    except ValueError as e:
+        console.print(panel("❌ Opções incompatíveis", escape(str(e))))
+        raise typer.Exit(code=1)
     except Exception as e:
         console.print(panel("❌ Ocorreu um erro inesperado no processamento em lote", f"{e}"))
         raise typer.Exit(code=1)
 
+def _lote_payloads(arquivo_csv: str, arquivo_saida: Optional[str], padroes: dict, jsonl: bool):
+    """Gera apenas os payloads do lote, escrevendo-os em um arquivo ou na saída padrão."""
+    from . import lote as lote_engine
+
+    para_stdout = arquivo_saida in (None, "-")
+    formato_saida = "jsonl" if jsonl or (not para_stdout and arquivo_saida.lower().endswith((".jsonl", ".ndjson"))) else "csv"
+    # Na saída padrão ficam apenas os payloads; as mensagens vão para a saída de erro.
+    mensagens = Console(stderr=True) if para_stdout else console
+
+    contagem = {lote_engine.SUCESSO: 0, lote_engine.IGNORADA: 0, lote_engine.ERRO: 0}
+    inicio = time.perf_counter()
+
+    destino = sys.stdout if para_stdout else open(arquivo_saida, "w", encoding="utf-8", newline="")
+    try:
+        payloads = lote_engine.gerar_payloads(arquivo_csv, padroes)
+        for resultado in lote_engine.escrever_payloads(payloads, destino, formato_saida):
+            contagem[resultado.status] += 1
+            if resultado.status == lote_engine.IGNORADA:
+                mensagens.print(panel(f"⚠️ Linha {resultado.linha} Ignorada", escape(resultado.motivo)))
+            elif resultado.status == lote_engine.ERRO:
+                mensagens.print(panel(f"❌ Erro na Linha {resultado.linha}", f"Não foi possível gerar o payload para txid '[bold]{escape(str(resultado.txid))}[/]'.\nMotivo: {escape(resultado.motivo)}"))
+    finally:
+        if para_stdout:
+            destino.flush()
+        else:
+            destino.close()
+
+    duracao = time.perf_counter() - inicio
+    total = sum(contagem.values())
+    vazao = total / duracao if duracao > 0 else 0.0
+
+    mensagens.print(panel(
+        "✅ Geração de payloads concluída!",
+        f"Payloads salvos em: [cyan]{'saída padrão' if para_stdout else escape(arquivo_saida)}[/] ({formato_saida.upper()})\n"
+        f"Linhas processadas: [bold]{total}[/] "
+        f"(sucesso: [green]{contagem[lote_engine.SUCESSO]}[/], "
+        f"ignoradas: [yellow]{contagem[lote_engine.IGNORADA]}[/], "
+        f"erros: [red]{contagem[lote_engine.ERRO]}[/])\n"
+        f"Tempo: {duracao:.2f}s ({vazao:.1f} linhas/s)",
+        "green"
+    ))
+
 # ==============================================================================
 # App de Configurações
 # ==============================================================================
@@ -527,6 +672,9 @@ def help_callback_config(value: bool):
     if not value:
         return
 
+    from rich.panel import Panel
+    from rich.table import Table
+
     table_comandos = Table(
         show_header=False, 
         header_style="bold magenta",
@@ -622,6 +770,8 @@ def config_set(
     - Salvar sua chave PIX principal:
         $ pixcore config set key "minha-chave-aleatoria"
     """
+    from rich.panel import Panel
+
     chaves_validas = ["name", "city", "key"]
     if key not in chaves_validas:
         console.print(Panel(f"❌ Chave '[bold red]{key}[/]' inválida. Use uma das seguintes: {chaves_validas}", expand=False))
@@ -649,6 +799,8 @@ def config_show():
         console.print("[yellow]Nenhuma configuração salva encontrada.[/yellow]")
         return
 
+    from rich.table import Table
+
     table = Table(title="Configurações Salvas")
     table.add_column("Chave", style="cyan")
     table.add_column("Valor", style="green")
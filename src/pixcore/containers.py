@@ -0,0 +1,399 @@
+"""
+Módulo de Containers de Saída do Lote.
+
+Por padrão, `pixcore lote` grava um arquivo por linha do CSV. Com centenas
+de milhares de linhas, isso significa o mesmo número de inodes, um `open` e
+um `close` por QR Code e listagens de diretório lentas (especialmente em
+compartilhamentos de rede). Os containers deste módulo agrupam os QR Codes
+em poucos arquivos grandes, escritos sequencialmente:
+
+- `DestinoZip` e `DestinoTar`: um único arquivo ZIP ou TAR (opcionalmente
+  `.tar.gz`), escrito como um stream, na ordem das linhas;
+- `DestinoPdf`: um PDF com várias páginas, cada uma com `por_pagina` QR Codes
+  e as suas legendas (TXID e valor). Os PNGs são embutidos sem serem
+  decodificados: os dados comprimidos do PNG já são um stream válido de PDF;
+- `DestinoFolhas`: folhas (sprite sheets) PNG com `por_pagina` QR Codes cada,
+  e um índice JSON com a folha e a posição de cada TXID.
+
+Todos os destinos têm a mesma interface (`gravar()` e `fechar()`) e são
+usados pela thread de escrita de `pixcore.lote.processar_csv`. Apenas uma
+página (ou folha) fica em memória por vez.
+"""
+from typing import List, Optional, Tuple
+import io
+import json
+import math
+import os
+import struct
+import tarfile
+import time
+import zipfile
+import zlib
+
+CONTAINERS = ("diretorio", "zip", "tar", "pdf", "folhas")
+
+ARQUIVO_INDICE = "indice.json"
+
+def container_do_caminho(caminho: str) -> str:
+    """
+    Deduz o container pela extensão do caminho de saída.
+
+    Args:
+        caminho (str): O caminho de saída do lote.
+
+    Returns:
+        str: "zip", "tar" (`.tar`, `.tar.gz` ou `.tgz`), "pdf" ou, para qualquer
+             outro caminho, "diretorio".
+
+    Examples:
+        >>> container_do_caminho("cobrancas.tar.gz")
+        'tar'
+        >>> container_do_caminho("qrcodes/")
+        'diretorio'
+    """
+    nome = os.fspath(caminho).lower()
+    if nome.endswith(".zip"):
+        return "zip"
+    if nome.endswith((".tar", ".tar.gz", ".tgz")):
+        return "tar"
+    if nome.endswith(".pdf"):
+        return "pdf"
+    return "diretorio"
+
+def _legenda_valor(valor: Optional[float]) -> str:
+    return "" if valor is None else "R$ " + f"{valor:.2f}".replace(".", ",")
+
+class DestinoDiretorio:
+    """
+    Grava cada QR Code em um arquivo próprio do diretório (o comportamento padrão).
+
+    Parameters:
+        diretorio (str): O diretório de saída, criado se não existir.
+    """
+
+    def __init__(self, diretorio: str):
+        self.diretorio = diretorio
+        os.makedirs(diretorio, exist_ok=True)
+
+    def gravar(self, nome: str, dados: bytes, txid: Optional[str] = None, valor: Optional[float] = None):
+        with open(os.path.join(self.diretorio, nome), 'wb') as arquivo:
+            arquivo.write(dados)
+
+    def fechar(self):
+        pass
+
+class DestinoZip:
+    """
+    Grava os QR Codes em um único arquivo ZIP.
+
+    Os PNGs já são comprimidos e são armazenados sem nova compressão; os SVGs
+    (texto) são comprimidos com deflate.
+
+    Parameters:
+        caminho (str): O caminho do arquivo ZIP.
+    """
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        self._zip = zipfile.ZipFile(caminho, 'w')
+
+    def gravar(self, nome: str, dados: bytes, txid: Optional[str] = None, valor: Optional[float] = None):
+        compressao = zipfile.ZIP_DEFLATED if nome.lower().endswith(".svg") else zipfile.ZIP_STORED
+        info = zipfile.ZipInfo(nome, date_time=time.localtime()[:6])
+        info.compress_type = compressao
+        self._zip.writestr(info, dados)
+
+    def fechar(self):
+        self._zip.close()
+
+class DestinoTar:
+    """
+    Grava os QR Codes em um único arquivo TAR, escrito como um stream.
+
+    Parameters:
+        caminho (str): O caminho do arquivo. Com `.tar.gz` ou `.tgz`, o stream
+                       é comprimido com gzip.
+    """
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        modo = 'w|gz' if caminho.lower().endswith((".tar.gz", ".tgz")) else 'w|'
+        self._tar = tarfile.open(caminho, modo)
+
+    def gravar(self, nome: str, dados: bytes, txid: Optional[str] = None, valor: Optional[float] = None):
+        info = tarfile.TarInfo(nome)
+        info.size = len(dados)
+        info.mtime = int(time.time())
+        info.mode = 0o644
+        self._tar.addfile(info, io.BytesIO(dados))
+
+    def fechar(self):
+        self._tar.close()
+
+def _grade(quantidade: int, largura: float, altura: float) -> Tuple[int, int]:
+    """Colunas e linhas para distribuir `quantidade` células em uma área, com células quase quadradas."""
+    colunas = max(1, math.ceil(math.sqrt(quantidade * largura / altura)))
+    return colunas, math.ceil(quantidade / colunas)
+
+def _imagem_pdf(png: bytes) -> Tuple[int, int, bytes]:
+    """
+    Converte um PNG no dicionário e no stream de um XObject de imagem do PDF.
+
+    O PDF aceita o mesmo formato de compressão do PNG (deflate com os filtros
+    por linha, `/Predictor 15`), então os blocos IDAT são copiados sem serem
+    decodificados. PNGs entrelaçados ou com transparência são convertidos
+    para RGB pelo Pillow.
+
+    Returns:
+        Tuple[int, int, bytes]: A largura, a altura e o corpo do objeto.
+    """
+    largura = altura = profundidade = tipo = entrelacado = None
+    paleta = b""
+    idat = []
+    if png[:8] == b'\x89PNG\r\n\x1a\n':
+        posicao = 8
+        while posicao + 8 <= len(png):
+            tamanho, nome = struct.unpack(">I4s", png[posicao:posicao + 8])
+            dados = png[posicao + 8:posicao + 8 + tamanho]
+            posicao += 12 + tamanho
+            if nome == b"IHDR":
+                largura, altura, profundidade, tipo, _, _, entrelacado = struct.unpack(">IIBBBBB", dados)
+            elif nome == b"PLTE":
+                paleta = dados
+            elif nome == b"IDAT":
+                idat.append(dados)
+            elif nome == b"tRNS":
+                tipo = None  # transparência: convertida abaixo
+            elif nome == b"IEND":
+                break
+
+    if tipo in (0, 2, 3) and not entrelacado:
+        if tipo == 3:
+            espaco = f"[/Indexed /DeviceRGB {len(paleta) // 3 - 1} <{paleta.hex()}>]"
+        else:
+            espaco = "/DeviceGray" if tipo == 0 else "/DeviceRGB"
+        cores = 3 if tipo == 2 else 1
+        stream = b"".join(idat)
+        parametros = f"/DecodeParms << /Predictor 15 /Colors {cores} /BitsPerComponent {profundidade} /Columns {largura} >> "
+    else:
+        from PIL import Image
+
+        with Image.open(io.BytesIO(png)) as imagem:
+            fundo = Image.new("RGB", imagem.size, "white")
+            rgba = imagem.convert("RGBA")
+            fundo.paste(rgba, mask=rgba.getchannel("A"))
+        largura, altura = fundo.size
+        espaco, profundidade, parametros = "/DeviceRGB", 8, ""
+        stream = zlib.compress(fundo.tobytes())
+
+    cabecalho = (
+        f"<< /Type /XObject /Subtype /Image /Width {largura} /Height {altura} /ColorSpace {espaco} "
+        f"/BitsPerComponent {profundidade} /Filter /FlateDecode {parametros}/Length {len(stream)} >>\nstream\n"
+    )
+    return largura, altura, cabecalho.encode("latin-1") + stream + b"\nendstream"
+
+def _texto_pdf(texto: str) -> str:
+    texto = texto.encode("latin-1", "replace").decode("latin-1")
+    return "(" + texto.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ")"
+
+class DestinoPdf:
+    """
+    Grava os QR Codes em um PDF (A4) com várias páginas, escrito incrementalmente.
+
+    Cada página tem até `por_pagina` QR Codes em grade, com o TXID e o valor
+    abaixo de cada um. Cada imagem é gravada no arquivo assim que chega, e
+    apenas a referência a ela é guardada até a página ser fechada; o índice
+    (xref) é escrito ao final, em `fechar()`.
+
+    Parameters:
+        caminho (str): O caminho do arquivo PDF.
+        por_pagina (int, optional): Quantidade de QR Codes por página. Defaults to 12.
+
+    Raises:
+        ValueError: Se `por_pagina` for menor que 1.
+    """
+    LARGURA, ALTURA, MARGEM, LEGENDA = 595, 842, 36, 24
+
+    def __init__(self, caminho: str, por_pagina: int = 12):
+        if por_pagina < 1:
+            raise ValueError("A quantidade de QR Codes por página deve ser de pelo menos 1.")
+        self.caminho = caminho
+        self.por_pagina = por_pagina
+        self._arquivo = open(caminho, 'wb')
+        self._posicao = 0
+        self._offsets = {}
+        self._proximo = 4  # 1: catálogo, 2: árvore de páginas, 3: fonte
+        self._paginas: List[int] = []
+        self._imagens: List[Tuple[int, Optional[str], Optional[float]]] = []
+        self._escrever(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def _escrever(self, dados: bytes):
+        self._arquivo.write(dados)
+        self._posicao += len(dados)
+
+    def _objeto(self, corpo: bytes, numero: Optional[int] = None) -> int:
+        if numero is None:
+            numero, self._proximo = self._proximo, self._proximo + 1
+        self._offsets[numero] = self._posicao
+        self._escrever(b"%d 0 obj\n%s\nendobj\n" % (numero, corpo))
+        return numero
+
+    def gravar(self, nome: str, dados: bytes, txid: Optional[str] = None, valor: Optional[float] = None):
+        _, _, corpo = _imagem_pdf(dados)
+        self._imagens.append((self._objeto(corpo), txid, valor))
+        if len(self._imagens) >= self.por_pagina:
+            self._fechar_pagina()
+
+    def _fechar_pagina(self):
+        colunas, linhas = _grade(self.por_pagina, self.LARGURA - 2 * self.MARGEM, self.ALTURA - 2 * self.MARGEM)
+        celula_x = (self.LARGURA - 2 * self.MARGEM) / colunas
+        celula_y = (self.ALTURA - 2 * self.MARGEM) / linhas
+        lado = max(1.0, min(celula_x, celula_y - self.LEGENDA) - 8)
+        tamanho_fonte = min(9.0, max(4.0, lado / 12))
+
+        conteudo = []
+        recursos = []
+        for i, (imagem, txid, valor) in enumerate(self._imagens):
+            coluna, linha = i % colunas, i // colunas
+            x = self.MARGEM + coluna * celula_x + (celula_x - lado) / 2
+            topo = self.ALTURA - self.MARGEM - linha * celula_y
+            y = topo - lado
+            recursos.append(f"/Im{i} {imagem} 0 R")
+            conteudo.append(f"q {lado:.2f} 0 0 {lado:.2f} {x:.2f} {y:.2f} cm /Im{i} Do Q")
+            for n, texto in enumerate(t for t in (txid or "", _legenda_valor(valor)) if t):
+                base = y - (n + 1) * (tamanho_fonte + 2)
+                conteudo.append(f"BT /F1 {tamanho_fonte:.1f} Tf {x:.2f} {base:.2f} Td {_texto_pdf(texto)} Tj ET")
+
+        stream = "\n".join(conteudo).encode("latin-1")
+        conteudo_obj = self._objeto(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        pagina = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {self.LARGURA} {self.ALTURA}] "
+            f"/Resources << /Font << /F1 3 0 R >> /XObject << {' '.join(recursos)} >> >> "
+            f"/Contents {conteudo_obj} 0 R >>"
+        )
+        self._paginas.append(self._objeto(pagina.encode("latin-1")))
+        self._imagens = []
+
+    def fechar(self):
+        if self._arquivo is None:
+            return
+        if self._imagens or not self._paginas:
+            self._fechar_pagina()
+
+        self._objeto(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>", 3)
+        kids = " ".join(f"{p} 0 R" for p in self._paginas)
+        self._objeto(f"<< /Type /Pages /Kids [{kids}] /Count {len(self._paginas)} >>".encode("latin-1"), 2)
+        self._objeto(b"<< /Type /Catalog /Pages 2 0 R >>", 1)
+
+        inicio_xref = self._posicao
+        linhas = [b"xref\n0 %d\n" % self._proximo, b"0000000000 65535 f \n"]
+        linhas.extend(b"%010d 00000 n \n" % self._offsets[n] for n in range(1, self._proximo))
+        linhas.append(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (self._proximo, inicio_xref))
+        self._escrever(b"".join(linhas))
+        self._arquivo.close()
+        self._arquivo = None
+
+class DestinoFolhas:
+    """
+    Grava os QR Codes em folhas PNG (sprite sheets), com um índice JSON das posições.
+
+    Cada folha `folha_NNNNN.png` reúne até `por_pagina` QR Codes em grade. O
+    arquivo `indice.json` é uma lista com, para cada QR Code, o TXID, o valor,
+    o nome da folha e a posição (`x`, `y`, `largura` e `altura`, em pixels).
+
+    Parameters:
+        diretorio (str): O diretório de saída, criado se não existir.
+        por_pagina (int, optional): Quantidade de QR Codes por folha. Defaults to 12.
+
+    Raises:
+        ValueError: Se `por_pagina` for menor que 1.
+    """
+
+    def __init__(self, diretorio: str, por_pagina: int = 12):
+        if por_pagina < 1:
+            raise ValueError("A quantidade de QR Codes por folha deve ser de pelo menos 1.")
+        self.diretorio = diretorio
+        self.por_pagina = por_pagina
+        os.makedirs(diretorio, exist_ok=True)
+        self._indice = open(os.path.join(diretorio, ARQUIVO_INDICE), 'w', encoding='utf-8')
+        self._indice.write("[")
+        self._primeiro = True
+        self._folhas = 0
+        self._imagens = []
+
+    def gravar(self, nome: str, dados: bytes, txid: Optional[str] = None, valor: Optional[float] = None):
+        from PIL import Image
+
+        imagem = Image.open(io.BytesIO(dados))
+        imagem.load()
+        self._imagens.append((imagem, txid, valor))
+        if len(self._imagens) >= self.por_pagina:
+            self._fechar_folha()
+
+    def _fechar_folha(self):
+        from PIL import Image
+        from .brcode import _codificar_png
+
+        colunas, linhas = _grade(len(self._imagens), 1, 1)
+        celula_x = max(imagem.size[0] for imagem, _, _ in self._imagens)
+        celula_y = max(imagem.size[1] for imagem, _, _ in self._imagens)
+        modos = {imagem.mode for imagem, _, _ in self._imagens}
+        modo = modos.pop() if len(modos) == 1 and "P" not in modos else "RGB"
+
+        self._folhas += 1
+        nome_folha = f"folha_{self._folhas:05d}.png"
+        folha = Image.new(modo, (colunas * celula_x, linhas * celula_y), "white")
+        for i, (imagem, txid, valor) in enumerate(self._imagens):
+            x, y = (i % colunas) * celula_x, (i // colunas) * celula_y
+            folha.paste(imagem if imagem.mode == modo else imagem.convert(modo), (x, y))
+            registro = {"txid": txid, "valor": valor, "folha": nome_folha, "x": x, "y": y,
+                        "largura": imagem.size[0], "altura": imagem.size[1]}
+            self._indice.write(("\n" if self._primeiro else ",\n") + json.dumps(registro, ensure_ascii=False))
+            self._primeiro = False
+
+        with open(os.path.join(self.diretorio, nome_folha), 'wb') as arquivo:
+            arquivo.write(_codificar_png(folha))
+        self._imagens = []
+
+    def fechar(self):
+        if self._indice is None:
+            return
+        if self._imagens:
+            self._fechar_folha()
+        self._indice.write("\n]\n")
+        self._indice.close()
+        self._indice = None
+
+def abrir_destino(caminho: str, container: Optional[str] = None, por_pagina: int = 12):
+    """
+    Cria o destino de gravação dos QR Codes de um lote.
+
+    Args:
+        caminho (str): O diretório ou o arquivo de saída.
+        container (Optional[str], optional): Um dos `CONTAINERS`. Se `None`, é
+            deduzido pela extensão de `caminho` (veja `container_do_caminho`).
+            Defaults to None.
+        por_pagina (int, optional): QR Codes por página do PDF ou por folha. Defaults to 12.
+
+    Returns:
+        DestinoDiretorio | DestinoZip | DestinoTar | DestinoPdf | DestinoFolhas: O destino aberto.
+
+    Raises:
+        ValueError: Se o container for desconhecido.
+    """
+    container = container or container_do_caminho(caminho)
+    if container not in CONTAINERS:
+        raise ValueError(f"Container '{container}' inválido. Use um destes: {', '.join(CONTAINERS)}.")
+    if container == "diretorio":
+        return DestinoDiretorio(caminho)
+    if container == "folhas":
+        return DestinoFolhas(caminho, por_pagina)
+
+    diretorio = os.path.dirname(caminho)
+    if diretorio:
+        os.makedirs(diretorio, exist_ok=True)
+    if container == "zip":
+        return DestinoZip(caminho)
+    if container == "tar":
+        return DestinoTar(caminho)
+    return DestinoPdf(caminho, por_pagina)
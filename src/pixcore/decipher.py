@@ -1,92 +1,274 @@
 from . import constants as const
 from . import utils
 from . import exceptions
-from typing import Dict, Any
+from .models import DecodedPix
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Union
+import sys
 
-def _parse_merchant_account_info(payload: str) -> Dict[str, str]:
-    """Analisa o campo aninhado Merchant Account Information (ID 26)."""
+def _parse_merchant_account_info(view: memoryview, inicio: int, fim: int) -> Dict[str, str]:
+    """Analisa o campo aninhado Merchant Account Information (ID 26) a partir do intervalo do campo pai."""
     data = {}
-    for sub_id, _, sub_value in utils.parse_tlv(payload):
+    for sub_id, sub_inicio, sub_fim in utils.scan_tlv(view, inicio, fim):
         if sub_id == const.ID_GUI:
-            data['gui'] = sub_value
+            data['gui'] = utils.tlv_value(view, sub_inicio, sub_fim)
         elif sub_id == const.ID_PIX_KEY:
-            data['pix_key'] = sub_value
+            data['pix_key'] = utils.tlv_value(view, sub_inicio, sub_fim)
     return data
 
-def _parse_additional_data_field(payload: str) -> Dict[str, str]:
-    """Analisa o campo aninhado Additional Data Field (ID 62)."""
+def _parse_additional_data_field(view: memoryview, inicio: int, fim: int) -> Dict[str, str]:
+    """Analisa o campo aninhado Additional Data Field (ID 62) a partir do intervalo do campo pai."""
     data = {}
-    for sub_id, _, sub_value in utils.parse_tlv(payload):
+    for sub_id, sub_inicio, sub_fim in utils.scan_tlv(view, inicio, fim):
         if sub_id == const.ID_TRANSACTION_ID:
-            data['transaction_id'] = sub_value
+            data['transaction_id'] = utils.tlv_value(view, sub_inicio, sub_fim)
     return data
 
-def _parse_language_template(payload: str) -> Dict[str, str]:
-    """Analisa o campo aninhado Merchant Information Language Template (ID 64)."""
+def _parse_language_template(view: memoryview, inicio: int, fim: int) -> Dict[str, str]:
+    """Analisa o campo aninhado Merchant Information Language Template (ID 64) a partir do intervalo do campo pai."""
     data = {}
-    for sub_id, _, sub_value in utils.parse_tlv(payload):
+    for sub_id, sub_inicio, sub_fim in utils.scan_tlv(view, inicio, fim):
         if sub_id == const.ID_LANGUAGE_PREFERENCE:
-            data['language_preference'] = sub_value
+            data['language_preference'] = utils.tlv_value(view, sub_inicio, sub_fim)
         elif sub_id == const.ID_MERCHANT_NAME_ALT:
-            data['merchant_name_alt'] = sub_value
+            data['merchant_name_alt'] = utils.tlv_value(view, sub_inicio, sub_fim)
         elif sub_id == const.ID_MERCHANT_CITY_ALT:
-            data['merchant_city_alt'] = sub_value
+            data['merchant_city_alt'] = utils.tlv_value(view, sub_inicio, sub_fim)
     return data
 
+# Campos simples do nível principal: ID -> chave no dicionário decodificado.
+_CAMPOS_SIMPLES = {
+    const.ID_PAYLOAD_FORMAT_INDICATOR: 'payload_format_indicator',
+    const.ID_POINT_OF_INITIATION_METHOD: 'point_of_initiation_method',
+    const.ID_MERCHANT_CATEGORY_CODE: 'merchant_category_code',
+    const.ID_TRANSACTION_CURRENCY: 'transaction_currency',
+    const.ID_COUNTRY_CODE: 'country_code',
+    const.ID_MERCHANT_NAME: 'merchant_name',
+    const.ID_MERCHANT_CITY: 'merchant_city',
+    const.ID_POSTAL_CODE: 'postal_code',
+}
 
-def decode(payload: str) -> Dict[str, Any]:
+def decode(
+    payload: Union[str, bytes, bytearray, memoryview],
+    como_registro: bool = False,
+) -> Union[Dict[str, Any], DecodedPix]:
     """
     Decodifica um payload completo do BR Code Pix, validando seu CRC16.
 
+    O payload é percorrido uma única vez com `utils.scan_tlv`, sem criar
+    substrings para os campos ignorados; os campos aninhados (IDs 26, 62 e 64)
+    são lidos diretamente do intervalo do campo pai.
+
     Args:
-        payload (str): A string completa do "Copia e Cola" do Pix.
+        payload (str | bytes | bytearray | memoryview): O "Copia e Cola" do Pix.
+            Bytes são interpretados como UTF-8.
+        como_registro (bool, optional): Se `True`, retorna um `DecodedPix`, que ocupa
+            bem menos memória que o dicionário. Defaults to False.
 
     Returns:
-        Dict[str, Any]: Um dicionário com os dados do Pix decodificados de forma estruturada.
+        Dict[str, Any] | DecodedPix: Os dados do Pix decodificados de forma estruturada.
+            O valor é retornado em `transaction_amount` (float); o `DecodedPix` também
+            o traz, de forma exata, em `transaction_amount_cents` (centavos inteiros, ou
+            `None` se o valor não for um número finito, como "nan").
 
     Raises:
         exceptions.CRCInvalidoError: Se o checksum CRC16 do payload for inválido.
         exceptions.DecodificacaoPayloadError: Se o payload for malformado.
     """
-    if len(payload) < 8 or payload[-8:-4] != f"{const.ID_CRC16}04":
+    view = utils.tlv_view(payload)
+    tamanho = len(view)
+
+    if tamanho < 8 or utils.tlv_value(view, tamanho - 8, tamanho - 4) != f"{const.ID_CRC16}04":
         raise exceptions.DecodificacaoPayloadError("Formato do campo CRC16 inválido ou ausente.")
 
-    payload_to_check = payload[:-8]
-    received_crc = payload[-4:]
-    
-    expected_crc = utils.calculate_crc16(payload_to_check + f"{const.ID_CRC16}04")
+    received_crc = utils.tlv_value(view, tamanho - 4, tamanho)
+    # Em payloads ASCII a visão já contém os bytes do payload; nos demais, o
+    # CRC é calculado sobre a codificação UTF-8 original.
+    dados_crc = view[:-4] if view.format == 'B' else payload[:-4]
+    expected_crc = utils.calculate_crc16(dados_crc)
 
     if received_crc.upper() != expected_crc.upper():
         raise exceptions.CRCInvalidoError(esperado=expected_crc, recebido=received_crc)
 
-    data_payload = payload_to_check
+    decoded_data = _decodificar_campos(view, tamanho - 8, centavos=como_registro)
+    return _como_registro(decoded_data) if como_registro else decoded_data
+
+def _como_registro(decoded_data: Dict[str, Any]) -> DecodedPix:
+    """
+    Converte os dados decodificados em um `DecodedPix`.
+
+    Os campos que se repetem entre cobranças (recebedor, chave, moeda...) são
+    internados, de modo que milhões de registros de um mesmo recebedor
+    compartilham as mesmas strings. O TXID, único por cobrança, não é internado.
+    """
+    for campo, valor in decoded_data.items():
+        if campo != 'transaction_id' and isinstance(valor, str):
+            decoded_data[campo] = sys.intern(valor)
+    return DecodedPix(**decoded_data)
+
+def _decodificar_campos(view: memoryview, fim: int, centavos: bool = False) -> Dict[str, Any]:
+    """
+    Decodifica os campos TLV de `view` até `fim` (o início do campo do CRC16).
+
+    Com `centavos=True` (usado para montar um `DecodedPix`), o valor também é
+    incluído em `transaction_amount_cents`.
+    """
     decoded_data: Dict[str, Any] = {}
 
-    for id_field, _, value in utils.parse_tlv(data_payload):
+    for id_field, inicio, fim_campo in utils.scan_tlv(view, 0, fim):
+        chave = _CAMPOS_SIMPLES.get(id_field)
+        if chave is not None:
+            decoded_data[chave] = utils.tlv_value(view, inicio, fim_campo)
+            continue
         match id_field:
-            case const.ID_PAYLOAD_FORMAT_INDICATOR:
-                decoded_data['payload_format_indicator'] = value
-            case const.ID_POINT_OF_INITIATION_METHOD:
-                decoded_data['point_of_initiation_method'] = value
-            case const.ID_MERCHANT_CATEGORY_CODE:
-                decoded_data['merchant_category_code'] = value
-            case const.ID_TRANSACTION_CURRENCY:
-                decoded_data['transaction_currency'] = value
             case const.ID_TRANSACTION_AMOUNT:
-                decoded_data['transaction_amount'] = float(value)
-            case const.ID_COUNTRY_CODE:
-                decoded_data['country_code'] = value
-            case const.ID_MERCHANT_NAME:
-                decoded_data['merchant_name'] = value
-            case const.ID_MERCHANT_CITY:
-                decoded_data['merchant_city'] = value
-            case const.ID_POSTAL_CODE:
-                decoded_data['postal_code'] = value
+                valor = utils.tlv_value(view, inicio, fim_campo)
+                decoded_data['transaction_amount'] = float(valor)
+                if not centavos:
+                    continue
+                try:
+                    decoded_data['transaction_amount_cents'] = utils.parse_cents(valor)
+                except ValueError:
+                    # Valores como "nan" ou "inf" não têm centavos exatos; `transaction_amount`
+                    # continua com o valor lido, como antes.
+                    decoded_data['transaction_amount_cents'] = None
             case const.ID_MERCHANT_ACCOUNT_INFORMATION:
-                decoded_data.update(_parse_merchant_account_info(value))
+                decoded_data.update(_parse_merchant_account_info(view, inicio, fim_campo))
             case const.ID_ADDITIONAL_DATA_FIELD_TEMPLATE:
-                decoded_data.update(_parse_additional_data_field(value))
+                decoded_data.update(_parse_additional_data_field(view, inicio, fim_campo))
             case const.ID_MERCHANT_INFO_LANGUAGE_TEMPLATE:
-                decoded_data.update(_parse_language_template(value))
+                decoded_data.update(_parse_language_template(view, inicio, fim_campo))
     
-    return decoded_data
\ No newline at end of file
+    return decoded_data
+
+# Códigos de resultado por item de `verify_crc_many` e `decode_many`.
+CODIGO_OK = 0
+CODIGO_FORMATO_INVALIDO = 1
+CODIGO_CRC_INVALIDO = 2
+CODIGO_PAYLOAD_MALFORMADO = 3
+
+MENSAGENS_ERRO = {
+    CODIGO_OK: "Payload válido.",
+    CODIGO_FORMATO_INVALIDO: "Formato do campo CRC16 inválido ou ausente.",
+    CODIGO_CRC_INVALIDO: "O CRC16 do payload não confere.",
+    CODIGO_PAYLOAD_MALFORMADO: "Payload malformado.",
+}
+
+class ResultadoDecodificacao(NamedTuple):
+    """
+    Resultado da decodificação de payloads em lote.
+
+    As colunas são paralelas às entradas: a posição `i` de cada uma corresponde
+    ao payload `i`. Quando a entrada é um `numpy.ndarray`, `codigos` também é um
+    array do NumPy.
+
+    Attributes:
+        dados (List[Optional[Dict[str, Any] | DecodedPix]]): Os dados decodificados
+            de cada payload válido, ou `None` para os payloads rejeitados.
+        codigos (List[int]): O código de resultado de cada payload (`CODIGO_OK`
+            ou um dos códigos de erro; veja `MENSAGENS_ERRO`).
+    """
+    dados: List[Optional[Union[Dict[str, Any], DecodedPix]]]
+    codigos: List[int]
+
+    @property
+    def total_erros(self) -> int:
+        """Quantidade de payloads rejeitados."""
+        return int(sum(1 for codigo in self.codigos if codigo != CODIGO_OK))
+
+def _verificar_crc(payload: Any, sufixo_str: str, sufixo_bytes: bytes, crc16_update) -> int:
+    """Verifica apenas o campo 63 e o CRC16 de um payload, retornando o código de resultado."""
+    if isinstance(payload, str):
+        if len(payload) < 8 or payload[-8:-4] != sufixo_str:
+            return CODIGO_FORMATO_INVALIDO
+        recebido = payload[-4:]
+        dados = payload[:-4].encode('utf-8')
+    elif isinstance(payload, (bytes, bytearray, memoryview)):
+        payload = bytes(payload) if isinstance(payload, memoryview) else payload
+        if len(payload) < 8 or payload[-8:-4] != sufixo_bytes:
+            return CODIGO_FORMATO_INVALIDO
+        recebido = payload[-4:].decode('ascii', 'replace')
+        dados = payload[:-4]
+    else:
+        return CODIGO_FORMATO_INVALIDO
+
+    if '%04X' % crc16_update(dados, 0xFFFF) != recebido.upper():
+        return CODIGO_CRC_INVALIDO
+    return CODIGO_OK
+
+def _como_coluna(codigos: List[int], como_numpy: bool):
+    if como_numpy:
+        numpy = utils._import_numpy()
+        return numpy.array(codigos, dtype=numpy.int8)
+    return codigos
+
+def verify_crc_many(payloads: Iterable[Union[str, bytes]]) -> List[int]:
+    """
+    Verifica o CRC16 de vários payloads, sem decodificar os demais campos.
+
+    Apenas o campo 63 (`6304`) no final do payload e o checksum são checados.
+    Nenhuma exceção é lançada: cada payload recebe um código de resultado.
+
+    Args:
+        payloads (Iterable[str | bytes]): Os payloads "Copia e Cola". Aceita
+            listas, geradores ou um `numpy.ndarray`.
+
+    Returns:
+        List[int]: O código de cada payload (`CODIGO_OK`, `CODIGO_FORMATO_INVALIDO`
+                   ou `CODIGO_CRC_INVALIDO`). Um array do NumPy se a entrada for
+                   um `numpy.ndarray`.
+
+    Examples:
+        >>> verify_crc_many(["00020126...6304ABCD", "0002010102"])
+        [2, 1]
+    """
+    como_numpy = utils._is_ndarray(payloads)
+    lista = utils._as_list(payloads) if como_numpy else payloads
+    sufixo_str = f"{const.ID_CRC16}04"
+    sufixo_bytes = sufixo_str.encode('ascii')
+    crc16_update = utils._crc16_update
+
+    codigos = [_verificar_crc(payload, sufixo_str, sufixo_bytes, crc16_update) for payload in lista]
+    return _como_coluna(codigos, como_numpy)
+
+def decode_many(payloads: Iterable[Union[str, bytes]], como_registro: bool = False) -> ResultadoDecodificacao:
+    """
+    Decodifica vários payloads, rejeitando primeiro os que têm CRC16 inválido.
+
+    O CRC16 de todos os payloads é verificado antes (como em `verify_crc_many`),
+    e apenas os aprovados são decodificados por completo. Nenhuma exceção é
+    lançada: erros são reportados pelo código de cada item.
+
+    Args:
+        payloads (Iterable[str | bytes]): Os payloads "Copia e Cola". Aceita
+            listas, geradores ou um `numpy.ndarray`.
+        como_registro (bool, optional): Se `True`, os dados de cada payload são
+            um `DecodedPix` em vez de um dicionário. Defaults to False.
+
+    Returns:
+        ResultadoDecodificacao: Os dados decodificados e o código de cada payload.
+
+    Examples:
+        >>> resultado = decode_many(["00020126...6304ABCD"])
+        >>> resultado.dados, resultado.codigos
+        ([None], [2])
+    """
+    como_numpy = utils._is_ndarray(payloads)
+    lista = utils._as_list(payloads) if como_numpy else list(payloads)
+    sufixo_str = f"{const.ID_CRC16}04"
+    sufixo_bytes = sufixo_str.encode('ascii')
+    crc16_update = utils._crc16_update
+
+    codigos = [_verificar_crc(payload, sufixo_str, sufixo_bytes, crc16_update) for payload in lista]
+    dados: List[Optional[Union[Dict[str, Any], DecodedPix]]] = [None] * len(lista)
+
+    for i, codigo in enumerate(codigos):
+        if codigo != CODIGO_OK:
+            continue
+        try:
+            view = utils.tlv_view(lista[i])
+            campos = _decodificar_campos(view, len(view) - 8, centavos=como_registro)
+            dados[i] = _como_registro(campos) if como_registro else campos
+        except (exceptions.DecodificacaoPayloadError, ValueError):
+            codigos[i] = CODIGO_PAYLOAD_MALFORMADO
+
+    return ResultadoDecodificacao(dados, _como_coluna(codigos, como_numpy))
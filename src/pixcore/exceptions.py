@@ -15,7 +15,18 @@ class PixCoreError(Exception):
     permitindo que os usuários capturem erros específicos ou genéricos da
     biblioteca com um único bloco `except`.
     """
-    pass
+
+    def __reduce__(self):
+        # As subclasses têm construtores com argumentos próprios; a reconstrução
+        # padrão (`cls(*args)`) falharia ao devolver o erro de outro processo.
+        return (_reconstruir, (type(self), self.args, self.__dict__))
+
+def _reconstruir(cls, args, atributos):
+    """Recria uma exceção da PixCore sem chamar o seu `__init__` (usado pelo pickle)."""
+    erro = cls.__new__(cls)
+    Exception.__init__(erro, *args)
+    erro.__dict__.update(atributos)
+    return erro
 
 class ChavePixInvalidaError(PixCoreError):
     """
@@ -0,0 +1,261 @@
+"""
+Módulo de Preparação de Logos.
+
+Para centralizar um logo no QR Code, o arquivo precisa ser aberto,
+decodificado, convertido para RGBA e redimensionado para 25% da largura da
+imagem. Em lotes, todas as linhas costumam usar o mesmo logo, e esse trabalho
+se repetiria a cada QR Code.
+
+`LogoAsset` guarda o logo já decodificado e, para cada tamanho de destino, a
+versão redimensionada junto com a sua máscara de transparência. Os logos
+informados por caminho passam por um cache LRU indexado pelo caminho absoluto,
+pela data de modificação e pelo tamanho do arquivo: substituir o arquivo
+invalida a entrada antiga. Uma imagem do Pillow já carregada é preparada uma
+única vez enquanto o próprio objeto existir (ela não deve ser alterada depois
+de usada como logo).
+"""
+from . import exceptions
+from . import utils
+from typing import Any, Optional, Tuple, TYPE_CHECKING, Union
+import base64
+import hashlib
+import io
+import os
+import threading
+import weakref
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+class LogoAsset:
+    """
+    Logo decodificado uma única vez e reaproveitado na geração de vários QR Codes.
+
+    Pode ser passado no lugar de `caminho_logo` em `Pix.qrcode()`,
+    `Pix.save_qrcode()` e `CacheQRCode`.
+
+    Args:
+        origem (str | os.PathLike | Image.Image): O caminho do arquivo do logo ou
+                                                  uma imagem do Pillow já carregada.
+
+    Raises:
+        exceptions.ProcessamentoImagemError: Se o arquivo não existir ou não puder
+                                             ser decodificado.
+
+    Examples:
+        >>> from PIL import Image
+        >>> logo = LogoAsset(Image.new("RGBA", (200, 100), "red"))
+        >>> imagem, mascara = logo.redimensionado(50)
+        >>> imagem.size, imagem.mode, mascara.mode
+        ((50, 25), 'RGBA', 'L')
+    """
+
+    def __init__(self, origem: Union[str, "os.PathLike", "Image.Image"]):
+        from PIL import Image
+
+        if isinstance(origem, Image.Image):
+            self.caminho: Optional[str] = getattr(origem, 'filename', None) or None
+            imagem = origem
+        else:
+            self.caminho = os.fspath(origem)
+            imagem = None
+
+        try:
+            if imagem is None:
+                with Image.open(self.caminho) as arquivo:
+                    imagem = arquivo.convert('RGBA')
+            elif imagem.mode != 'RGBA':
+                imagem = imagem.convert('RGBA')
+            else:
+                imagem = imagem.copy()
+        except FileNotFoundError:
+            raise exceptions.ProcessamentoImagemError(
+                caminho_imagem=self.caminho,
+                motivo="Arquivo não encontrado."
+            ) from None
+        except Exception as e:
+            raise exceptions.ProcessamentoImagemError(
+                caminho_imagem=self.caminho or "<imagem>",
+                motivo=f"Erro desconhecido ao processar o logo: {e}"
+            ) from e
+
+        self.imagem: "Image.Image" = imagem
+        self._identificador: Optional[Tuple[Any, ...]] = None
+        self._redimensionados = utils.LRUCache(tamanho_maximo=8)
+        self._data_uris = utils.LRUCache(tamanho_maximo=8)
+
+    def __getstate__(self):
+        # Os tamanhos já calculados (e a trava do cache) não são enviados a outros processos.
+        return {'caminho': self.caminho, 'imagem': self.imagem, '_identificador': self._identificador}
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self._redimensionados = utils.LRUCache(tamanho_maximo=8)
+        self._data_uris = utils.LRUCache(tamanho_maximo=8)
+
+    @property
+    def identificador(self) -> Tuple[Any, ...]:
+        """Identifica o conteúdo do logo (usado nas chaves do `CacheQRCode`)."""
+        if self._identificador is None:
+            resumo = hashlib.sha256(self.imagem.tobytes()).hexdigest()
+            self._identificador = ("imagem", self.imagem.size, resumo)
+        return self._identificador
+
+    def redimensionado(self, tamanho_maximo: int) -> Tuple["Image.Image", "Image.Image"]:
+        """
+        Retorna o logo reduzido para caber em um quadrado de `tamanho_maximo` pixels.
+
+        A proporção é mantida e o logo nunca é ampliado. O resultado de cada
+        tamanho é guardado, então QR Codes do mesmo tamanho pagam apenas a colagem.
+
+        Args:
+            tamanho_maximo (int): O lado máximo do logo, em pixels.
+
+        Returns:
+            Tuple[Image.Image, Image.Image]: O logo em RGBA e a sua máscara (canal alfa).
+        """
+        return self._redimensionados.obter_ou_calcular(tamanho_maximo, self._redimensionar)
+
+    def _redimensionar(self, tamanho_maximo: int) -> Tuple["Image.Image", "Image.Image"]:
+        imagem = self.imagem.copy()
+        imagem.thumbnail((tamanho_maximo, tamanho_maximo))
+        return imagem, imagem.getchannel('A')
+
+    def data_uri(self, tamanho_maximo: int) -> Tuple[int, int, str]:
+        """
+        Retorna o logo redimensionado (veja `redimensionado()`) como um PNG em data URI.
+
+        Usado para embutir o logo em QR Codes SVG, que assim continuam sendo um
+        único arquivo. O PNG de cada tamanho é codificado uma única vez.
+
+        Args:
+            tamanho_maximo (int): O lado máximo do logo, em pixels.
+
+        Returns:
+            Tuple[int, int, str]: A largura e a altura do logo e o data URI
+                                  (`data:image/png;base64,...`).
+        """
+        return self._data_uris.obter_ou_calcular(tamanho_maximo, self._codificar_data_uri)
+
+    def _codificar_data_uri(self, tamanho_maximo: int) -> Tuple[int, int, str]:
+        imagem, _ = self.redimensionado(tamanho_maximo)
+        destino = io.BytesIO()
+        imagem.save(destino, format="PNG", optimize=True)
+        return imagem.size[0], imagem.size[1], "data:image/png;base64," + base64.b64encode(destino.getvalue()).decode('ascii')
+
+    def aplicar(self, img_qr: "Image.Image") -> "Image.Image":
+        """
+        Cola o logo, com 25% da largura, no centro de uma imagem RGB do QR Code.
+
+        Args:
+            img_qr (Image.Image): A imagem do QR Code (modificada no lugar).
+
+        Returns:
+            Image.Image: A própria `img_qr`.
+        """
+        logo, mascara = self.redimensionado(int(img_qr.size[0] * 0.25))
+        pos_x = (img_qr.size[0] - logo.size[0]) // 2
+        pos_y = (img_qr.size[1] - logo.size[1]) // 2
+        img_qr.paste(logo, (pos_x, pos_y), mask=mascara)
+        return img_qr
+
+_CACHE_LOGOS = utils.LRUCache(tamanho_maximo=16)
+
+# `LogoAsset` de cada imagem do Pillow recebida como logo, indexado por `id()`.
+# A imagem é referenciada fracamente (`Image.Image` não é hashable), e a
+# entrada é removida quando ela é coletada.
+_LOGOS_DE_IMAGENS = {}
+_LOCK_IMAGENS = threading.Lock()
+
+def _identificar_arquivo(caminho: Union[str, "os.PathLike"]) -> Tuple[str, int, int]:
+    """Identifica um arquivo por caminho absoluto, data de modificação e tamanho."""
+    caminho = os.path.abspath(os.fspath(caminho))
+    try:
+        info = os.stat(caminho)
+    except OSError:
+        # Deixa o erro ser reportado ao abrir o arquivo, com a mensagem de sempre.
+        return (caminho, -1, -1)
+    return (caminho, info.st_mtime_ns, info.st_size)
+
+def carregar_logo(caminho: Union[str, "os.PathLike"]) -> LogoAsset:
+    """
+    Retorna o `LogoAsset` de um arquivo, decodificando-o apenas na primeira vez.
+
+    Args:
+        caminho (str | os.PathLike): O caminho do arquivo do logo.
+
+    Returns:
+        LogoAsset: O logo preparado, compartilhado entre as chamadas.
+
+    Raises:
+        exceptions.ProcessamentoImagemError: Se o arquivo não existir ou não puder
+                                             ser decodificado.
+    """
+    chave = _identificar_arquivo(caminho)
+
+    def preparar(_chave) -> LogoAsset:
+        logo = LogoAsset(caminho)
+        logo._identificador = chave
+        return logo
+
+    return _CACHE_LOGOS.obter_ou_calcular(chave, preparar)
+
+def _obter_logo(logo: Union[str, "os.PathLike", "Image.Image", LogoAsset]) -> LogoAsset:
+    """Converte o argumento `caminho_logo` (caminho, imagem ou `LogoAsset`) em um `LogoAsset`."""
+    if isinstance(logo, LogoAsset):
+        return logo
+    if isinstance(logo, (str, os.PathLike)):
+        return carregar_logo(logo)
+    return _logo_da_imagem(logo)
+
+def _logo_da_imagem(imagem: "Image.Image") -> LogoAsset:
+    """Retorna o `LogoAsset` de uma imagem já carregada, preparando-o apenas no primeiro uso."""
+    chave = id(imagem)
+    with _LOCK_IMAGENS:
+        entrada = _LOGOS_DE_IMAGENS.get(chave)
+    if entrada is not None and entrada[0]() is imagem:
+        return entrada[1]
+
+    logo = LogoAsset(imagem)
+
+    def descartar(referencia, chave=chave):
+        with _LOCK_IMAGENS:
+            if _LOGOS_DE_IMAGENS.get(chave, (None,))[0] is referencia:
+                del _LOGOS_DE_IMAGENS[chave]
+
+    with _LOCK_IMAGENS:
+        _LOGOS_DE_IMAGENS[chave] = (weakref.ref(imagem, descartar), logo)
+    return logo
+
+def _identificar_logo(logo) -> Optional[Tuple[Any, ...]]:
+    """Chave de cache do logo, sem decodificar arquivos: caminho, data de modificação e tamanho."""
+    if not logo:
+        return None
+    if isinstance(logo, (str, os.PathLike)):
+        return _identificar_arquivo(logo)
+    return _obter_logo(logo).identificador
+
+def configurar_cache_logos(tamanho_maximo: int):
+    """
+    Define a quantidade máxima de logos (arquivos distintos) mantidos em cache.
+
+    Args:
+        tamanho_maximo (int): A nova capacidade. Com `0`, o cache é desativado.
+    """
+    _CACHE_LOGOS.tamanho_maximo = tamanho_maximo
+
+def estatisticas_cache_logos() -> utils.EstatisticasCache:
+    """
+    Retorna os contadores do cache de logos.
+
+    Returns:
+        utils.EstatisticasCache: Acertos (hits), falhas (misses), descartes
+                                 (evictions), tamanho atual e capacidade.
+    """
+    return _CACHE_LOGOS.estatisticas()
+
+def limpar_cache_logos():
+    """Esvazia o cache de logos e zera os seus contadores."""
+    _CACHE_LOGOS.limpar()
+    with _LOCK_IMAGENS:
+        _LOGOS_DE_IMAGENS.clear()
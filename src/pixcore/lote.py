@@ -0,0 +1,595 @@
+"""
+Módulo de Geração em Lote a partir de arquivos CSV.
+
+Contém a lógica do comando `pixcore lote`, independente da interface de linha
+de comando. O processamento é um pipeline de estágios encadeados:
+
+1. **Leitura**: o CSV é lido linha a linha, sob demanda.
+2. **Validação**: cada linha é convertida em um `PixData`.
+3. **Codificação**: o payload (Copia e Cola) é montado.
+4. **Renderização**: a matriz do QR Code e o PNG (ou SVG) são gerados em
+   blocos, nos processos de um `ProcessPoolExecutor`.
+5. **Escrita**: uma thread dedicada grava os arquivos em disco, um por
+   linha ou agrupados em um container (ZIP, TAR, PDF ou folhas PNG; veja
+   `pixcore.containers`).
+
+Entre os estágios há filas limitadas (`tamanho_buffer`). Quando a renderização
+ou o disco ficam para trás, a leitura do CSV é pausada, de modo que o uso de
+memória não depende do tamanho do arquivo de entrada. Os resultados são
+devolvidos na ordem das linhas do arquivo.
+
+Com `retomar=True`, as linhas concluídas são registradas em um journal
+(`Journal`) no diretório de saída, permitindo continuar um lote interrompido
+a partir da primeira linha não concluída.
+
+Quando apenas os payloads (Copia e Cola) são necessários, `gerar_payloads` e
+`escrever_payloads` geram as strings pelo caminho rápido do `PixTemplate`,
+sem renderizar imagens nem importar o Pillow e o qrcode.
+"""
+from . import brcode, models
+from .brcode import PixTemplate
+from .containers import abrir_destino, container_do_caminho
+from .logo import carregar_logo
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple, Union
+import csv
+import hashlib
+import json
+import os
+import queue
+import threading
+
+SUCESSO = "sucesso"
+IGNORADA = "ignorada"
+ERRO = "erro"
+JA_GERADA = "ja_gerada"
+
+ARQUIVO_JOURNAL = ".pixcore-lote.journal"
+
+class ResultadoLinha(NamedTuple):
+    """
+    Resultado do processamento de uma linha do CSV.
+
+    Attributes:
+        linha (int): O número da linha no arquivo CSV (o cabeçalho é a linha 1).
+        txid (Optional[str]): O TXID da linha, se presente.
+        status (str): `SUCESSO`, `IGNORADA` (dados ausentes ou inválidos), `ERRO` ou
+                      `JA_GERADA` (QR Code gerado em uma execução anterior, ao retomar).
+        motivo (Optional[str]): A descrição do problema, para linhas ignoradas ou com erro.
+    """
+    linha: int
+    txid: Optional[str]
+    status: str
+    motivo: Optional[str] = None
+
+class TarefaLinha(NamedTuple):
+    """Uma linha validada e codificada, pronta para ser renderizada e gravada."""
+    linha: int
+    txid: str
+    payload: str
+    caminho_arquivo: str
+    valor: Optional[float] = None
+
+def numero_de_workers(workers: Optional[int]) -> int:
+    """Retorna a quantidade de processos a usar; `None` ou valores menores que 1 usam o número de CPUs."""
+    if workers is None or workers < 1:
+        return os.cpu_count() or 1
+    return workers
+
+def ler_csv(arquivo_csv: str, offset_inicial: int = 0, linha_inicial: int = 2) -> Iterator[Tuple[int, Dict[str, str], int]]:
+    """
+    Lê o arquivo CSV sob demanda, gerando o número, o conteúdo e o offset de cada linha.
+
+    O offset é a posição, em bytes, do fim da linha no arquivo. Ele permite
+    retomar a leitura logo após uma linha já processada: se `offset_inicial`
+    for informado, a leitura começa nesse ponto, sem reprocessar as linhas
+    anteriores.
+
+    Args:
+        arquivo_csv (str): O caminho do arquivo CSV.
+        offset_inicial (int, optional): Posição, em bytes, onde a leitura começa.
+                                        Defaults to 0 (logo após o cabeçalho).
+        linha_inicial (int, optional): O número da primeira linha lida. Defaults to 2.
+
+    Yields:
+        Tuple[int, Dict[str, str], int]: O número da linha, o seu conteúdo e o offset do fim da linha.
+    """
+    with open(arquivo_csv, mode='rb') as arquivo:
+        campos = next(csv.reader([arquivo.readline().decode('utf-8')]), [])
+        posicao = max(offset_inicial, arquivo.tell())
+        arquivo.seek(posicao)
+
+        def linhas():
+            nonlocal posicao
+            for dados in arquivo:
+                posicao += len(dados)
+                yield dados.decode('utf-8')
+
+        for i, row in enumerate(csv.DictReader(linhas(), fieldnames=campos)):
+            yield linha_inicial + i, row, posicao
+
+def hash_payload(payload: str) -> str:
+    """Retorna um hash curto do payload, usado para reconhecer QR Codes já gerados."""
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+class Journal:
+    """
+    Registro append-only das linhas concluídas de um lote, usado para retomá-lo.
+
+    Cada linha do journal guarda o número da linha do CSV, o offset do seu fim,
+    o TXID e o hash do payload gerado. A primeira linha identifica o CSV (hash
+    do seu início); um journal de outro arquivo é descartado.
+
+    Linhas com dados inválidos também são registradas, pois o erro se repetiria.
+    Já as falhas ao renderizar ou gravar o QR Code não são registradas e, por
+    isso, são refeitas ao retomar.
+
+    Parameters:
+        caminho (str): O caminho do arquivo do journal.
+    """
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+        self.offsets: Dict[int, int] = {}
+        self.hashes: Dict[str, str] = {}
+        self._arquivo = None
+
+    @staticmethod
+    def assinatura(arquivo_csv: str) -> str:
+        """Identifica o arquivo CSV pelo hash dos seus primeiros 64 KiB."""
+        with open(arquivo_csv, 'rb') as arquivo:
+            return hashlib.sha256(arquivo.read(65536)).hexdigest()[:16]
+
+    def carregar(self, assinatura: str) -> bool:
+        """Lê o journal existente; retorna `False` se ele não existir ou for de outro CSV."""
+        try:
+            with open(self.caminho, 'r', encoding='utf-8') as arquivo:
+                if arquivo.readline().rstrip('\n') != f"#pixcore-lote\t{assinatura}":
+                    return False
+                for registro in arquivo:
+                    partes = registro.rstrip('\n').split('\t')
+                    if len(partes) != 4:
+                        continue  # linha incompleta, escrita durante uma interrupção
+                    linha, offset, txid, hash_ = partes
+                    self.offsets[int(linha)] = int(offset)
+                    if hash_ != '-':
+                        self.hashes[txid] = hash_
+        except FileNotFoundError:
+            return False
+        return True
+
+    def ponto_de_retomada(self) -> Tuple[int, int]:
+        """Retorna o número e o offset inicial da primeira linha ainda não concluída."""
+        linha = 1
+        while linha + 1 in self.offsets:
+            linha += 1
+        return linha + 1, self.offsets.get(linha, 0)
+
+    def ja_gerado(self, txid: str, payload: str, caminho_arquivo: str) -> bool:
+        """Verifica se o QR Code deste TXID já foi gerado com o mesmo payload e ainda existe."""
+        hash_ = self.hashes.get(txid)
+        return hash_ is not None and hash_ == hash_payload(payload) and os.path.exists(caminho_arquivo)
+
+    def abrir(self, assinatura: str, novo: bool):
+        """Abre o journal para escrita, recriando-o se `novo` for verdadeiro."""
+        self._arquivo = open(self.caminho, 'w' if novo else 'a', encoding='utf-8', buffering=1)
+        if novo:
+            self._arquivo.write(f"#pixcore-lote\t{assinatura}\n")
+
+    def registrar(self, linha: int, offset: int, txid: Optional[str], hash_: Optional[str]):
+        """Acrescenta uma linha concluída ao journal."""
+        self._arquivo.write(f"{linha}\t{offset}\t{txid or '-'}\t{hash_ or '-'}\n")
+
+    def fechar(self):
+        if self._arquivo is not None:
+            self._arquivo.close()
+            self._arquivo = None
+
+class LinhaCSV(NamedTuple):
+    """Os campos de uma linha do CSV, já com os valores padrão aplicados e o valor convertido."""
+    txid: str
+    chave: str
+    nome: str
+    cidade: str
+    valor: float
+    mcc: str
+    cep: Optional[str]
+    info_adicional: Optional[str]
+
+    def pix_data(self) -> models.PixData:
+        """Monta o `PixData` da cobrança."""
+        return models.PixData(
+            recebedor_nome=self.nome,
+            recebedor_cidade=self.cidade,
+            pix_key=self.chave,
+            valor=self.valor,
+            transacao_id=self.txid,
+            receptor_categoria_code=self.mcc,
+            recebedor_cep=self.cep,
+            info_adicional=self.info_adicional,
+        )
+
+def _processar_linha(linha_num: int, row: Dict[str, str], padroes: Dict[str, Optional[str]], gerar):
+    """
+    Lê os campos de uma linha do CSV e os entrega a `gerar`, a etapa de saída.
+
+    Compartilhada pela geração de QR Codes (`preparar_linha`) e de payloads
+    (`gerar_payloads`), para que as duas tratem as linhas da mesma forma: linhas
+    sem os dados essenciais ou com valor inválido são `IGNORADA`, e qualquer
+    exceção, inclusive de `gerar`, vira um `ERRO`.
+
+    Args:
+        linha_num (int): O número da linha no arquivo CSV.
+        row (Dict[str, str]): O conteúdo da linha.
+        padroes (Dict[str, Optional[str]]): Chave, nome e cidade usados quando a
+                                            linha não os informa.
+        gerar (Callable[[LinhaCSV], Any]): Produz o resultado a partir dos campos da linha.
+
+    Returns:
+        O retorno de `gerar`, ou um `ResultadoLinha` se a linha foi ignorada ou é inválida.
+    """
+    txid = row.get('txid')
+
+    try:
+        final_key = row.get('chave') or padroes.get('key')
+        final_name = row.get('nome') or padroes.get('name')
+        final_city = row.get('cidade') or padroes.get('city')
+        amount_str = row.get('valor')
+
+        if not all([final_key, final_name, final_city, amount_str, txid]):
+            return ResultadoLinha(linha_num, txid, IGNORADA, "Dados essenciais (chave, nome, cidade, valor, txid) estão faltando.")
+
+        try:
+            amount = float(amount_str.replace(',', '.'))
+        except (ValueError, TypeError):
+            return ResultadoLinha(linha_num, txid, IGNORADA, f"Valor '{amount_str}' é inválido.")
+
+        return gerar(LinhaCSV(
+            txid, final_key, final_name, final_city, amount,
+            row.get('mcc', '0000'), row.get('cep'), row.get('info_adicional'),
+        ))
+
+    except Exception as e:
+        return ResultadoLinha(linha_num, txid, ERRO, str(e))
+
+def preparar_linha(linha_num: int, row: Dict[str, str], padroes: Dict[str, Optional[str]], diretorio_saida: str, formato: str = "png") -> Union[TarefaLinha, ResultadoLinha]:
+    """
+    Valida uma linha do CSV e monta o seu payload (estágios de validação e codificação).
+
+    Args:
+        linha_num (int): O número da linha no arquivo CSV.
+        row (Dict[str, str]): O conteúdo da linha.
+        padroes (Dict[str, Optional[str]]): Chave, nome e cidade usados quando a
+                                            linha não os informa.
+        diretorio_saida (str): O diretório onde o QR Code será salvo.
+        formato (str, optional): "png" ou "svg", a extensão do arquivo. Defaults to "png".
+
+    Returns:
+        TarefaLinha | ResultadoLinha: A tarefa de renderização, ou o resultado
+                                      final se a linha foi ignorada ou é inválida.
+    """
+    def gerar(campos: LinhaCSV) -> TarefaLinha:
+        caminho_arquivo = os.path.join(diretorio_saida, f"{campos.txid}.{formato}")
+        return TarefaLinha(linha_num, campos.txid, brcode.Pix(campos.pix_data()).payload(), caminho_arquivo, campos.valor)
+
+    return _processar_linha(linha_num, row, padroes, gerar)
+
+def renderizar_bloco(payloads: List[str], modo: str = "RGB", compress_level: int = 6, optimize: bool = False, caminho_logo: Optional[str] = None, formato: str = "png") -> List[Tuple[bool, Union[bytes, str]]]:
+    """
+    Renderiza um bloco de payloads em PNG ou SVG (estágio de renderização).
+
+    Executada nos processos do pool; por isso nunca levanta exceções. Para
+    cada payload, retorna `(True, bytes_do_arquivo)` ou `(False, motivo_do_erro)`.
+    O logo é preparado uma única vez por processo (cache de `pixcore.logo`).
+    """
+    resultados = []
+    for payload in payloads:
+        try:
+            if formato == "svg":
+                svg = brcode._svg_qrcode(brcode._gerar_matriz(payload), caminho_logo=caminho_logo)
+                resultados.append((True, svg.encode('utf-8')))
+                continue
+            imagem = brcode._render_qrcode(payload, caminho_logo=caminho_logo, modo=modo)
+            resultados.append((True, brcode._codificar_png(imagem, compress_level, optimize)))
+        except Exception as e:
+            resultados.append((False, str(e)))
+    return resultados
+
+class _ExecucaoLocal:
+    """Executor mínimo que roda cada tarefa imediatamente, na thread atual (usado com um único worker)."""
+
+    def submit(self, fn, *args) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        pass
+
+class _Escritor(threading.Thread):
+    """
+    Estágio de escrita: grava os QR Codes no destino em uma thread dedicada.
+
+    Recebe itens por uma fila limitada; quando o disco é mais lento que a
+    renderização, a fila enche e o `put()` do pipeline bloqueia, pausando a
+    leitura do CSV (back-pressure).
+    """
+
+    def __init__(self, tamanho_buffer: int, destino, journal: Optional[Journal] = None):
+        super().__init__(name="pixcore-lote-escritor", daemon=True)
+        self.entrada: queue.Queue = queue.Queue(maxsize=tamanho_buffer)
+        self.saida: queue.SimpleQueue = queue.SimpleQueue()
+        self.destino = destino
+        self.journal = journal
+
+    def run(self):
+        while True:
+            item = self.entrada.get()
+            if item is None:
+                return
+            resultado, offset, hash_, tarefa, dados = item
+            if dados is not None:
+                try:
+                    self.destino.gravar(os.path.basename(tarefa.caminho_arquivo), dados, tarefa.txid, tarefa.valor)
+                except Exception as e:
+                    # Qualquer falha encerraria a thread e travaria o pipeline: vira um erro da linha.
+                    resultado = resultado._replace(status=ERRO, motivo=f"Não foi possível salvar o arquivo '{tarefa.caminho_arquivo}': {e}")
+            # Erros de validação se repetiriam em qualquer execução e são registrados;
+            # falhas ao renderizar ou gravar uma tarefa válida ficam fora do journal e
+            # são refeitas ao retomar.
+            if self.journal is not None and not (resultado.status == ERRO and tarefa is not None):
+                self.journal.registrar(resultado.linha, offset, resultado.txid, hash_)
+            self.saida.put(resultado)
+
+    def concluidos(self) -> Iterator[ResultadoLinha]:
+        """Retorna, sem bloquear, os resultados já gravados."""
+        while True:
+            try:
+                yield self.saida.get_nowait()
+            except queue.Empty:
+                return
+
+def processar_csv(
+    arquivo_csv: str,
+    diretorio_saida: str,
+    padroes: Dict[str, Optional[str]],
+    workers: Optional[int] = None,
+    tamanho_bloco: int = 16,
+    tamanho_buffer: int = 256,
+    retomar: bool = False,
+    modo: str = "RGB",
+    compress_level: int = 6,
+    optimize: bool = False,
+    caminho_logo: Optional[str] = None,
+    formato: str = "png",
+    container: Optional[str] = None,
+    por_pagina: int = 12,
+) -> Iterator[ResultadoLinha]:
+    """
+    Gera os QR Codes de todas as linhas de um arquivo CSV.
+
+    A leitura, validação e codificação acontecem na thread atual; a
+    renderização, em blocos de `tamanho_bloco` linhas, em um
+    `ProcessPoolExecutor`; e a escrita, em uma thread dedicada. Tanto a fila
+    de renderização quanto a de escrita guardam no máximo `tamanho_buffer`
+    linhas, e a renderização e a escrita em disco acontecem em paralelo.
+
+    Com `retomar=True`, as linhas concluídas são registradas no journal
+    `ARQUIVO_JOURNAL` do diretório de saída. Se o journal já existir para o
+    mesmo CSV, a leitura salta direto para a primeira linha não concluída, e
+    as linhas seguintes cujo arquivo já existe com o mesmo payload são
+    reportadas como `JA_GERADA`, sem serem renderizadas novamente.
+
+    Com um `container`, os QR Codes são gravados em poucos arquivos grandes em
+    vez de um arquivo por linha (veja `pixcore.containers`).
+
+    Args:
+        arquivo_csv (str): O caminho do arquivo CSV.
+        diretorio_saida (str): O diretório onde os QR Codes serão salvos ou, com
+                               um container, o arquivo de saída (ex: 'qrcodes.zip').
+        padroes (Dict[str, Optional[str]]): Valores padrão de 'key', 'name' e 'city'.
+        workers (Optional[int], optional): A quantidade de processos. Se `None`,
+                                           usa o número de CPUs. Defaults to None.
+        tamanho_bloco (int, optional): Quantidade de linhas enviadas por vez a
+                                       cada processo. Defaults to 16.
+        tamanho_buffer (int, optional): Quantidade máxima de linhas em cada
+                                        fila entre os estágios. Defaults to 256.
+        retomar (bool, optional): Registra o progresso em um journal e retoma
+                                  uma execução anterior interrompida. Defaults to False.
+        modo (str, optional): O modo dos PNGs: "1", "P" ou "RGB" (veja
+                              `Pix.save_qrcode()`). Defaults to "RGB".
+        compress_level (int, optional): O nível de compressão zlib dos PNGs (0 a 9). Defaults to 6.
+        optimize (bool, optional): Procura a menor codificação de cada PNG. Defaults to False.
+        caminho_logo (Optional[str], optional): O logo centralizado em todos os QR Codes.
+                                                Defaults to None.
+        formato (str, optional): "png" ou "svg" (imagens vetoriais, geradas sem o
+                                 Pillow; `modo`, `compress_level` e `optimize` são
+                                 ignorados). Defaults to "png".
+        container (Optional[str], optional): "diretorio", "zip", "tar", "pdf" ou "folhas".
+                                             Se `None`, é deduzido pela extensão de
+                                             `diretorio_saida`. Defaults to None.
+        por_pagina (int, optional): QR Codes por página do PDF ou por folha. Defaults to 12.
+
+    Yields:
+        ResultadoLinha: O resultado de cada linha, na ordem do arquivo.
+
+    Raises:
+        FileNotFoundError: Se o arquivo CSV não existir.
+        ValueError: Se o formato, o modo de imagem ou o container forem inválidos, se o
+                    container exigir PNGs ("pdf" e "folhas") ou se `retomar` for usado
+                    com um container.
+        exceptions.ProcessamentoImagemError: Se o logo não existir ou for inválido.
+    """
+    if not os.path.isfile(arquivo_csv):
+        raise FileNotFoundError(arquivo_csv)
+    if formato not in ("png", "svg"):
+        raise ValueError(f"Formato '{formato}' inválido. Use 'png' ou 'svg'.")
+    brcode._validar_modo(modo, "black", "white")
+    container = container or container_do_caminho(diretorio_saida)
+    if container in ("pdf", "folhas") and formato != "png":
+        raise ValueError(f"O container '{container}' só aceita o formato 'png'.")
+    if retomar and container != "diretorio":
+        raise ValueError("A retomada só é suportada na gravação em diretório.")
+    if caminho_logo:
+        # Falha logo no início se o logo for inválido, em vez de em cada linha.
+        carregar_logo(caminho_logo)
+
+    destino = abrir_destino(diretorio_saida, container, por_pagina)
+    workers = numero_de_workers(workers)
+    tamanho_buffer = max(1, tamanho_buffer)
+    tamanho_bloco = max(1, min(tamanho_bloco, tamanho_buffer))
+    max_blocos = max(1, tamanho_buffer // tamanho_bloco)
+
+    journal = None
+    linha_inicial, offset_inicial = 2, 0
+    if retomar:
+        journal = Journal(os.path.join(diretorio_saida, ARQUIVO_JOURNAL))
+        assinatura = Journal.assinatura(arquivo_csv)
+        existente = journal.carregar(assinatura)
+        if existente:
+            linha_inicial, offset_inicial = journal.ponto_de_retomada()
+        journal.abrir(assinatura, novo=not existente)
+
+    executor = _ExecucaoLocal() if workers == 1 else ProcessPoolExecutor(max_workers=workers)
+    escritor = _Escritor(tamanho_buffer, destino, journal)
+    escritor.start()
+    pendentes: deque = deque()
+
+    def enviar(bloco):
+        payloads = [item.payload for item, _ in bloco if isinstance(item, TarefaLinha)]
+        pendentes.append((bloco, executor.submit(renderizar_bloco, payloads, modo, compress_level, optimize, caminho_logo, formato)))
+
+    def gravar_mais_antigo():
+        bloco, future = pendentes.popleft()
+        try:
+            renderizados = iter(future.result())
+        except Exception as e:
+            renderizados = iter([(False, str(e))] * len(bloco))
+
+        for item, offset in bloco:
+            if isinstance(item, ResultadoLinha):
+                escritor.entrada.put((item, offset, None, None, None))
+                continue
+            sucesso, dados = next(renderizados)
+            hash_ = hash_payload(item.payload) if journal is not None else None
+            if sucesso:
+                escritor.entrada.put((ResultadoLinha(item.linha, item.txid, SUCESSO), offset, hash_, item, dados))
+            else:
+                escritor.entrada.put((ResultadoLinha(item.linha, item.txid, ERRO, dados), offset, None, item, None))
+
+    try:
+        bloco = []
+        for linha_num, row, offset in ler_csv(arquivo_csv, offset_inicial, linha_inicial):
+            item = preparar_linha(linha_num, row, padroes, diretorio_saida, formato)
+            if journal is not None and isinstance(item, TarefaLinha) and journal.ja_gerado(item.txid, item.payload, item.caminho_arquivo):
+                item = ResultadoLinha(item.linha, item.txid, JA_GERADA)
+            bloco.append((item, offset))
+            if len(bloco) >= tamanho_bloco:
+                enviar(bloco)
+                bloco = []
+                while len(pendentes) > max_blocos:
+                    gravar_mais_antigo()
+                yield from escritor.concluidos()
+
+        if bloco:
+            enviar(bloco)
+        while pendentes:
+            gravar_mais_antigo()
+            yield from escritor.concluidos()
+
+        escritor.entrada.put(None)
+        escritor.join()
+        destino.fechar()
+        yield from escritor.concluidos()
+
+    finally:
+        if escritor.is_alive():
+            escritor.entrada.put(None)
+            escritor.join()
+        destino.fechar()
+        executor.shutdown(wait=True, cancel_futures=True)
+        if journal is not None:
+            journal.fechar()
+
+def gerar_payloads(
+    arquivo_csv: str,
+    padroes: Dict[str, Optional[str]],
+    max_modelos: int = 128,
+) -> Iterator[Tuple[ResultadoLinha, Optional[str]]]:
+    """
+    Gera apenas os payloads (Copia e Cola) de todas as linhas de um arquivo CSV.
+
+    Cada combinação de chave, nome, cidade, MCC e CEP é compilada uma única vez
+    em um `PixTemplate`; as linhas seguintes do mesmo recebedor custam apenas a
+    formatação do valor e o CRC16 do sufixo. Nenhuma imagem é gerada e o
+    Pillow e o qrcode não são importados.
+
+    Args:
+        arquivo_csv (str): O caminho do arquivo CSV.
+        padroes (Dict[str, Optional[str]]): Valores padrão de 'key', 'name' e 'city'.
+        max_modelos (int, optional): Quantidade máxima de recebedores compilados
+                                     mantidos em memória. Defaults to 128.
+
+    Yields:
+        Tuple[ResultadoLinha, Optional[str]]: O resultado de cada linha e o seu
+                                              payload (`None` se a linha falhou).
+
+    Raises:
+        FileNotFoundError: Se o arquivo CSV não existir.
+    """
+    if not os.path.isfile(arquivo_csv):
+        raise FileNotFoundError(arquivo_csv)
+
+    modelos: Dict[Tuple, PixTemplate] = {}
+
+    def modelo_do_recebedor(campos: LinhaCSV) -> PixTemplate:
+        chave_modelo = (campos.chave, campos.nome, campos.cidade, campos.mcc, campos.cep)
+        modelo = modelos.get(chave_modelo)
+        if modelo is None:
+            if len(modelos) >= max_modelos:
+                modelos.clear()
+            modelo = PixTemplate(campos._replace(valor=None, txid="***").pix_data())
+            modelos[chave_modelo] = modelo
+        return modelo
+
+    for linha_num, row, _ in ler_csv(arquivo_csv):
+        resultado = _processar_linha(
+            linha_num, row, padroes,
+            lambda campos: (ResultadoLinha(linha_num, campos.txid, SUCESSO), modelo_do_recebedor(campos).render(campos.valor, campos.txid)),
+        )
+        yield (resultado, None) if isinstance(resultado, ResultadoLinha) else resultado
+
+def escrever_payloads(
+    payloads: Iterable[Tuple[ResultadoLinha, Optional[str]]],
+    destino: TextIO,
+    formato: str = "csv",
+) -> Iterator[ResultadoLinha]:
+    """
+    Escreve os payloads gerados em `destino`, à medida que são produzidos.
+
+    Args:
+        payloads (Iterable[Tuple[ResultadoLinha, Optional[str]]]): A saída de `gerar_payloads`.
+        destino (TextIO): O arquivo (ou a saída padrão) onde os payloads serão escritos.
+        formato (str, optional): "csv" (colunas `txid,payload`, com cabeçalho) ou
+                                 "jsonl" (um objeto JSON por linha). Defaults to "csv".
+
+    Yields:
+        ResultadoLinha: O resultado de cada linha, após a escrita do seu payload.
+    """
+    if formato == "jsonl":
+        def escrever(txid, payload):
+            destino.write(json.dumps({"txid": txid, "payload": payload}, ensure_ascii=False) + "\n")
+    else:
+        writer = csv.writer(destino)
+        writer.writerow(["txid", "payload"])
+        def escrever(txid, payload):
+            writer.writerow([txid, payload])
+
+    for resultado, payload in payloads:
+        if payload is not None:
+            escrever(resultado.txid, payload)
+        yield resultado
@@ -1,9 +1,40 @@
 from . import validate
 from . import exceptions
+from . import utils
 from dataclasses import dataclass
-from typing import Optional
+from decimal import Decimal
+from typing import Any, Dict, NamedTuple, Optional, Union
 import re
 
+_PADRAO_TXID = re.compile(r'^[a-zA-Z0-9]{1,25}$')
+
+def _validar_transacao_id(transacao_id: str):
+    """Valida o ID da Transação (TXID), levantando `GeracaoPayloadError` se for inválido."""
+    if transacao_id != '***' and not (isinstance(transacao_id, str) and _PADRAO_TXID.match(transacao_id)):
+        raise exceptions.GeracaoPayloadError('transacao_id', "O ID da Transação (transacao_id) deve ser alfanumérico com até 25 caracteres.")
+
+def _validar_valor(valor: Optional[Union[float, Decimal]]):
+    """Valida o valor da transação, levantando `GeracaoPayloadError` se não for positivo."""
+    if valor is not None and valor <= 0:
+        raise exceptions.GeracaoPayloadError('valor', "O valor (valor), se presente, deve ser positivo.")
+
+def _validar_centavos(valor: Optional[Union[float, Decimal]], valor_centavos: Optional[int]):
+    """Valida o valor em centavos, levantando `GeracaoPayloadError` se não for um inteiro positivo."""
+    if valor_centavos is None:
+        return
+    if valor is not None:
+        raise exceptions.GeracaoPayloadError('valor_centavos', "Informe o valor em reais (valor) ou em centavos (valor_centavos), não ambos.")
+    if isinstance(valor_centavos, bool) or not isinstance(valor_centavos, int) or valor_centavos <= 0:
+        raise exceptions.GeracaoPayloadError('valor_centavos', "O valor em centavos (valor_centavos), se presente, deve ser um inteiro positivo.")
+
+def _formatar_valor(valor: Optional[Union[float, Decimal]], valor_centavos: Optional[int]) -> Optional[str]:
+    """Formata o valor do campo 54 ("NNN.NN"), ou retorna `None` para um valor aberto."""
+    if valor_centavos is not None:
+        return utils.format_cents(valor_centavos)
+    if valor:
+        return f"{valor:.2f}"
+    return None
+
 @dataclass
 class PixData:
     """
@@ -18,8 +49,9 @@ class PixData:
         recebedor_nome (str): Nome do recebedor/comerciante. Deve ter entre 3 e 25 bytes.
         recebedor_cidade (str): Cidade do recebedor/comerciante. Deve ter entre 3 e 15 bytes.
         pix_key (str): Chave Pix do recebedor (e-mail, CPF/CNPJ, celular ou chave aleatória). Máximo de 77 caracteres.
-        valor (Optional[float]): O valor da transação. Se for `None` ou `0`, o QR Code será gerado com valor aberto,
-                                 permitindo que o pagador insira o valor.
+        valor (Optional[float | Decimal]): O valor da transação, em reais. Se for `None`, o QR Code será gerado
+                                 com valor aberto, permitindo que o pagador insira o valor. Use `Decimal`
+                                 (ou `valor_centavos`) para evitar a imprecisão do `float`.
         transacao_id (str): Identificador da transação (TXID). Deve ser alfanumérico com até 25 caracteres.
                             O padrão '***' indica que não é utilizado um TXID específico.
         ponto_iniciacao_metodo (Optional[str]): Define se o QR Code é estático ('11') ou dinâmico ('12').
@@ -31,6 +63,8 @@ class PixData:
         idioma_preferencia (Optional[str]): Idioma para dados alternativos (ex: "pt_BR").
         recebedor_nome_alt (Optional[str]): Nome alternativo do recebedor (em outro idioma).
         recebedor_cidade_alt (Optional[str]): Cidade alternativa do recebedor (em outro idioma).
+        valor_centavos (Optional[int]): O valor da transação em centavos inteiros (ex: `1990` para R$ 19,90).
+                                        Alternativa exata a `valor`; apenas um dos dois pode ser informado.
 
     Raises:
         exceptions.GeracaoPayloadError: Se qualquer um dos campos não atender às regras
@@ -51,7 +85,7 @@ class PixData:
     recebedor_nome: str
     recebedor_cidade: str
     pix_key: str
-    valor: Optional[float] = None
+    valor: Optional[Union[float, Decimal]] = None
     transacao_id: str = "***"
     ponto_iniciacao_metodo: Optional[str] = None
     receptor_categoria_code: str = "0000"
@@ -60,6 +94,7 @@ class PixData:
     idioma_preferencia: Optional[str] = None
     recebedor_nome_alt: Optional[str] = None
     recebedor_cidade_alt: Optional[str] = None
+    valor_centavos: Optional[int] = None
 
     def __post_init__(self):
         """
@@ -74,16 +109,15 @@ class PixData:
         if not self.recebedor_cidade or len(self.recebedor_cidade.encode('utf-8')) > 15 or len(self.recebedor_cidade) < 3:
             raise exceptions.GeracaoPayloadError('recebedor_cidade', "A cidade do recebedor (recebedor_cidade) é obrigatória e deve ter entre 3 e 15 bytes.")
 
-        if self.transacao_id != '***' and not re.match(r'^[a-zA-Z0-9]{1,25}$', self.transacao_id):
-            raise exceptions.GeracaoPayloadError('transacao_id', "O ID da Transação (transacao_id) deve ser alfanumérico com até 25 caracteres.")
+        _validar_transacao_id(self.transacao_id)
 
         if not self.pix_key or len(self.pix_key) > 77: 
             raise exceptions.GeracaoPayloadError('pix_key', "A chave Pix (pix_key) é obrigatória e deve ter até 77 caracteres.")
         elif self.tipo_chave() == "Tipo Desconhecido":
             raise exceptions.ChavePixInvalidaError(self.pix_key,"O formato da chave Pix (pix_key) não é reconhecido.")
             
-        if self.valor is not None and self.valor <= 0:
-            raise exceptions.GeracaoPayloadError('valor', "O valor (valor), se presente, deve ser positivo.")
+        _validar_valor(self.valor)
+        _validar_centavos(self.valor, self.valor_centavos)
             
         if self.recebedor_cep and not re.match(r'^\d{8}$', self.recebedor_cep):
             raise exceptions.GeracaoPayloadError('recebedor_cep', "O CEP (recebedor_cep) deve conter 8 dígitos numéricos.")
@@ -93,22 +127,85 @@ class PixData:
         Identifica o tipo da chave Pix com base em seu formato.
 
         A verificação é feita em uma ordem específica para evitar falsos positivos
-        (ex: um CPF ser confundido com um telefone).
+        (ex: um CPF ser confundido com um telefone). O resultado é reaproveitado
+        do cache de `validate.tipo_chave`, então cobranças repetidas para o mesmo
+        recebedor não refazem a validação.
 
         Returns:
             str: O tipo da chave (ex: "CPF", "Email", "Tipo Desconhecido").
         """
-        chave = self.pix_key
-
-        if validate.validar_chave_aleatoria(chave):
-            return "Chave Aleatória (EVP)"
-        elif '@' in chave and validate.validar_email(chave):
-            return "Email"
-        elif validate.validar_telefone(chave):
-            return "Telefone"
-        elif validate.validar_cpf(chave):
-            return "CPF"  
-        elif validate.validar_cnpj(chave):
-            return "CNPJ"
-        else:
-            return "Tipo Desconhecido"
\ No newline at end of file
+        return validate.tipo_chave(self.pix_key)
+
+    def centavos(self) -> Optional[int]:
+        """
+        Retorna o valor da transação em centavos inteiros, de forma exata.
+
+        Returns:
+            Optional[int]: O valor em centavos, ou `None` se o valor for aberto.
+        """
+        if self.valor_centavos is not None:
+            return self.valor_centavos
+        if self.valor:
+            return utils.to_cents(self.valor)
+        return None
+
+class DecodedPix(NamedTuple):
+    """
+    Registro compacto com os dados de um BR Code Pix decodificado.
+
+    É a alternativa ao dicionário retornado por `decipher.decode` quando muitos
+    payloads decodificados precisam ficar em memória: por ser uma tupla, não
+    guarda um dicionário nem as chaves de cada campo por instância. Campos
+    ausentes no payload ficam como `None`.
+
+    Attributes:
+        payload_format_indicator (Optional[str]): Indicador de formato do payload (ID 00).
+        point_of_initiation_method (Optional[str]): Método de iniciação, '11' ou '12' (ID 01).
+        gui (Optional[str]): Identificador do arranjo, "BR.GOV.BCB.PIX" (ID 26.00).
+        pix_key (Optional[str]): Chave Pix do recebedor (ID 26.01).
+        merchant_category_code (Optional[str]): Código da categoria do comerciante (ID 52).
+        transaction_currency (Optional[str]): Código da moeda, "986" para o Real (ID 53).
+        transaction_amount (Optional[float]): Valor da transação (ID 54).
+        transaction_amount_cents (Optional[int]): Valor exato da transação, em centavos (ID 54).
+        country_code (Optional[str]): Código do país (ID 58).
+        merchant_name (Optional[str]): Nome do recebedor (ID 59).
+        merchant_city (Optional[str]): Cidade do recebedor (ID 60).
+        postal_code (Optional[str]): CEP do recebedor (ID 61).
+        transaction_id (Optional[str]): ID da transação, TXID (ID 62.05).
+        language_preference (Optional[str]): Idioma dos dados alternativos (ID 64.00).
+        merchant_name_alt (Optional[str]): Nome alternativo do recebedor (ID 64.01).
+        merchant_city_alt (Optional[str]): Cidade alternativa do recebedor (ID 64.02).
+
+    Examples:
+        >>> registro = DecodedPix(merchant_name="EMPRESA MODELO", transaction_amount_cents=1050)
+        >>> registro.merchant_name
+        'EMPRESA MODELO'
+        >>> registro.to_dict()
+        {'transaction_amount_cents': 1050, 'merchant_name': 'EMPRESA MODELO'}
+    """
+    payload_format_indicator: Optional[str] = None
+    point_of_initiation_method: Optional[str] = None
+    gui: Optional[str] = None
+    pix_key: Optional[str] = None
+    merchant_category_code: Optional[str] = None
+    transaction_currency: Optional[str] = None
+    transaction_amount: Optional[float] = None
+    transaction_amount_cents: Optional[int] = None
+    country_code: Optional[str] = None
+    merchant_name: Optional[str] = None
+    merchant_city: Optional[str] = None
+    postal_code: Optional[str] = None
+    transaction_id: Optional[str] = None
+    language_preference: Optional[str] = None
+    merchant_name_alt: Optional[str] = None
+    merchant_city_alt: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converte o registro no dicionário retornado por `decipher.decode` (mais o
+        campo `transaction_amount_cents`, exclusivo do registro).
+
+        Returns:
+            Dict[str, Any]: Os campos presentes no payload (os campos `None` são omitidos).
+        """
+        return {campo: valor for campo, valor in zip(self._fields, self) if valor is not None}
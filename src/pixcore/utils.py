@@ -1,5 +1,15 @@
-from typing import Generator, Tuple
+from typing import Any, Generator, List, NamedTuple, Tuple, Union
 from . import exceptions
+from collections import OrderedDict
+from decimal import Decimal, ROUND_HALF_EVEN
+import operator
+import sys
+import threading
+
+try:
+    from binascii import crc_hqx as _crc_hqx
+except ImportError:  # pragma: no cover - implementações sem o módulo em C
+    _crc_hqx = None
 
 def format_tlv(id_field: str, value: str) -> str:
     """
@@ -26,17 +36,57 @@ def format_tlv(id_field: str, value: str) -> str:
     length = str(len(value)).zfill(2)
     return f"{id_field}{length}{value}"
 
-def calculate_crc16(payload: str) -> str:
+def _build_crc16_table() -> Tuple[int, ...]:
+    """Pré-calcula a tabela de 256 entradas do CRC-16/CCITT-FALSE (polinômio 0x1021)."""
+    table = []
+    for byte in range(256):
+        crc = byte << 8
+        for _ in range(8):
+            if crc & 0x8000:
+                crc = (crc << 1) ^ 0x1021
+            else:
+                crc <<= 1
+        table.append(crc & 0xFFFF)
+    return tuple(table)
+
+_CRC16_TABLE = _build_crc16_table()
+
+def _crc16_table_update(data: Union[bytes, bytearray, memoryview], crc: int = 0xFFFF) -> int:
+    """Atualiza o CRC16 byte a byte usando a tabela pré-calculada (implementação pura em Python)."""
+    table = _CRC16_TABLE
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFF) ^ table[(crc >> 8) ^ byte]
+    return crc
+
+# `binascii.crc_hqx` implementa exatamente o CRC-16/CCITT (polinômio 0x1021) em C.
+# Quando disponível, é usado no lugar da tabela em Python.
+_crc16_update = _crc_hqx if _crc_hqx is not None else _crc16_table_update
+
+def _as_bytes(data: Union[str, bytes, bytearray, memoryview]) -> Union[bytes, bytearray, memoryview]:
+    """Converte a entrada do CRC para um objeto de bytes sem cópias desnecessárias."""
+    if isinstance(data, str):
+        return data.encode('utf-8')
+    if isinstance(data, memoryview) and data.format != 'B':
+        return data.cast('B')
+    return data
+
+def calculate_crc16(payload: Union[str, bytes, bytearray, memoryview]) -> str:
     """
     Calcula o checksum CRC16-CCITT do payload.
 
     O cálculo é realizado conforme o padrão EMV® QRCPS, que utiliza o polinômio
-    0x1021 e valor inicial 0xFFFF. O resultado é uma string hexadecimal de 4
-    caracteres.
+    0x1021 e valor inicial 0xFFFF (CRC-16/CCITT-FALSE). O resultado é uma string
+    hexadecimal de 4 caracteres.
+
+    A implementação usa uma tabela pré-calculada de 256 entradas e, quando
+    disponível, o backend em C `binascii.crc_hqx`. Além de `str`, aceita
+    `bytes`, `bytearray` e `memoryview`, evitando a recodificação do payload
+    quando ele já está em bytes.
 
     Args:
-        payload (str): O payload completo (sem o campo do CRC) para o qual o
-                       checksum será calculado.
+        payload (str | bytes | bytearray | memoryview): O payload completo (sem o
+            campo do CRC) para o qual o checksum será calculado. Strings são
+            codificadas em UTF-8.
 
     Returns:
         str: O checksum CRC16 calculado, formatado como uma string hexadecimal
@@ -45,20 +95,56 @@ def calculate_crc16(payload: str) -> str:
     Examples:
         >>> payload_exemplo = "00020126360014BR.GOV.BCB.PIX0114+5561999999999520400005303986540510.005802BR5913FULANO DE TAL6008BRASILIA62070503***6304"
         >>> calculate_crc16(payload_exemplo)
-        'E3A2'
+        'B15A'
+        >>> calculate_crc16(payload_exemplo.encode('utf-8')) == calculate_crc16(payload_exemplo)
+        True
     """
-    crc = 0xFFFF
-    polynomial = 0x1021
+    return '%04X' % _crc16_update(_as_bytes(payload), 0xFFFF)
 
-    for byte in payload.encode('utf-8'):
-        crc ^= (byte << 8)
-        for _ in range(8):
-            if (crc & 0x8000):
-                crc = (crc << 1) ^ polynomial
-            else:
-                crc <<= 1
-    
-    return format(crc & 0xFFFF, 'X').zfill(4)
+class CRC16:
+    """
+    Estado incremental (retomável) do cálculo do CRC16-CCITT.
+
+    Permite processar o payload em partes, guardar o estado após um prefixo
+    fixo e reaproveitá-lo para vários sufixos diferentes, sem recalcular o
+    checksum desde o início. A interface segue a do módulo `hashlib`.
+
+    Args:
+        data (str | bytes | bytearray | memoryview, optional): Dados iniciais
+            a serem processados. Defaults to b"".
+
+    Examples:
+        >>> prefixo = CRC16("000201")
+        >>> estado = prefixo.copy()
+        >>> estado.update("6304")
+        >>> estado.digest() == calculate_crc16("0002016304")
+        True
+    """
+    __slots__ = ('_crc',)
+
+    def __init__(self, data: Union[str, bytes, bytearray, memoryview] = b""):
+        self._crc = 0xFFFF
+        if data:
+            self.update(data)
+
+    def update(self, data: Union[str, bytes, bytearray, memoryview]) -> None:
+        """Processa mais dados, continuando a partir do estado atual."""
+        self._crc = _crc16_update(_as_bytes(data), self._crc)
+
+    def copy(self) -> "CRC16":
+        """Retorna uma cópia independente do estado atual."""
+        clone = CRC16.__new__(CRC16)
+        clone._crc = self._crc
+        return clone
+
+    def digest(self) -> str:
+        """Retorna o CRC16 dos dados processados até aqui, no mesmo formato de `calculate_crc16`."""
+        return '%04X' % self._crc
+
+    @property
+    def value(self) -> int:
+        """O valor inteiro (16 bits) do CRC16 dos dados processados até aqui."""
+        return self._crc
 
 def parse_tlv(payload: str) -> Generator[Tuple[str, int, str], None, None]:
     """
@@ -97,4 +183,333 @@ def parse_tlv(payload: str) -> Generator[Tuple[str, int, str], None, None]:
         value = payload[index : index + value_length]
         index += value_length
 
-        yield (id_field, value_length,value)
\ No newline at end of file
+        yield (id_field, value_length,value)
+
+def tlv_view(data: Union[str, bytes, bytearray, memoryview]) -> memoryview:
+    """
+    Cria a visão (`memoryview`) sobre a qual `scan_tlv` percorre um payload.
+
+    Payloads ASCII (o caso comum) são vistos byte a byte, sem cópia quando já
+    estão em `bytes`. Payloads com caracteres fora do ASCII são vistos como
+    pontos de código (UTF-32), para que os tamanhos do TLV, que contam
+    caracteres, continuem alinhados aos offsets.
+
+    Args:
+        data (str | bytes | bytearray | memoryview): O payload. Bytes são
+            interpretados como UTF-8.
+
+    Returns:
+        memoryview: Uma visão de formato 'B' (ASCII) ou 'I' (pontos de código).
+    """
+    if isinstance(data, str):
+        if data.isascii():
+            return memoryview(data.encode('ascii'))
+        return memoryview(data.encode('utf-32-le')).cast('I')
+    if isinstance(data, memoryview):
+        if data.format == 'I':
+            return data
+        bruto = data.cast('B') if data.format != 'B' else data
+        ascii_ = bruto.tobytes().isascii()
+    else:
+        bruto = memoryview(data)
+        ascii_ = data.isascii()
+    if ascii_:
+        return bruto
+    return memoryview(str(bruto, 'utf-8').encode('utf-32-le')).cast('I')
+
+def tlv_value(view: memoryview, start: int, end: int) -> str:
+    """
+    Materializa como `str` o trecho `[start, end)` de uma visão criada por `tlv_view`.
+
+    Args:
+        view (memoryview): A visão do payload.
+        start (int): O offset inicial.
+        end (int): O offset final (exclusivo).
+
+    Returns:
+        str: O valor do campo.
+    """
+    if view.format == 'I':
+        return view[start:end].tobytes().decode('utf-32-le')
+    return str(view[start:end], 'utf-8')
+
+def scan_tlv(
+    data: Union[str, bytes, bytearray, memoryview],
+    start: int = 0,
+    end: Union[int, None] = None,
+) -> Generator[Tuple[str, int, int], None, None]:
+    """
+    Percorre os campos TLV de um payload retornando apenas os offsets de cada valor.
+
+    Diferente de `parse_tlv`, nenhuma substring é criada: para cada campo são
+    retornados o ID e o intervalo `[inicio, fim)` do seu valor. Campos aninhados
+    (ex: IDs 26, 62 e 64) são percorridos chamando `scan_tlv` novamente sobre a
+    mesma visão, com o intervalo do campo pai, e os valores só são materializados
+    com `tlv_value` quando necessários.
+
+    Args:
+        data (str | bytes | bytearray | memoryview): O payload. Uma `memoryview`
+            é usada como está, como se tivesse sido criada por `tlv_view`
+            (recomendado ao percorrer campos aninhados).
+        start (int, optional): O offset onde a leitura começa. Defaults to 0.
+        end (int | None, optional): O offset onde a leitura termina. Defaults to
+            o fim do payload.
+
+    Yields:
+        Generator[Tuple[str, int, int], None, None]: Uma tupla contendo (ID, início, fim).
+
+    Raises:
+        exceptions.DecodificacaoPayloadError: Se o tamanho de um campo não for um
+                                               número de dois dígitos.
+
+    Examples:
+        >>> view = tlv_view("5303986" "62070503***")
+        >>> campos = list(scan_tlv(view))
+        >>> campos
+        [('53', 4, 7), ('62', 11, 18)]
+        >>> [(id_field, tlv_value(view, i, f)) for id_field, i, f in scan_tlv(view, *campos[1][1:])]
+        [('05', '***')]
+    """
+    view = data if isinstance(data, memoryview) else tlv_view(data)
+    if end is None:
+        end = len(view)
+
+    index = start
+    while index < end:
+        if index + 4 <= end:
+            dezena = view[index + 2] - 48
+            unidade = view[index + 3] - 48
+        else:
+            dezena = unidade = -1
+
+        if not (0 <= dezena <= 9 and 0 <= unidade <= 9):
+            length_str = tlv_value(view, min(index + 2, end), min(index + 4, end))
+            raise exceptions.DecodificacaoPayloadError(
+                f"Tamanho de campo inválido. Esperava um número, mas recebi '{length_str}'."
+            )
+
+        id_field = chr(view[index]) + chr(view[index + 1])
+        inicio = index + 4
+        index = inicio + dezena * 10 + unidade
+        yield (id_field, inicio, index if index < end else end)
+
+def format_cents(centavos: int) -> str:
+    """
+    Formata um valor inteiro em centavos como "NNN.NN", sem passar por `float`.
+
+    Args:
+        centavos (int): O valor em centavos.
+
+    Returns:
+        str: O valor em reais com duas casas decimais.
+
+    Examples:
+        >>> format_cents(15075)
+        '150.75'
+        >>> format_cents(5)
+        '0.05'
+    """
+    if centavos < 0:
+        return "-" + format_cents(-centavos)
+    reais, resto = divmod(centavos, 100)
+    return f"{reais}.{resto:02d}"
+
+def parse_cents(texto: str) -> int:
+    """
+    Converte um valor em reais no formato "NNN.NN" para centavos, sem passar por `float`.
+
+    Valores com mais de duas casas decimais são arredondados como em `f"{valor:.2f}"`
+    (metade para o par).
+
+    Args:
+        texto (str): O valor em reais (ex: "150.75", "10", "0.5").
+
+    Returns:
+        int: O valor em centavos.
+
+    Raises:
+        ValueError: Se o texto não for um número válido.
+
+    Examples:
+        >>> parse_cents("150.75")
+        15075
+        >>> parse_cents("10.5")
+        1050
+    """
+    inteiro, _, fracao = texto.partition('.')
+    if inteiro.isascii() and inteiro.isdigit() and len(fracao) <= 2 and (not fracao or (fracao.isascii() and fracao.isdigit())):
+        return int(inteiro) * 100 + (int(fracao) * (10 if len(fracao) == 1 else 1) if fracao else 0)
+    try:
+        return to_cents(Decimal(texto))
+    except (ArithmeticError, TypeError):
+        raise ValueError(f"Valor '{texto}' é inválido.") from None
+
+def to_cents(valor: Union[int, float, Decimal, str]) -> int:
+    """
+    Converte um valor em reais para centavos inteiros, de forma exata.
+
+    Inteiros e `Decimal` são convertidos sem perda. Valores `float` são
+    arredondados exatamente como no payload (`f"{valor:.2f}"`), de modo que
+    `format_cents(to_cents(valor))` reproduz o campo de valor gerado.
+
+    Args:
+        valor (int | float | Decimal | str): O valor em reais.
+
+    Returns:
+        int: O valor em centavos.
+
+    Raises:
+        ValueError: Se o valor não for um número finito.
+        TypeError: Se o tipo do valor não for suportado.
+
+    Examples:
+        >>> to_cents(Decimal("19.90"))
+        1990
+        >>> to_cents(10)
+        1000
+    """
+    if isinstance(valor, float):
+        return parse_cents(f"{valor:.2f}")
+    if isinstance(valor, Decimal):
+        if not valor.is_finite():
+            raise ValueError(f"Valor '{valor}' é inválido.")
+        return int(valor.quantize(_UM_CENTAVO, rounding=ROUND_HALF_EVEN).scaleb(2))
+    if isinstance(valor, str):
+        return parse_cents(valor)
+    if isinstance(valor, bool):
+        raise TypeError(f"Valor '{valor}' é inválido.")
+    return operator.index(valor) * 100
+
+_UM_CENTAVO = Decimal("0.01")
+
+class EstatisticasCache(NamedTuple):
+    """
+    Contadores de uso de um `LRUCache`.
+
+    Attributes:
+        hits (int): Consultas atendidas pelo cache.
+        misses (int): Consultas que precisaram calcular o valor.
+        evictions (int): Entradas descartadas por falta de espaço.
+        tamanho (int): Quantidade atual de entradas.
+        tamanho_maximo (int): Capacidade do cache.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    tamanho: int
+    tamanho_maximo: int
+
+_AUSENTE = object()
+
+class LRUCache:
+    """
+    Cache limitado, seguro para uso entre threads, que descarta a entrada menos usada.
+
+    Args:
+        tamanho_maximo (int, optional): Quantidade máxima de entradas. Com `0`, o
+                                        cache fica desativado. Defaults to 1024.
+
+    Examples:
+        >>> cache = LRUCache(tamanho_maximo=2)
+        >>> cache.obter_ou_calcular("a", str.upper)
+        'A'
+        >>> cache.obter_ou_calcular("a", str.upper)
+        'A'
+        >>> cache.estatisticas()
+        EstatisticasCache(hits=1, misses=1, evictions=0, tamanho=1, tamanho_maximo=2)
+    """
+
+    def __init__(self, tamanho_maximo: int = 1024):
+        if tamanho_maximo < 0:
+            raise ValueError("O tamanho máximo do cache não pode ser negativo.")
+        self._tamanho_maximo = tamanho_maximo
+        self._dados: "OrderedDict[Any, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def tamanho_maximo(self) -> int:
+        """A capacidade do cache. Reduzi-la descarta as entradas menos usadas."""
+        return self._tamanho_maximo
+
+    @tamanho_maximo.setter
+    def tamanho_maximo(self, tamanho_maximo: int):
+        if tamanho_maximo < 0:
+            raise ValueError("O tamanho máximo do cache não pode ser negativo.")
+        with self._lock:
+            self._tamanho_maximo = tamanho_maximo
+            self._descartar_excedente()
+
+    def _descartar_excedente(self):
+        while len(self._dados) > self._tamanho_maximo:
+            self._dados.popitem(last=False)
+            self._evictions += 1
+
+    def obter_ou_calcular(self, chave: Any, funcao: Any) -> Any:
+        """
+        Retorna o valor em cache para `chave` ou o calcula com `funcao(chave)`.
+
+        O cálculo é feito fora da trava, então duas threads podem calcular o
+        mesmo valor ao mesmo tempo; apenas um dos resultados é guardado.
+
+        Args:
+            chave (Any): A chave da consulta (deve ser hashable).
+            funcao (Callable): Função que calcula o valor a partir da chave.
+
+        Returns:
+            Any: O valor associado à chave.
+        """
+        with self._lock:
+            valor = self._dados.get(chave, _AUSENTE)
+            if valor is not _AUSENTE:
+                self._dados.move_to_end(chave)
+                self._hits += 1
+                return valor
+            self._misses += 1
+
+        valor = funcao(chave)
+
+        with self._lock:
+            if self._tamanho_maximo:
+                self._dados[chave] = valor
+                self._dados.move_to_end(chave)
+                self._descartar_excedente()
+        return valor
+
+    def limpar(self):
+        """Remove todas as entradas e zera os contadores."""
+        with self._lock:
+            self._dados.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def estatisticas(self) -> EstatisticasCache:
+        """Retorna os contadores de uso do cache."""
+        with self._lock:
+            return EstatisticasCache(self._hits, self._misses, self._evictions, len(self._dados), self._tamanho_maximo)
+
+    def __len__(self) -> int:
+        return len(self._dados)
+
+    def __contains__(self, chave: Any) -> bool:
+        return chave in self._dados
+
+def _is_ndarray(obj: Any) -> bool:
+    """Verifica se `obj` é um `numpy.ndarray` sem importar o NumPy quando ele ainda não foi carregado."""
+    numpy = sys.modules.get('numpy')
+    return numpy is not None and isinstance(obj, numpy.ndarray)
+
+def _import_numpy():
+    """Importa o NumPy sob demanda, retornando `None` se ele não estiver instalado."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+def _as_list(column: Any) -> List[Any]:
+    """Converte uma coluna (lista, tupla, `array.array` ou `numpy.ndarray`) em uma lista Python."""
+    if hasattr(column, 'tolist'):
+        return column.tolist()
+    return list(column)
@@ -1,6 +1,28 @@
+from . import utils
+from typing import Any, List, Optional, Sequence, Tuple, Union
+import operator
 import re
 import uuid
 
+_PADRAO_EMAIL = re.compile(r'^[\w\.-]+@[\w\.-]+\.[a-zA-Z]{2,}$')
+_PADRAO_UUID = re.compile(r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}')
+_PADRAO_NAO_DIGITO = re.compile(r'\D')
+_PADRAO_DIGITO = re.compile(r'\d')
+
+_DDDS_VALIDOS = frozenset({
+    '11', '12', '13', '14', '15', '16', '17', '18', '19', '21', '22', '24',
+    '27', '28', '31', '32', '33', '34', '35', '37', '38', '41', '42', '43',
+    '44', '45', '46', '47', '48', '49', '51', '53', '54', '55', '61', '62',
+    '63', '64', '65', '66', '67', '68', '69', '71', '73', '74', '75', '77',
+    '79', '81', '82', '83', '84', '85', '86', '87', '88', '89', '91', '92',
+    '93', '94', '95', '96', '97', '98', '99'
+})
+
+_PESOS_CPF_DV1 = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+_PESOS_CPF_DV2 = (11, 10, 9, 8, 7, 6, 5, 4, 3, 2)
+_PESOS_CNPJ_DV1 = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+_PESOS_CNPJ_DV2 = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+
 def validar_cpf(cpf: str) -> bool:
     """
     Valida um número de Cadastro de Pessoas Físicas (CPF).
@@ -17,34 +39,30 @@ def validar_cpf(cpf: str) -> bool:
         bool: Retorna `True` se o CPF for válido, e `False` caso contrário.
     """
     cpf = ''.join(filter(str.isdigit, cpf))
+    return _digitos_cpf_validos(cpf)
 
+def _digitos_cpf_validos(cpf: str) -> bool:
+    """Valida os dígitos verificadores de um CPF já reduzido aos seus dígitos."""
     if len(cpf) != 11:
         return False
 
     if cpf == cpf[0] * 11:
         return False
 
-    soma = 0
-    for i in range(9):
-        soma += int(cpf[i]) * (10 - i)
+    soma = sum(int(digito) * peso for digito, peso in zip(cpf, _PESOS_CPF_DV1))
     primeiro_digito = 11 - (soma % 11)
     if primeiro_digito >= 10:
         primeiro_digito = 0
 
     if int(cpf[9]) != primeiro_digito:
         return False
-    
-    soma = 0
-    for i in range(10):
-        soma += int(cpf[i]) * (11 - i)
-    segundo_digito = 11 - (soma % 11)
 
+    soma = sum(int(digito) * peso for digito, peso in zip(cpf, _PESOS_CPF_DV2))
+    segundo_digito = 11 - (soma % 11)
     if segundo_digito >= 10:
         segundo_digito = 0
 
-    if int(cpf[10]) != segundo_digito:
-        return False
-    return True
+    return int(cpf[10]) == segundo_digito
 
 def validar_cnpj(cnpj: str) -> bool:
     """
@@ -61,8 +79,11 @@ def validar_cnpj(cnpj: str) -> bool:
     Returns:
         bool: Retorna `True` se o CNPJ for válido, e `False` caso contrário.
     """
-    cnpj = "".join(re.findall(r'\d', str(cnpj)))
+    cnpj = "".join(_PADRAO_DIGITO.findall(str(cnpj)))
+    return _digitos_cnpj_validos(cnpj)
 
+def _digitos_cnpj_validos(cnpj: str) -> bool:
+    """Valida os dígitos verificadores de um CNPJ já reduzido aos seus dígitos."""
     if len(cnpj) != 14:
         return False
 
@@ -72,9 +93,7 @@ def validar_cnpj(cnpj: str) -> bool:
     cnpj_base = [int(d) for d in cnpj[:12]]
     digitos_verificadores = [int(d) for d in cnpj[12:]]
 
-    pesos_dv1 = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-    soma_dv1 = sum(num * peso for num, peso in zip(cnpj_base, pesos_dv1))
-    
+    soma_dv1 = sum(num * peso for num, peso in zip(cnpj_base, _PESOS_CNPJ_DV1))
     resto_dv1 = soma_dv1 % 11
     dv1_calculado = 0 if resto_dv1 < 2 else 11 - resto_dv1
 
@@ -82,16 +101,162 @@ def validar_cnpj(cnpj: str) -> bool:
         return False
 
     cnpj_com_dv1 = cnpj_base + [dv1_calculado]
-    pesos_dv2 = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-    soma_dv2 = sum(num * peso for num, peso in zip(cnpj_com_dv1, pesos_dv2))
-
+    soma_dv2 = sum(num * peso for num, peso in zip(cnpj_com_dv1, _PESOS_CNPJ_DV2))
     resto_dv2 = soma_dv2 % 11
     dv2_calculado = 0 if resto_dv2 < 2 else 11 - resto_dv2
-    
-    if dv2_calculado != digitos_verificadores[1]:
+
+    return dv2_calculado == digitos_verificadores[1]
+
+def _digitos_verificadores_ascii(numeros: str, pesos_dv1: Tuple[int, ...], pesos_dv2: Tuple[int, ...]) -> bool:
+    """
+    Confere os dois dígitos verificadores (módulo 11) de um CPF ou CNPJ com dígitos ASCII.
+
+    Equivale a `_digitos_cpf_validos` e `_digitos_cnpj_validos`, mas opera sobre os
+    bytes dos dígitos, sem um `int()` por caractere.
+    """
+    if numeros == numeros[0] * len(numeros):
         return False
 
-    return True
+    dados = numeros.encode('ascii')
+    posicao = len(pesos_dv1)
+
+    dv1 = 11 - (sum(map(operator.mul, dados, pesos_dv1)) - 48 * sum(pesos_dv1)) % 11
+    if dv1 >= 10:
+        dv1 = 0
+    if dados[posicao] - 48 != dv1:
+        return False
+
+    dv2 = 11 - (sum(map(operator.mul, dados, pesos_dv2)) - 48 * sum(pesos_dv2)) % 11
+    if dv2 >= 10:
+        dv2 = 0
+    return dados[posicao + 1] - 48 == dv2
+
+def _cpf_ascii_valido(numeros: str) -> bool:
+    return _digitos_verificadores_ascii(numeros, _PESOS_CPF_DV1, _PESOS_CPF_DV2)
+
+def _cnpj_ascii_valido(numeros: str) -> bool:
+    return _digitos_verificadores_ascii(numeros, _PESOS_CNPJ_DV1, _PESOS_CNPJ_DV2)
+
+def _extrair_digitos_many(documentos: List[Any], tamanho: int) -> Tuple[List[Optional[str]], List[int]]:
+    """
+    Reduz cada documento aos seus dígitos ASCII para a validação em lote.
+
+    Retorna os dígitos de cada documento (`None` quando ele precisa da validação
+    escalar, ex: dígitos fora do ASCII) e os índices dos que têm `tamanho` dígitos.
+    """
+    digitos: List[Optional[str]] = []
+    candidatos: List[int] = []
+    for i, documento in enumerate(documentos):
+        if not isinstance(documento, str) or not documento.isascii():
+            digitos.append(None)
+            continue
+        numeros = documento if documento.isdigit() else _PADRAO_NAO_DIGITO.sub('', documento)
+        digitos.append(numeros)
+        if len(numeros) == tamanho:
+            candidatos.append(i)
+    return digitos, candidatos
+
+def _matriz_digitos(numpy, digitos: List[Optional[str]], candidatos: List[int], tamanho: int):
+    """Monta a matriz `uint8` (uma linha por documento candidato) com os valores dos dígitos."""
+    texto = ''.join([digitos[i] for i in candidatos]).encode('ascii')
+    return (numpy.frombuffer(texto, dtype=numpy.uint8) - 48).reshape(len(candidatos), tamanho)
+
+def _validar_many(documentos: Any, tamanho: int, validar_escalar, validar_digitos, validar_matriz) -> Union[List[bool], Any]:
+    """Estrutura comum de `validar_cpf_many` e `validar_cnpj_many`."""
+    como_numpy = utils._is_ndarray(documentos)
+    lista = utils._as_list(documentos)
+    digitos, candidatos = _extrair_digitos_many(lista, tamanho)
+
+    mascara = [False] * len(lista)
+    for i, numeros in enumerate(digitos):
+        if numeros is None:
+            try:
+                mascara[i] = validar_escalar(lista[i]) if isinstance(lista[i], str) else False
+            except (TypeError, ValueError):
+                mascara[i] = False
+
+    numpy = utils._import_numpy()
+    if numpy is not None and candidatos:
+        validos = validar_matriz(numpy, _matriz_digitos(numpy, digitos, candidatos, tamanho))
+        for i, valido in zip(candidatos, validos.tolist()):
+            mascara[i] = valido
+    else:
+        for i in candidatos:
+            mascara[i] = validar_digitos(digitos[i])
+
+    if como_numpy:
+        return numpy.array(mascara, dtype=bool)
+    return mascara
+
+def _validar_matriz_cpf(numpy, matriz):
+    """Valida os dígitos verificadores de uma matriz de CPFs (uma linha por CPF)."""
+    pesos = numpy.array(_PESOS_CPF_DV2, dtype=numpy.int32)
+    repetidos = (matriz == matriz[:, :1]).all(axis=1)
+
+    dv1 = 11 - (matriz[:, :9] @ pesos[1:]) % 11
+    dv1[dv1 >= 10] = 0
+    dv2 = 11 - (matriz[:, :10] @ pesos) % 11
+    dv2[dv2 >= 10] = 0
+
+    return ~repetidos & (dv1 == matriz[:, 9]) & (dv2 == matriz[:, 10])
+
+def _validar_matriz_cnpj(numpy, matriz):
+    """Valida os dígitos verificadores de uma matriz de CNPJs (uma linha por CNPJ)."""
+    pesos_dv1 = numpy.array(_PESOS_CNPJ_DV1, dtype=numpy.int32)
+    pesos_dv2 = numpy.array(_PESOS_CNPJ_DV2, dtype=numpy.int32)
+    repetidos = (matriz == matriz[:, :1]).all(axis=1)
+
+    resto_dv1 = (matriz[:, :12] @ pesos_dv1) % 11
+    dv1 = numpy.where(resto_dv1 < 2, 0, 11 - resto_dv1)
+    resto_dv2 = (matriz[:, :12] @ pesos_dv2[:12] + dv1 * pesos_dv2[12]) % 11
+    dv2 = numpy.where(resto_dv2 < 2, 0, 11 - resto_dv2)
+
+    return ~repetidos & (dv1 == matriz[:, 12]) & (dv2 == matriz[:, 13])
+
+def validar_cpf_many(cpfs: Union[Sequence[str], Any]) -> Union[List[bool], Any]:
+    """
+    Valida vários CPFs de uma vez, retornando uma máscara booleana.
+
+    Os CPFs são reduzidos aos seus dígitos e reunidos em uma matriz `uint8`;
+    os dígitos verificadores de todos são calculados com operações matriciais
+    do NumPy. Sem o NumPy instalado, cada CPF é validado em Python puro. O
+    resultado de cada posição é igual ao de `validar_cpf`; itens que não são
+    strings resultam em `False`.
+
+    Args:
+        cpfs (Sequence[str] | numpy.ndarray): Os CPFs, com ou sem formatação.
+
+    Returns:
+        List[bool] | numpy.ndarray: `True` para cada CPF válido. Um array do NumPy
+                                    se a entrada for um `numpy.ndarray`.
+
+    Examples:
+        >>> validar_cpf_many(["105.324.350-28", "00000000000", "123"])
+        [True, False, False]
+    """
+    return _validar_many(cpfs, 11, validar_cpf, _cpf_ascii_valido, _validar_matriz_cpf)
+
+def validar_cnpj_many(cnpjs: Union[Sequence[str], Any]) -> Union[List[bool], Any]:
+    """
+    Valida vários CNPJs de uma vez, retornando uma máscara booleana.
+
+    Funciona como `validar_cpf_many`: os dígitos verificadores são calculados
+    sobre uma matriz `uint8` com o NumPy, ou em Python puro na sua ausência.
+    O resultado de cada posição é igual ao de `validar_cnpj`; itens que não são
+    strings resultam em `False`.
+
+    Args:
+        cnpjs (Sequence[str] | numpy.ndarray): Os CNPJs, com ou sem formatação.
+
+    Returns:
+        List[bool] | numpy.ndarray: `True` para cada CNPJ válido. Um array do NumPy
+                                    se a entrada for um `numpy.ndarray`.
+
+    Examples:
+        >>> validar_cnpj_many(["00.000.000/0001-91", "00000000000100"])
+        [True, False]
+    """
+    return _validar_many(cnpjs, 14, validar_cnpj, _cnpj_ascii_valido, _validar_matriz_cnpj)
 
 def validar_email(email: str) -> bool:
     """
@@ -108,8 +273,7 @@ def validar_email(email: str) -> bool:
         bool: Retorna `True` se o formato do e-mail for válido, e `False`
               caso contrário.
     """
-    padrao = re.compile(r'^[\w\.-]+@[\w\.-]+\.[a-zA-Z]{2,}$')
-    if re.match(padrao, email):
+    if _PADRAO_EMAIL.match(email):
         return True
     else:
         return False
@@ -130,41 +294,34 @@ def validar_telefone(telefone: str) -> bool:
         bool: Retorna `True` se o número for um telefone brasileiro válido,
               e `False` caso contrário.
     """
-    numeros = re.sub(r'\D', '', telefone)
+    return _telefone_nacional(_PADRAO_NAO_DIGITO.sub('', telefone)) is not None
 
+def _telefone_nacional(numeros: str) -> Optional[str]:
+    """Retorna o número nacional (DDD + número) de um telefone já reduzido aos seus dígitos, ou `None` se for inválido."""
     if len(numeros) == 12 or len(numeros) == 13:
         if numeros.startswith('55'):
             numeros = numeros[2:]
         else:
-            return False
+            return None
 
     if not (10 <= len(numeros) <= 11):
-        return False
+        return None
+
+    if numeros[:2] not in _DDDS_VALIDOS:
+        return None
 
-    ddds_validos = {
-        '11', '12', '13', '14', '15', '16', '17', '18', '19', '21', '22', '24',
-        '27', '28', '31', '32', '33', '34', '35', '37', '38', '41', '42', '43',
-        '44', '45', '46', '47', '48', '49', '51', '53', '54', '55', '61', '62',
-        '63', '64', '65', '66', '67', '68', '69', '71', '73', '74', '75', '77',
-        '79', '81', '82', '83', '84', '85', '86', '87', '88', '89', '91', '92',
-        '93', '94', '95', '96', '97', '98', '99'
-    }
-    ddd = numeros[:2]
-    if ddd not in ddds_validos:
-        return False
-    
     numero_real = numeros[2:]
 
     if len(numero_real) == 9:
         if numero_real[0] != '9':
-            return False
+            return None
     elif len(numero_real) == 8:
         if numero_real[0] == '9':
-            return False
+            return None
     else:
-        return False
+        return None
 
-    return True
+    return numeros
 
 def validar_chave_aleatoria(chave_aleatoria: str) -> bool:
     """
@@ -183,8 +340,156 @@ def validar_chave_aleatoria(chave_aleatoria: str) -> bool:
     if not isinstance(chave_aleatoria, str):
         return False
 
+    if _PADRAO_UUID.fullmatch(chave_aleatoria):
+        return True
+
     try:
         uuid.UUID(chave_aleatoria)
         return True
     except ValueError:
         return False
+
+def _classificar_sequencial(chave: str) -> str:
+    """Classifica a chave executando cada validação completa em sequência."""
+    if validar_chave_aleatoria(chave):
+        return "Chave Aleatória (EVP)"
+    elif '@' in chave and validar_email(chave):
+        return "Email"
+    elif validar_telefone(chave):
+        return "Telefone"
+    elif validar_cpf(chave):
+        return "CPF"
+    elif validar_cnpj(chave):
+        return "CNPJ"
+    else:
+        return "Tipo Desconhecido"
+
+def _normalizar(tipo: str, chave: str) -> Optional[str]:
+    """Retorna a forma normalizada de uma chave já classificada."""
+    if tipo == "Chave Aleatória (EVP)":
+        return str(uuid.UUID(chave))
+    if tipo == "Email":
+        return chave.lower()
+    if tipo == "Telefone":
+        return "+55" + _telefone_nacional(_PADRAO_NAO_DIGITO.sub('', chave))
+    if tipo == "CPF":
+        return ''.join(filter(str.isdigit, chave))
+    if tipo == "CNPJ":
+        return "".join(_PADRAO_DIGITO.findall(chave))
+    return None
+
+def _classificar_chave(chave: str) -> Tuple[str, Optional[str]]:
+    """
+    Classifica e normaliza a chave em uma única passada (sem cache).
+
+    Para chaves ASCII, os dígitos são extraídos uma única vez e apenas as
+    verificações compatíveis com o tamanho da chave são executadas, na mesma
+    ordem de prioridade da validação sequencial. Chaves com outros caracteres
+    (raras) usam a validação sequencial, que tem as mesmas regras de Unicode
+    das funções `validar_*`.
+    """
+    if not isinstance(chave, str) or not chave.isascii():
+        tipo = _classificar_sequencial(chave)
+        return tipo, _normalizar(tipo, chave)
+
+    tamanho = len(chave)
+    if tamanho == 36 and _PADRAO_UUID.fullmatch(chave):
+        return "Chave Aleatória (EVP)", chave.lower()
+    if tamanho >= 32 and validar_chave_aleatoria(chave):
+        return "Chave Aleatória (EVP)", str(uuid.UUID(chave))
+
+    if '@' in chave and _PADRAO_EMAIL.match(chave):
+        return "Email", chave.lower()
+
+    digitos = _PADRAO_NAO_DIGITO.sub('', chave)
+    quantidade = len(digitos)
+
+    if 10 <= quantidade <= 13:
+        nacional = _telefone_nacional(digitos)
+        if nacional is not None:
+            return "Telefone", "+55" + nacional
+    if quantidade == 11 and _cpf_ascii_valido(digitos):
+        return "CPF", digitos
+    if quantidade == 14 and _cnpj_ascii_valido(digitos):
+        return "CNPJ", digitos
+
+    return "Tipo Desconhecido", None
+
+_CACHE_TIPO_CHAVE = utils.LRUCache(tamanho_maximo=1024)
+
+def classificar_chave(chave: str) -> Tuple[str, Optional[str]]:
+    """
+    Identifica o tipo de uma chave Pix e retorna a sua forma normalizada.
+
+    A chave é analisada em uma única passada: o tamanho e os caracteres decidem
+    quais verificações fazem sentido, e os padrões e tabelas são pré-compilados.
+    O resultado é idêntico ao das validações `validar_*` aplicadas em sequência
+    (chave aleatória, e-mail, telefone, CPF e CNPJ). Como as cobranças de um
+    mesmo recebedor repetem a mesma chave, o resultado fica em um cache LRU
+    limitado e seguro entre threads (veja `configurar_cache_chaves`).
+
+    A forma normalizada é: o UUID em minúsculas com hífens (chave aleatória),
+    o e-mail em minúsculas, o telefone no formato "+55DDDNUMERO" e apenas os
+    dígitos do CPF ou do CNPJ.
+
+    Args:
+        chave (str): A chave Pix a ser classificada.
+
+    Returns:
+        Tuple[str, Optional[str]]: O tipo da chave ("Chave Aleatória (EVP)", "Email",
+            "Telefone", "CPF", "CNPJ" ou "Tipo Desconhecido") e a chave normalizada
+            (`None` se o tipo for desconhecido).
+
+    Examples:
+        >>> classificar_chave("00.000.000/0001-91")
+        ('CNPJ', '00000000000191')
+        >>> classificar_chave("(11) 99999-8888")
+        ('Telefone', '+5511999998888')
+        >>> classificar_chave("chave_invalida")
+        ('Tipo Desconhecido', None)
+    """
+    if not isinstance(chave, str):
+        return _classificar_chave(chave)
+    return _CACHE_TIPO_CHAVE.obter_ou_calcular(chave, _classificar_chave)
+
+def tipo_chave(chave: str) -> str:
+    """
+    Identifica o tipo de uma chave Pix com base em seu formato.
+
+    Atalho para `classificar_chave(chave)[0]`, com o mesmo cache.
+
+    Args:
+        chave (str): A chave Pix a ser classificada.
+
+    Returns:
+        str: O tipo da chave ("Chave Aleatória (EVP)", "Email", "Telefone", "CPF",
+             "CNPJ" ou "Tipo Desconhecido").
+
+    Examples:
+        >>> tipo_chave("00.000.000/0001-91")
+        'CNPJ'
+    """
+    return classificar_chave(chave)[0]
+
+def configurar_cache_chaves(tamanho_maximo: int):
+    """
+    Define a quantidade máxima de chaves classificadas mantidas em cache.
+
+    Args:
+        tamanho_maximo (int): A nova capacidade. Com `0`, o cache é desativado.
+    """
+    _CACHE_TIPO_CHAVE.tamanho_maximo = tamanho_maximo
+
+def estatisticas_cache_chaves() -> utils.EstatisticasCache:
+    """
+    Retorna os contadores do cache de classificação de chaves.
+
+    Returns:
+        utils.EstatisticasCache: Acertos (hits), falhas (misses), descartes
+                                 (evictions), tamanho atual e capacidade.
+    """
+    return _CACHE_TIPO_CHAVE.estatisticas()
+
+def limpar_cache_chaves():
+    """Esvazia o cache de classificação de chaves e zera os seus contadores."""
+    _CACHE_TIPO_CHAVE.limpar()
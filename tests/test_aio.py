@@ -0,0 +1,90 @@
+import asyncio
+import pytest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from PIL import Image
+from pathlib import Path
+import io
+
+from src.pixcore import aio
+from src.pixcore.brcode import Pix
+from src.pixcore.cache import CacheQRCode
+from src.pixcore.exceptions import ErroDeESError
+from src.pixcore.models import PixData
+
+@pytest.fixture
+def dados():
+    return PixData(
+        recebedor_nome="EMPRESA MODELO",
+        recebedor_cidade="SAO PAULO",
+        pix_key="123e4567-e89b-12d3-a456-426655440000",
+        valor=19.90,
+        transacao_id="PEDIDO123",
+    )
+
+def test_payload_e_qrcode_png_iguais_aos_sincronos(dados):
+    """As versões assíncronas produzem o mesmo payload e os mesmos pixels."""
+    async def gerar():
+        return await aio.payload(dados), await aio.qrcode_png(dados, box_size=4)
+
+    payload, png = asyncio.run(gerar())
+
+    assert payload == Pix(dados).payload()
+    with Image.open(io.BytesIO(png)) as imagem:
+        assert imagem.convert('RGB').tobytes() == Pix(dados).qrcode(box_size=4).tobytes()
+
+def test_concorrencia_limitada_pelo_semaforo(dados, monkeypatch):
+    """No máximo `max_concorrencia` renderizações acontecem ao mesmo tempo."""
+    import threading, time
+    ativas, maximo, trava = 0, 0, threading.Lock()
+    original = aio._gerar_png
+
+    def gerar_png(*args):
+        nonlocal ativas, maximo
+        with trava:
+            ativas += 1
+            maximo = max(maximo, ativas)
+        time.sleep(0.01)
+        try:
+            return original(*args)
+        finally:
+            with trava:
+                ativas -= 1
+
+    monkeypatch.setattr(aio, "_gerar_png", gerar_png)
+    async def gerar(gerador):
+        return await asyncio.gather(*[gerador.qrcode_png(dados, box_size=1) for _ in range(8)])
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert len(asyncio.run(gerar(aio.GeradorAssincrono(executor, max_concorrencia=2)))) == 8
+    assert maximo == 2
+
+def test_executor_de_processos_e_erros(dados, tmp_path: Path):
+    """Com processos, o arquivo é salvo e os erros da PixCore chegam ao chamador."""
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        gerador = aio.GeradorAssincrono(executor)
+        assert asyncio.run(gerador.save_qrcode(dados, str(tmp_path / "qr.png"), modo="1"))
+
+        with pytest.raises(ErroDeESError):
+            asyncio.run(gerador.save_qrcode(dados, str(tmp_path / "nao_existe" / "qr.png")))
+        with pytest.raises(ValueError):
+            asyncio.run(gerador.qrcode_png(dados, cache=CacheQRCode()))
+
+    with Image.open(tmp_path / "qr.png") as imagem:
+        assert imagem.mode == "1"
+
+def test_qrcode_png_com_cache(dados):
+    """Com threads, o `CacheQRCode` é compartilhado entre as chamadas."""
+    cache = CacheQRCode()
+
+    async def gerar(gerador):
+        return [await gerador.qrcode_png(dados, cache=cache) for _ in range(3)]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        primeiro, *outros = asyncio.run(gerar(aio.GeradorAssincrono(executor)))
+    assert all(png is primeiro for png in outros)
+    assert cache.estatisticas().pngs.hits == 2
+
+def test_save_qrcode_svg_ignora_o_modo(dados, tmp_path: Path):
+    """Como na versão síncrona, o modo não é validado ao salvar um `.svg`."""
+    assert asyncio.run(aio.save_qrcode(dados, str(tmp_path / "qr.svg"), cor_qr="navy", modo="1"))
+    assert (tmp_path / "qr.svg").read_text(encoding="utf-8") == Pix(dados).qrcode_svg(cor_qr="navy")
@@ -0,0 +1,96 @@
+import pytest
+from array import array
+from dataclasses import replace
+
+from src.pixcore.batch import generate_payloads
+from src.pixcore.brcode import Pix
+from src.pixcore.exceptions import GeracaoPayloadError
+from src.pixcore.models import PixData
+
+@pytest.fixture
+def pix_data_valida():
+    """Fornece uma instância padrão de PixData para os testes."""
+    return PixData(
+        recebedor_nome="Empresa Completa LTDA",
+        recebedor_cidade="SAO PAULO",
+        pix_key="a1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d",
+        recebedor_cep="01001000",
+        idioma_preferencia="en_US",
+        recebedor_nome_alt="Complete Company LLC",
+        recebedor_cidade_alt="SAO PAULO"
+    )
+
+def test_generate_payloads_igual_ao_pix(pix_data_valida):
+    """Verifica se cada payload do lote é idêntico ao gerado individualmente pelo Pix."""
+    valores = [150.75, 0.01, None, 99999.99]
+    txids = ["Pedido12345", "A", "***", "X" * 25]
+
+    resultado = generate_payloads(Pix(pix_data_valida).compile(), valores, txids)
+
+    assert resultado.erros == [False] * 4
+    for payload, valor, txid in zip(resultado.payloads, valores, txids):
+        assert payload == Pix(replace(pix_data_valida, valor=valor, transacao_id=txid)).payload()
+
+def test_generate_payloads_reporta_erros_sem_interromper(pix_data_valida):
+    """Verifica se linhas inválidas são marcadas na máscara de erros sem abortar o lote."""
+    resultado = Pix(pix_data_valida).payload_many(
+        [10.0, -5.0, "abc", 20.0],
+        ["TXID1", "TXID2", "TXID3", "TXID-INVALIDO"],
+    )
+
+    assert resultado.erros == [False, True, True, True]
+    assert resultado.total_erros == 3
+    assert resultado.payloads[0] != ""
+    assert resultado.payloads[1:] == ["", "", ""]
+    assert resultado.motivos[0] is None
+    assert "positivo" in resultado.motivos[1]
+    assert "abc" in resultado.motivos[2]
+    assert "alfanumérico" in resultado.motivos[3]
+
+def test_generate_payloads_aceita_array_e_txids_padrao(pix_data_valida):
+    """Verifica se colunas do tipo array.array são aceitas e se o TXID padrão é '***'."""
+    resultado = generate_payloads(pix_data_valida, array('d', [1.5, 2.5]))
+
+    assert resultado.payloads[0] == Pix(replace(pix_data_valida, valor=1.5)).payload()
+    assert "0503***" in resultado.payloads[1]
+
+def test_generate_payloads_colunas_de_tamanhos_diferentes(pix_data_valida):
+    """Verifica se colunas de tamanhos diferentes levantam GeracaoPayloadError."""
+    with pytest.raises(GeracaoPayloadError):
+        generate_payloads(pix_data_valida, [1.0, 2.0], ["TXID1"])
+
+def test_generate_payloads_numpy(pix_data_valida):
+    """Verifica se entradas do NumPy retornam arrays do NumPy, com NaN reportado como erro."""
+    numpy = pytest.importorskip("numpy")
+
+    resultado = generate_payloads(pix_data_valida, numpy.array([10.0, numpy.nan, -1.0]), numpy.array(["A1", "B2", "C3"]))
+
+    assert isinstance(resultado.payloads, numpy.ndarray)
+    assert resultado.erros.tolist() == [False, True, True]
+    assert resultado.payloads[0] == Pix(replace(pix_data_valida, valor=10.0, transacao_id="A1")).payload()
+    assert resultado.payloads[1] == ""
+
+def test_generate_payloads_nan_e_infinito_sao_erros(pix_data_valida):
+    """NaN e infinitos não viram cobranças com valor aberto; apenas None e "" omitem o campo 54."""
+    from decimal import Decimal
+
+    valores = [float("nan"), float("inf"), float("-inf"), Decimal("NaN"), None, ""]
+    resultado = generate_payloads(pix_data_valida, valores, ["A1", "B2", "C3", "D4", "E5", "F6"])
+
+    assert resultado.erros == [True, True, True, True, False, False]
+    assert resultado.motivos[0] == "Valor 'nan' é inválido."
+    assert resultado.payloads[4] == Pix(replace(pix_data_valida, valor=None, transacao_id="E5")).payload()
+
+def test_generate_payloads_em_centavos(pix_data_valida):
+    """Verifica se colunas de centavos inteiros (inclusive int64 do NumPy) geram os mesmos payloads."""
+    esperado = generate_payloads(pix_data_valida, [10.5, 0.07, None], ["A1", "B2", "C3"])
+
+    resultado = generate_payloads(pix_data_valida, [1050, 7, None, 10.5, 0], ["A1", "B2", "C3", "D4", "E5"], em_centavos=True)
+
+    assert resultado.payloads[:3] == esperado.payloads
+    assert resultado.erros == [False, False, False, True, True]
+    assert resultado.motivos[3] == "Valor '10.5' é inválido."
+
+    numpy = pytest.importorskip("numpy")
+    resultado_numpy = generate_payloads(pix_data_valida, numpy.array([1050, 7], dtype=numpy.int64), ["A1", "B2"], em_centavos=True)
+    assert resultado_numpy.payloads.tolist() == esperado.payloads[:2]
@@ -1,9 +1,12 @@
 import pytest
+from dataclasses import replace
 from PIL import Image
 from pathlib import Path
 
-from src.pixcore.brcode import Pix
+from src.pixcore.brcode import Pix, PixTemplate
+from src.pixcore.exceptions import GeracaoPayloadError
 from src.pixcore.models import PixData
+from src.pixcore.utils import calculate_crc16
 
 @pytest.fixture
 def pix_data_valida():
@@ -53,4 +56,259 @@ def test_gerar_qrcode_salva_arquivo(pix_data_valida, tmp_path: Path):
     br_code.save_qrcode(caminho_arquivo_saida=str(caminho_saida))
     
     assert caminho_saida.exists()
-    assert caminho_saida.is_file()
\ No newline at end of file
+    assert caminho_saida.is_file()
+
+def test_payload_reutiliza_prefixo_apos_alteracao(pix_data_valida):
+    """
+    Verifica se chamadas repetidas de payload() continuam corretas quando os
+    dados variáveis (valor, txid) e o prefixo fixo (chave) são alterados.
+    """
+    br_code = Pix(pix_data_valida)
+    br_code.payload()
+
+    pix_data_valida.valor = 20.00
+    pix_data_valida.transacao_id = "Pedido999"
+    payload = br_code.payload()
+    assert "540520.00" in payload
+    assert payload[-4:] == calculate_crc16(payload[:-4])
+
+    pix_data_valida.pix_key = "chave@pix.com"
+    payload = br_code.payload()
+    assert "0113chave@pix.com" in payload
+    assert payload[-4:] == calculate_crc16(payload[:-4])
+
+def test_payload_refaz_prefixo_ao_trocar_dados(pix_data_valida):
+    """O prefixo em cache é refeito ao mudar o MCC, o método de iniciação ou o próprio `pix_data`."""
+    br_code = Pix(pix_data_valida)
+    br_code.payload()
+
+    pix_data_valida.receptor_categoria_code = "5411"
+    pix_data_valida.ponto_iniciacao_metodo = "12"
+    assert br_code.payload() == Pix(replace(pix_data_valida)).payload()
+    assert "010212" in br_code.payload() and "52045411" in br_code.payload()
+
+    outro = replace(pix_data_valida, pix_key="chave@pix.com")
+    br_code.pix_data = outro
+    assert br_code.payload() == Pix(replace(outro)).payload()
+
+def test_template_gera_mesmo_payload_que_pix(pix_data_valida):
+    """Verifica se o PixTemplate gera payloads idênticos aos do Pix para vários valores e TXIDs."""
+    modelo = Pix(pix_data_valida).compile()
+    assert isinstance(modelo, PixTemplate)
+
+    for valor, txid in [(150.75, "Pedido12345"), (0.01, "A"), (None, "***"), (1234.5, "X" * 25)]:
+        esperado = Pix(replace(pix_data_valida, valor=valor, transacao_id=txid)).payload()
+        assert modelo.render(valor=valor, transacao_id=txid) == esperado
+
+def test_template_valida_valor_e_txid(pix_data_valida):
+    """Verifica se o PixTemplate rejeita valores e TXIDs inválidos."""
+    modelo = PixTemplate(pix_data_valida)
+
+    with pytest.raises(GeracaoPayloadError):
+        modelo.render(valor=-1.0, transacao_id="TXID1")
+    with pytest.raises(GeracaoPayloadError):
+        modelo.render(valor=10.0, transacao_id="TXID-COM-HIFEN")
+
+def test_valor_em_centavos_e_decimal_geram_mesmo_payload(pix_data_valida):
+    """Verifica se `valor_centavos` e `Decimal` geram o mesmo payload que o valor em float."""
+    from decimal import Decimal
+
+    esperado = Pix(pix_data_valida).payload()
+    dados_centavos = replace(pix_data_valida, valor=None, valor_centavos=15075)
+
+    assert Pix(dados_centavos).payload() == esperado
+    assert Pix(replace(pix_data_valida, valor=Decimal("150.75"))).payload() == esperado
+    assert dados_centavos.centavos() == pix_data_valida.centavos() == 15075
+    assert PixTemplate(pix_data_valida).render(valor_centavos=15075, transacao_id="Pedido12345") == esperado
+
+    with pytest.raises(GeracaoPayloadError, match="não ambos"):
+        replace(pix_data_valida, valor_centavos=15075)
+    with pytest.raises(GeracaoPayloadError, match="inteiro positivo"):
+        replace(pix_data_valida, valor=None, valor_centavos=150.75)
+
+@pytest.mark.parametrize("dados", [
+    "",
+    "12345",
+    "PIX 123",
+    "0" * 25 + "abc" + "X" * 30,
+    "00020126580014BR.GOV.BCB.PIX0136123e4567-e89b-12d3-a456-426655440000520400005303986540519.905802BR5914EMPRESA MODELO6009SAO PAULO62130509PEDIDO12363043A0E",
+    "a" * 400,
+    "1" * 700,
+])
+def test_info_qrcode_igual_a_busca_do_qrcode(dados):
+    """A versão calculada é a mesma que o qrcode encontraria com `fit=True`."""
+    import qrcode
+    from src.pixcore.brcode import info_qrcode
+
+    qr = qrcode.QRCode(version=1, error_correction=qrcode.constants.ERROR_CORRECT_H)
+    qr.add_data(dados)
+    qr.make(fit=True)
+
+    info = info_qrcode(dados)
+    assert info.versao == qr.version
+    assert info.modulos == qr.modules_count
+
+def test_info_qrcode_payload_grande_demais():
+    """Um payload que não cabe na versão 40 gera um erro claro, sem tentar renderizar."""
+    from src.pixcore.brcode import info_qrcode
+
+    with pytest.raises(GeracaoPayloadError):
+        info_qrcode("é" * 700)
+
+def test_pix_info_qrcode_corresponde_a_imagem(pix_data_valida):
+    """As dimensões informadas correspondem à imagem gerada."""
+    pix = Pix(pix_data_valida)
+    info = pix.info_qrcode()
+    assert pix.qrcode(box_size=1, border=0).size == (info.modulos, info.modulos)
+
+@pytest.mark.parametrize("cores", [("black", "white"), ("navy", "#FFEECC"), ("red", "transparent")])
+def test_renderizador_direto_identico_ao_make_image(pix_data_valida, cores):
+    """O renderizador por `frombuffer` gera os mesmos pixels que o `make_image` do qrcode."""
+    import qrcode
+    from src.pixcore.brcode import _desenhar_matriz, _gerar_matriz
+
+    payload = Pix(pix_data_valida).payload()
+    qr = qrcode.QRCode(version=1, error_correction=qrcode.constants.ERROR_CORRECT_H, box_size=3, border=2)
+    qr.add_data(payload)
+    qr.make(fit=True)
+    esperado = qr.make_image(fill_color=cores[0], back_color=cores[1]).convert('RGB')
+
+    imagem = _desenhar_matriz(_gerar_matriz(payload), cores[0], cores[1], box_size=3, border=2)
+    assert imagem.mode in ("1", "P")
+    assert imagem.convert('RGB').tobytes() == esperado.tobytes()
+
+@pytest.mark.parametrize("modo, cores", [("1", ("black", "white")), ("P", ("black", "white")), ("P", ("navy", "#FFEECC"))])
+def test_qrcode_modos_com_mesmos_pixels(pix_data_valida, modo, cores):
+    """Os modos "1" e "P" têm os mesmos pixels da imagem RGB."""
+    pix = Pix(pix_data_valida)
+    rgb = pix.qrcode(cor_qr=cores[0], cor_fundo=cores[1], box_size=2)
+    imagem = pix.qrcode(cor_qr=cores[0], cor_fundo=cores[1], box_size=2, modo=modo)
+
+    assert imagem.mode == modo
+    assert imagem.convert('RGB').tobytes() == rgb.tobytes()
+
+def test_save_qrcode_modo_1_gera_png_menor(pix_data_valida, tmp_path: Path):
+    """Um PNG de 1 bit é menor que o RGB e decodifica para a mesma imagem."""
+    pix = Pix(pix_data_valida)
+    rgb, um_bit = tmp_path / "rgb.png", tmp_path / "1bit.png"
+
+    pix.save_qrcode(str(rgb))
+    pix.save_qrcode(str(um_bit), modo="1", compress_level=9)
+
+    assert um_bit.stat().st_size < rgb.stat().st_size
+    with Image.open(um_bit) as imagem:
+        assert imagem.mode == "1"
+        assert imagem.convert('RGB').tobytes() == Image.open(rgb).convert('RGB').tobytes()
+
+def test_save_qrcode_modo_invalido(pix_data_valida, tmp_path: Path):
+    """Modos desconhecidos, ou "1" com cores, são rejeitados antes de gerar a imagem."""
+    pix = Pix(pix_data_valida)
+    with pytest.raises(ValueError):
+        pix.save_qrcode(str(tmp_path / "qr.png"), modo="CMYK")
+    with pytest.raises(ValueError):
+        pix.save_qrcode(str(tmp_path / "qr.png"), cor_qr="navy", modo="1")
+    assert not (tmp_path / "qr.png").exists()
+
+@pytest.mark.parametrize("formato", ["png", "webp"])
+def test_qrcode_bytes_decodifica_para_mesma_imagem(pix_data_valida, formato):
+    """Os bytes em memória decodificam para os mesmos pixels de `qrcode()`."""
+    import io
+
+    pix = Pix(pix_data_valida)
+    conteudo = pix.qrcode_bytes(formato, cor_qr="navy", box_size=3)
+    with Image.open(io.BytesIO(conteudo)) as imagem:
+        assert imagem.format == formato.upper()
+        assert imagem.convert('RGB').tobytes() == pix.qrcode(cor_qr="navy", box_size=3).convert('RGB').tobytes()
+
+def test_qrcode_bytes_escreve_no_buffer(pix_data_valida):
+    """Com um buffer, os bytes são escritos nele e a quantidade escrita é retornada."""
+    import io
+
+    pix = Pix(pix_data_valida)
+    buffer = io.BytesIO()
+    escritos = pix.qrcode_bytes(buffer=buffer)
+
+    assert escritos == len(buffer.getvalue())
+    assert buffer.getvalue() == pix.qrcode_bytes()
+    with Image.open(buffer) as imagem:
+        assert imagem.mode == "1"
+
+def test_qrcode_bytes_svg(pix_data_valida):
+    """O SVG tem o tamanho em pixels da imagem e desenha os módulos em um único path."""
+    pix = Pix(pix_data_valida)
+    info = pix.info_qrcode()
+    svg = pix.qrcode_bytes("svg", box_size=5, border=2).decode('utf-8')
+    lado = (info.modulos + 4) * 5
+
+    assert svg.startswith('<?xml')
+    assert f'width="{lado}" height="{lado}"' in svg
+    assert svg.count('<path') == 1
+
+def test_qrcode_svg_reproduz_a_matriz(pix_data_valida):
+    """Os retângulos do path cobrem exatamente os módulos escuros da matriz."""
+    import re
+    from src.pixcore.brcode import _gerar_matriz
+
+    pix = Pix(pix_data_valida)
+    matriz = _gerar_matriz(pix.payload())
+    svg = pix.qrcode_svg(border=0)
+
+    desenhados = set()
+    for x, y, n in re.findall(r"M(\d+),(\d+)h(\d+)v1h-\3z", svg):
+        desenhados.update((int(x) + i, int(y)) for i in range(int(n)))
+    escuros = {(x, y) for y, linha in enumerate(matriz) for x, modulo in enumerate(linha) if modulo}
+    assert desenhados == escuros
+
+def test_qrcode_svg_com_logo_e_cores(pix_data_valida, tmp_path: Path):
+    """O logo é embutido em base64 na mesma posição da imagem rasterizada, e `.svg` é salvo como vetor."""
+    logo = Image.new("RGBA", (300, 150), "red")
+    pix = Pix(pix_data_valida)
+    svg = pix.qrcode_svg(caminho_logo=logo, cor_qr=(0, 0, 128), cor_fundo="transparent", box_size=4)
+
+    assert 'fill="#000080"' in svg
+    assert "<rect" not in svg
+    assert 'xlink:href="data:image/png;base64,' in svg
+
+    from src.pixcore.logo import LogoAsset
+
+    lado = pix.qrcode(box_size=4).size[0]
+    largura, altura = LogoAsset(logo).redimensionado(int(lado * 0.25))[0].size
+    x, y = (lado - largura) // 2, (lado - altura) // 2
+    assert f'x="{x / 4:g}" y="{y / 4:g}" width="{largura / 4:g}" height="{altura / 4:g}"' in svg
+
+    arquivo = tmp_path / "pix.svg"
+    assert pix.save_qrcode(str(arquivo), caminho_logo=logo, cor_fundo="transparent", cor_qr=(0, 0, 128), box_size=4)
+    assert arquivo.read_text(encoding="utf-8") == svg
+
+def test_save_qrcode_svg_ignora_o_modo(pix_data_valida, tmp_path: Path):
+    """O modo só vale para imagens rasterizadas; um `.svg` é salvo com qualquer modo e cor."""
+    pix = Pix(pix_data_valida)
+    arquivo = tmp_path / "pix.svg"
+
+    assert pix.save_qrcode(str(arquivo), cor_qr="navy", modo="1")
+    assert arquivo.read_text(encoding="utf-8") == pix.qrcode_svg(cor_qr="navy")
+    with pytest.raises(ValueError):
+        pix.save_qrcode(str(tmp_path / "pix.png"), cor_qr="navy", modo="1")
+
+@pytest.mark.parametrize("formato", ["png", "svg", "webp"])
+def test_qrcode_bytes_monta_o_payload_uma_vez(pix_data_valida, formato, monkeypatch):
+    """O payload (e o seu CRC16) é montado uma única vez por chamada."""
+    from src.pixcore.cache import CacheQRCode
+
+    chamadas = []
+    payload = Pix.payload
+
+    def contar(self):
+        chamadas.append(self)
+        return payload(self)
+
+    monkeypatch.setattr(Pix, "payload", contar)
+    pix = Pix(pix_data_valida)
+    for cache in (None, CacheQRCode()):
+        chamadas.clear()
+        pix.qrcode_bytes(formato, cache=cache)
+        assert len(chamadas) == 1
+
+def test_qrcode_bytes_formato_invalido(pix_data_valida):
+    with pytest.raises(ValueError):
+        Pix(pix_data_valida).qrcode_bytes("gif")
@@ -0,0 +1,118 @@
+import io
+import os
+import pytest
+from PIL import Image
+
+from src.pixcore import brcode
+from src.pixcore.brcode import Pix
+from src.pixcore.cache import CacheQRCode
+from src.pixcore.models import PixData
+
+@pytest.fixture
+def pix():
+    return Pix(PixData(
+        recebedor_nome="EMPRESA MODELO",
+        recebedor_cidade="SAO PAULO",
+        pix_key="123e4567-e89b-12d3-a456-426655440000",
+        valor=19.90,
+        transacao_id="DOACAO",
+    ))
+
+def test_matriz_em_cache_e_reaproveitada(pix):
+    """A matriz é calculada uma única vez por payload, independente das opções de renderização."""
+    cache = CacheQRCode()
+    pix.qrcode(cache=cache)
+    pix.qrcode(cor_qr="navy", box_size=4, cache=cache)
+
+    estatisticas = cache.estatisticas().matrizes
+    assert (estatisticas.hits, estatisticas.misses) == (1, 1)
+
+def test_imagem_em_cache_identica_a_sem_cache(pix):
+    """O cache não altera um pixel sequer da imagem gerada."""
+    cache = CacheQRCode()
+    pix.qrcode(cache=cache)
+    sem_cache = pix.qrcode(cor_qr="#000080", cor_fundo="#FFEECC")
+    com_cache = pix.qrcode(cor_qr="#000080", cor_fundo="#FFEECC", cache=cache)
+
+    assert com_cache.size == sem_cache.size
+    assert com_cache.tobytes() == sem_cache.tobytes()
+
+def test_png_chaveado_pelas_opcoes_de_renderizacao(pix):
+    """Opções diferentes geram entradas diferentes; opções iguais devolvem os mesmos bytes."""
+    cache = CacheQRCode()
+    payload = pix.payload()
+
+    preto = cache.png(payload)
+    assert cache.png(payload) is preto
+    assert cache.png(payload, cor_qr="navy") != preto
+
+    assert Image.open(io.BytesIO(preto)).format == "PNG"
+    assert cache.estatisticas().pngs.tamanho == 2
+
+def test_evictions_respeitam_o_limite():
+    """Com o limite atingido, as entradas menos usadas são descartadas e contabilizadas."""
+    cache = CacheQRCode(max_matrizes=2, max_pngs=2)
+    for payload in ("A", "B", "C"):
+        cache.png(payload)
+
+    estatisticas = cache.estatisticas()
+    assert estatisticas.matrizes.evictions == 1
+    assert estatisticas.pngs.evictions == 1
+    assert estatisticas.pngs.tamanho == 2
+
+def test_cache_em_disco_sobrevive_a_nova_instancia(pix, tmp_path):
+    """Os PNGs gravados no diretório são reaproveitados por outra instância do cache."""
+    diretorio = tmp_path / "qrcache"
+    primeiro = CacheQRCode(diretorio=str(diretorio))
+    conteudo = primeiro.png(pix.payload())
+    assert primeiro.estatisticas().disco_misses == 1
+    assert len(list(diretorio.glob("*.png"))) == 1
+
+    segundo = CacheQRCode(diretorio=str(diretorio))
+    assert segundo.png(pix.payload()) == conteudo
+    assert segundo.estatisticas().disco_hits == 1
+    assert segundo.estatisticas().matrizes.misses == 0
+
+    segundo.limpar(disco=True)
+    assert list(diretorio.glob("*.png")) == []
+
+def test_limpar_disco_preserva_arquivos_de_terceiros(pix, tmp_path):
+    """`limpar(disco=True)` remove apenas os PNGs gravados pelo próprio cache."""
+    alheio = tmp_path / "foto.png"
+    alheio.write_bytes(b"imagem do usuario")
+    cache = CacheQRCode(diretorio=str(tmp_path))
+    cache.png(pix.payload())
+    assert len(list(tmp_path.glob("*.png"))) == 2
+
+    cache.limpar(disco=True)
+    assert list(tmp_path.glob("*.png")) == [alheio]
+    assert alheio.read_bytes() == b"imagem do usuario"
+
+def test_troca_do_logo_invalida_o_cache(pix, tmp_path):
+    """Substituir o arquivo do logo gera uma nova entrada em vez de reaproveitar a antiga."""
+    logo = tmp_path / "logo.png"
+    Image.new("RGBA", (40, 40), "red").save(logo)
+    cache = CacheQRCode()
+    vermelho = cache.png(pix.payload(), caminho_logo=str(logo))
+
+    Image.new("RGBA", (41, 41), "blue").save(logo)
+    os.utime(logo, ns=(0, os.stat(logo).st_mtime_ns + 1_000_000))
+    assert cache.png(pix.payload(), caminho_logo=str(logo)) != vermelho
+
+def test_save_qrcode_com_cache_grava_os_bytes_em_cache(pix, tmp_path):
+    """Em arquivos .png, `save_qrcode` grava diretamente o PNG do cache."""
+    cache = CacheQRCode()
+    destino = tmp_path / "doacao.png"
+
+    assert pix.save_qrcode(str(destino), cache=cache)
+    assert pix.save_qrcode(str(destino), cache=cache)
+
+    assert destino.read_bytes() == cache.png(pix.payload())
+    assert cache.estatisticas().pngs.hits == 2
+
+def test_render_qrcode_usa_matriz_e_desenho(pix):
+    """`_render_qrcode` equivale a desenhar a matriz gerada por `_gerar_matriz`."""
+    payload = pix.payload()
+    matriz = brcode._gerar_matriz(payload)
+    assert len(matriz) == len(matriz[0])
+    assert brcode._render_qrcode(payload).tobytes() == brcode._desenhar_qrcode(matriz).tobytes()
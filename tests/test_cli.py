@@ -4,6 +4,7 @@ from typer.testing import CliRunner
 from src.pixcore.cli import app
 from pathlib import Path
 import configparser
+from PIL import Image
 
 runner = CliRunner()
 
@@ -93,6 +94,13 @@ def test_cli_qrcode_sucesso_salva_arquivo(tmp_path: Path, pix_args):
     assert arquivo_saida.exists()
     assert arquivo_saida.is_file()
 
+def test_cli_qrcode_saida_padrao(pix_args):
+    """Com '--output -', o PNG é escrito na saída padrão."""
+    result = runner.invoke(app, ["qrcode", *pix_args, "--output", "-"])
+
+    assert result.exit_code == 0
+    assert result.stdout_bytes.startswith(b'\x89PNG\r\n\x1a\n')
+
 def test_cli_decode_sucesso(pix_args):
     args = ["decode", "00020126580014BR.GOV.BCB.PIX0136a1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d5204000053039865406150.755802BR5921Empresa Completa LTDA6009SAO PAULO61080100100062150511Pedido1234564460005en_US0120Complete Company LLC0209SAO PAULO63042BE4"]
     result = runner.invoke(app, args)
@@ -176,6 +184,51 @@ def test_lote_sucesso(csv_valido, tmp_path: Path):
     arquivos_gerados = list(output_dir.glob("*.png"))
     assert len(arquivos_gerados) == 2
 
+def test_lote_modo_1_e_compressao(csv_valido, tmp_path: Path):
+    """
+    Verifica se '--modo 1' e '--compress-level' geram PNGs de 1 bit.
+    """
+    output_dir = tmp_path / "qrcodes"
+
+    result = runner.invoke(app, ["lote", str(csv_valido), str(output_dir), "--modo", "1", "--compress-level", "9", "--workers", "1"])
+
+    assert result.exit_code == 0
+    with Image.open(output_dir / "TXID001.png") as imagem:
+        assert imagem.mode == "1"
+
+    result = runner.invoke(app, ["lote", str(csv_valido), str(output_dir), "--modo", "CMYK"])
+    assert result.exit_code == 1
+    assert "Modo inválido" in result.stdout
+
+def test_lote_formato_svg(csv_valido, tmp_path: Path):
+    """
+    Verifica se '--formato svg' gera um QR Code vetorial por linha.
+    """
+    output_dir = tmp_path / "qrcodes"
+
+    result = runner.invoke(app, ["lote", str(csv_valido), str(output_dir), "--formato", "svg", "--workers", "1"])
+
+    assert result.exit_code == 0
+    assert sorted(p.name for p in output_dir.iterdir()) == ["TXID001.svg", "TXID002.svg"]
+
+def test_lote_container_zip(csv_valido, tmp_path: Path):
+    """
+    Verifica se uma saída '.zip' reúne todos os QR Codes em um único arquivo.
+    """
+    import zipfile
+
+    saida = tmp_path / "qrcodes.zip"
+
+    result = runner.invoke(app, ["lote", str(csv_valido), str(saida), "--workers", "1"])
+
+    assert result.exit_code == 0
+    with zipfile.ZipFile(saida) as arquivo:
+        assert arquivo.namelist() == ["TXID001.png", "TXID002.png"]
+
+    result = runner.invoke(app, ["lote", str(csv_valido), str(tmp_path / "x"), "--container", "rar"])
+    assert result.exit_code == 1
+    assert "Container inválido" in result.stdout
+
 def test_lote_cria_diretorio_saida(csv_valido, tmp_path: Path):
     """
     Verifica se o comando 'lote' cria o diretório de saída se ele não existir.
@@ -243,4 +296,131 @@ def test_lote_fallback_para_config(tmp_path: Path, isolated_config):
     
     assert result.exit_code == 0, result.stdout
     assert "Geração em lote concluída" in result.stdout
-    assert (output_dir / "TXIDMINIMO.png").exists()
\ No newline at end of file
+    assert (output_dir / "TXIDMINIMO.png").exists()
+
+
+def test_lote_workers_mantem_ordem_e_resumo(csv_com_erros, tmp_path: Path):
+    """
+    Verifica se o 'lote' com vários processos reporta as linhas na ordem do
+    arquivo e exibe o resumo com as contagens.
+    """
+    output_dir = tmp_path / "qrcodes_workers"
+
+    result = runner.invoke(app, ["lote", str(csv_com_erros), str(output_dir), "--workers", "2"])
+
+    assert result.exit_code == 0, result.stdout
+    assert result.stdout.index("TXIDVALIDO'") < result.stdout.index("Linha 3 Ignorada") < result.stdout.index("TXIDVALIDO2")
+    assert "sucesso: 2" in result.stdout
+    assert "ignoradas: 1" in result.stdout
+    assert "linhas/s" in result.stdout
+    assert len(list(output_dir.glob("*.png"))) == 2
+
+def test_lote_resume_nao_refaz_linhas_concluidas(csv_valido, tmp_path: Path):
+    """
+    Verifica se o 'lote --resume' não gera novamente as linhas já concluídas
+    em uma execução anterior.
+    """
+    output_dir = tmp_path / "qrcodes_resume"
+
+    primeira = runner.invoke(app, ["lote", str(csv_valido), str(output_dir), "--resume", "--workers", "1"])
+    segunda = runner.invoke(app, ["lote", str(csv_valido), str(output_dir), "--resume", "--workers", "1"])
+
+    assert primeira.exit_code == 0, primeira.stdout
+    assert "sucesso: 2" in primeira.stdout
+    assert segunda.exit_code == 0, segunda.stdout
+    assert "Linhas processadas: 0" in segunda.stdout
+
+def test_lote_formato_payload_csv_e_jsonl(csv_com_erros, tmp_path: Path):
+    """
+    Verifica se o 'lote --formato payload' grava apenas os payloads, em CSV ou
+    JSON Lines conforme a extensão, sem gerar imagens.
+    """
+    import json
+    from src.pixcore.decipher import decode
+
+    saida_csv = tmp_path / "payloads.csv"
+    saida_jsonl = tmp_path / "payloads.jsonl"
+
+    result_csv = runner.invoke(app, ["lote", str(csv_com_erros), str(saida_csv), "--formato", "payload"])
+    result_jsonl = runner.invoke(app, ["lote", str(csv_com_erros), str(saida_jsonl), "--formato", "payload"])
+
+    assert result_csv.exit_code == 0
+    assert result_jsonl.exit_code == 0
+    assert "Linha 3 Ignorada" in result_csv.stdout
+
+    with open(saida_csv, newline="", encoding="utf-8") as f:
+        linhas_csv = list(csv.DictReader(f))
+    with open(saida_jsonl, encoding="utf-8") as f:
+        linhas_jsonl = [json.loads(linha) for linha in f]
+
+    assert [linha["txid"] for linha in linhas_csv] == ["TXIDVALIDO", "TXIDVALIDO2"]
+    assert linhas_jsonl == linhas_csv
+    assert decode(linhas_csv[0]["payload"])["transaction_id"] == "TXIDVALIDO"
+    assert not list(tmp_path.glob("*.png"))
+
+def test_lote_formato_payload_stdout_nao_importa_imagens(csv_valido):
+    """
+    Verifica se o modo payload escreve na saída padrão sem carregar o Pillow e o qrcode.
+    """
+    import subprocess
+    import sys
+
+    codigo = (
+        "import sys\n"
+        "from src.pixcore.cli import app\n"
+        "try:\n"
+        f"    app(['lote', {str(csv_valido)!r}, '--formato', 'payload'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "assert 'PIL' not in sys.modules and 'qrcode' not in sys.modules\n"
+    )
+    result = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, cwd=Path(__file__).parents[1])
+
+    assert result.returncode == 0, result.stderr
+    linhas = result.stdout.splitlines()
+    assert linhas[0] == "txid,payload"
+    assert [linha.split(",")[0] for linha in linhas[1:]] == ["TXID001", "TXID002"]
+    assert "Geração de payloads concluída" in result.stderr
+
+def test_importacao_nao_carrega_dependencias_pesadas():
+    """
+    Verifica se importar a biblioteca e a CLI não carrega Pillow, qrcode e pyfiglet.
+    """
+    import subprocess
+    import sys
+
+    codigo = (
+        "import sys\n"
+        "import src.pixcore\n"
+        "assert 'src.pixcore.brcode' not in sys.modules\n"
+        "import src.pixcore.cli\n"
+        "pesados = [m for m in ('PIL', 'qrcode', 'pyfiglet') if m in sys.modules]\n"
+        "assert not pesados, pesados\n"
+        "assert src.pixcore.Pix is src.pixcore.brcode.Pix\n"
+    )
+    result = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, cwd=Path(__file__).parents[1])
+
+    assert result.returncode == 0, result.stderr
+
+def test_importacao_estrela_exporta_api_publica():
+    """
+    Verifica se `from pixcore import *` e `dir(pixcore)` expõem a API pública, e apenas ela.
+    """
+    import subprocess
+    import sys
+
+    codigo = (
+        "import src.pixcore as pixcore\n"
+        "namespace = {}\n"
+        "exec('from src.pixcore import *', namespace)\n"
+        "esperados = {'Pix', 'PixTemplate', 'PixData', 'DecodedPix', 'decode',\n"
+        "             'PixCoreError', 'ChavePixInvalidaError', 'CRCInvalidoError'}\n"
+        "assert esperados <= set(namespace), sorted(namespace)\n"
+        "assert namespace['Pix'] is pixcore.brcode.Pix\n"
+        "assert 'TYPE_CHECKING' not in namespace and not hasattr(pixcore, 'TYPE_CHECKING')\n"
+        "assert esperados <= set(dir(pixcore))\n"
+        "assert set(pixcore.__all__) <= set(dir(pixcore))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, cwd=Path(__file__).parents[1])
+
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,90 @@
+import io
+import json
+import re
+import tarfile
+import zipfile
+import pytest
+from PIL import Image
+from pathlib import Path
+
+from src.pixcore import containers
+
+def _png(modo: str = "1", cor=0, tamanho=(21, 21)) -> bytes:
+    destino = io.BytesIO()
+    Image.new(modo, tamanho, cor).save(destino, format="PNG")
+    return destino.getvalue()
+
+@pytest.mark.parametrize("caminho, esperado", [
+    ("saida.zip", "zip"), ("saida.TAR", "tar"), ("saida.tar.gz", "tar"), ("saida.tgz", "tar"),
+    ("saida.pdf", "pdf"), ("saida", "diretorio"), ("qrcodes/", "diretorio"),
+])
+def test_container_do_caminho(caminho, esperado):
+    assert containers.container_do_caminho(caminho) == esperado
+
+def test_zip_e_tar_na_ordem_de_gravacao(tmp_path: Path):
+    """ZIP e TAR (inclusive .tar.gz) guardam os arquivos na ordem em que foram gravados."""
+    for nome in ("qr.zip", "qr.tar", "qr.tar.gz"):
+        destino = containers.abrir_destino(str(tmp_path / nome))
+        for txid in ("B", "A", "C"):
+            destino.gravar(f"{txid}.png", _png(), txid, 1.0)
+        destino.fechar()
+
+    with zipfile.ZipFile(tmp_path / "qr.zip") as arquivo:
+        assert arquivo.namelist() == ["B.png", "A.png", "C.png"]
+        assert arquivo.getinfo("A.png").compress_type == zipfile.ZIP_STORED
+        assert arquivo.read("A.png") == _png()
+    for nome in ("qr.tar", "qr.tar.gz"):
+        with tarfile.open(tmp_path / nome) as arquivo:
+            assert arquivo.getnames() == ["B.png", "A.png", "C.png"]
+
+def test_pdf_paginas_e_xref(tmp_path: Path):
+    """O PDF tem uma página a cada `por_pagina` QR Codes, legendas e um xref com os offsets corretos."""
+    caminho = tmp_path / "qr.pdf"
+    destino = containers.DestinoPdf(str(caminho), por_pagina=4)
+    for i, png in enumerate([_png("1"), _png("RGB", "navy"), _png("P"), _png("RGBA", (255, 0, 0, 128))] * 2 + [_png()]):
+        destino.gravar(f"T{i}.png", png, f"T{i}", i + 0.5)
+    destino.fechar()
+
+    conteudo = caminho.read_bytes()
+    assert conteudo.startswith(b"%PDF-1.4") and conteudo.endswith(b"%%EOF\n")
+    assert b"/Count 3" in conteudo
+    assert conteudo.count(b"/Subtype /Image") == 9
+    assert b"(T8) Tj" in conteudo and b"(R$ 8,50) Tj" in conteudo
+
+    inicio_xref = int(re.search(rb"startxref\n(\d+)", conteudo).group(1))
+    assert conteudo[inicio_xref:].startswith(b"xref")
+    entradas = re.findall(rb"(\d{10}) 00000 n", conteudo[inicio_xref:])
+    for numero, offset in enumerate(entradas, start=1):
+        assert conteudo[int(offset):].startswith(b"%d 0 obj" % numero)
+
+def test_pdf_embute_png_sem_decodificar():
+    """Os dados comprimidos de um PNG sem transparência são copiados para o PDF."""
+    png = _png("1", tamanho=(40, 30))
+    largura, altura, corpo = containers._imagem_pdf(png)
+
+    assert (largura, altura) == (40, 30)
+    assert b"/ColorSpace /DeviceGray /BitsPerComponent 1" in corpo
+    assert b"/Predictor 15" in corpo
+
+def test_folhas_com_indice(tmp_path: Path):
+    """As folhas reúnem `por_pagina` QR Codes e o índice JSON aponta a posição de cada um."""
+    destino = containers.abrir_destino(str(tmp_path / "folhas"), "folhas", por_pagina=4)
+    for i in range(5):
+        destino.gravar(f"T{i}.png", _png("L", i * 40), f"T{i}", float(i))
+    destino.fechar()
+
+    indice = json.loads((tmp_path / "folhas" / containers.ARQUIVO_INDICE).read_text(encoding="utf-8"))
+    assert [r["txid"] for r in indice] == ["T0", "T1", "T2", "T3", "T4"]
+    assert [r["folha"] for r in indice] == ["folha_00001.png"] * 4 + ["folha_00002.png"]
+
+    registro = indice[3]
+    with Image.open(tmp_path / "folhas" / registro["folha"]) as folha:
+        assert folha.size == (42, 42)
+        recorte = folha.crop((registro["x"], registro["y"], registro["x"] + registro["largura"], registro["y"] + registro["altura"]))
+        assert set(recorte.getdata()) == {120}
+
+def test_container_invalido(tmp_path: Path):
+    with pytest.raises(ValueError):
+        containers.abrir_destino(str(tmp_path / "saida"), "rar")
+    with pytest.raises(ValueError):
+        containers.DestinoPdf(str(tmp_path / "qr.pdf"), por_pagina=0)
@@ -35,4 +35,88 @@ def test_decodificacao_sucesso(pix_payload_valido, pix_data_valida):
     assert result['merchant_name_alt'] == pix_data_valida.recebedor_nome_alt
     assert result['merchant_city_alt'] == pix_data_valida.recebedor_cidade_alt
     assert result['merchant_category_code'] == '0000'
-    assert result['country_code'] == 'BR'
\ No newline at end of file
+    assert result['country_code'] == 'BR'
+
+
+def test_decodificacao_aceita_bytes_e_texto_nao_ascii():
+    """Verifica se payloads em bytes e com acentos são decodificados como a string equivalente."""
+    from src.pixcore.brcode import Pix
+
+    payload = Pix(PixData(
+        recebedor_nome="JOSÉ DA CONCEIÇÃO",
+        recebedor_cidade="SÃO PAULO",
+        pix_key="a1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d",
+        valor=1.50,
+        transacao_id="ABC",
+    )).payload()
+
+    result = decode(payload)
+
+    assert result['merchant_name'] == "JOSÉ DA CONCEIÇÃO"
+    assert result['merchant_city'] == "SÃO PAULO"
+    assert result['transaction_id'] == "ABC"
+    assert decode(payload.encode('utf-8')) == result
+    assert decode(memoryview(payload.encode('utf-8'))) == result
+
+def test_decode_many_codigos_por_item(pix_payload_valido):
+    """Verifica se o decode_many reporta um código por payload, sem lançar exceções."""
+    from src.pixcore.decipher import (
+        decode_many, verify_crc_many,
+        CODIGO_OK, CODIGO_FORMATO_INVALIDO, CODIGO_CRC_INVALIDO, CODIGO_PAYLOAD_MALFORMADO,
+    )
+    from src.pixcore.utils import calculate_crc16
+
+    malformado = "0002015XAB6304"
+    malformado += calculate_crc16(malformado)
+    payloads = [
+        pix_payload_valido,
+        pix_payload_valido[:-4] + "0000",
+        "payload qualquer",
+        None,
+        malformado,
+        pix_payload_valido.encode('utf-8'),
+        pix_payload_valido[:-4] + pix_payload_valido[-4:].lower(),
+    ]
+
+    resultado = decode_many(payloads)
+
+    assert resultado.codigos == [
+        CODIGO_OK, CODIGO_CRC_INVALIDO, CODIGO_FORMATO_INVALIDO, CODIGO_FORMATO_INVALIDO,
+        CODIGO_PAYLOAD_MALFORMADO, CODIGO_OK, CODIGO_OK,
+    ]
+    assert resultado.dados[0] == decode(pix_payload_valido)
+    assert resultado.dados[5] == resultado.dados[0]
+    assert resultado.dados[1] is None and resultado.dados[4] is None
+    assert resultado.total_erros == 4
+    assert verify_crc_many(iter(payloads))[:5] == [CODIGO_OK, CODIGO_CRC_INVALIDO, CODIGO_FORMATO_INVALIDO, CODIGO_FORMATO_INVALIDO, CODIGO_OK]
+
+def test_decode_como_registro(pix_payload_valido, pix_data_valida):
+    """Verifica se o decode com `como_registro=True` retorna um DecodedPix equivalente ao dicionário."""
+    from src.pixcore.decipher import decode_many
+    from src.pixcore.models import DecodedPix
+
+    registro = decode(pix_payload_valido, como_registro=True)
+
+    assert isinstance(registro, DecodedPix)
+    assert registro.merchant_name == pix_data_valida.recebedor_nome
+    assert registro.transaction_amount == pix_data_valida.valor
+    assert registro.point_of_initiation_method is None
+    assert registro.transaction_amount_cents == 15075
+    assert 'transaction_amount_cents' not in decode(pix_payload_valido)
+    assert registro.to_dict() == {**decode(pix_payload_valido), 'transaction_amount_cents': 15075}
+    assert decode_many([pix_payload_valido], como_registro=True).dados == [registro]
+
+def test_decode_valor_nao_numerico_mantem_float(pix_payload_valido):
+    """Um campo 54 como "nan" continua decodificado em `transaction_amount`, sem centavos exatos."""
+    import math
+    from src.pixcore.utils import calculate_crc16
+
+    sem_crc = pix_payload_valido[:-4].replace("5406150.75", "5403nan")
+    result = decode(sem_crc + calculate_crc16(sem_crc))
+    registro = decode(sem_crc + calculate_crc16(sem_crc), como_registro=True)
+
+    assert math.isnan(result['transaction_amount'])
+    assert 'transaction_amount_cents' not in result
+    assert math.isnan(registro.transaction_amount)
+    assert registro.transaction_amount_cents is None
+    assert result['merchant_name'] == "Empresa Completa LTDA"
@@ -0,0 +1,133 @@
+import os
+import pytest
+from PIL import Image, ImageDraw
+from pathlib import Path
+
+from src.pixcore import logo as modulo_logo
+from src.pixcore.brcode import Pix
+from src.pixcore.cache import CacheQRCode
+from src.pixcore.exceptions import ProcessamentoImagemError
+from src.pixcore.logo import LogoAsset, carregar_logo
+from src.pixcore.models import PixData
+
+@pytest.fixture
+def pix():
+    return Pix(PixData(
+        recebedor_nome="EMPRESA MODELO",
+        recebedor_cidade="SAO PAULO",
+        pix_key="123e4567-e89b-12d3-a456-426655440000",
+        valor=19.90,
+        transacao_id="PEDIDO123",
+    ))
+
+@pytest.fixture
+def arquivo_logo(tmp_path: Path):
+    """Cria um logo RGBA com transparência parcial."""
+    caminho = tmp_path / "logo.png"
+    imagem = Image.new("RGBA", (120, 80), (0, 0, 0, 0))
+    ImageDraw.Draw(imagem).ellipse((5, 5, 115, 75), fill=(200, 30, 60, 180))
+    imagem.save(caminho)
+    return caminho
+
+@pytest.fixture(autouse=True)
+def cache_vazio():
+    modulo_logo.limpar_cache_logos()
+    yield
+    modulo_logo.limpar_cache_logos()
+
+def test_logo_identico_ao_colado_diretamente(pix, arquivo_logo):
+    """Caminho, imagem carregada e `LogoAsset` geram a mesma imagem que a colagem original."""
+    esperado = pix.qrcode()
+    with Image.open(arquivo_logo) as logo:
+        tamanho = int(esperado.size[0] * 0.25)
+        logo.thumbnail((tamanho, tamanho))
+        esperado.paste(logo, ((esperado.size[0] - logo.size[0]) // 2, (esperado.size[1] - logo.size[1]) // 2), mask=logo)
+
+    with Image.open(arquivo_logo) as carregada:
+        imagens = [
+            pix.qrcode(caminho_logo=str(arquivo_logo)),
+            pix.qrcode(caminho_logo=carregada),
+            pix.qrcode(caminho_logo=LogoAsset(arquivo_logo)),
+        ]
+    assert all(imagem.tobytes() == esperado.tobytes() for imagem in imagens)
+
+def test_logo_por_caminho_e_decodificado_uma_vez(pix, arquivo_logo):
+    """Várias imagens com o mesmo logo reaproveitam o arquivo decodificado."""
+    for _ in range(3):
+        pix.qrcode(caminho_logo=str(arquivo_logo))
+
+    estatisticas = modulo_logo.estatisticas_cache_logos()
+    assert (estatisticas.hits, estatisticas.misses) == (2, 1)
+
+def test_logo_alterado_invalida_o_cache(arquivo_logo):
+    """Substituir o arquivo gera um novo `LogoAsset`."""
+    primeiro = carregar_logo(arquivo_logo)
+    Image.new("RGBA", (60, 60), "blue").save(arquivo_logo)
+    os.utime(arquivo_logo, ns=(0, os.stat(arquivo_logo).st_mtime_ns + 1_000_000))
+
+    segundo = carregar_logo(arquivo_logo)
+    assert segundo is not primeiro
+    assert segundo.imagem.size == (60, 60)
+
+def test_redimensionado_guarda_cada_tamanho(arquivo_logo):
+    """Cada tamanho de destino é calculado uma única vez, com a máscara do canal alfa."""
+    logo = LogoAsset(arquivo_logo)
+    imagem, mascara = logo.redimensionado(30)
+
+    assert logo.redimensionado(30)[0] is imagem
+    assert imagem.size == (30, 20)
+    assert mascara.mode == "L"
+
+def test_logo_rgb_sem_transparencia(pix, tmp_path: Path):
+    """Logos sem canal alfa são colados opacos."""
+    caminho = tmp_path / "logo.jpg"
+    Image.new("RGB", (50, 50), "red").save(caminho)
+
+    imagem = pix.qrcode(caminho_logo=str(caminho))
+    vermelho, verde, azul = imagem.getpixel((imagem.size[0] // 2, imagem.size[1] // 2))
+    assert vermelho > 240 and verde < 16 and azul < 16
+
+def test_logo_inexistente(pix, tmp_path: Path):
+    """Um logo inexistente continua gerando `ProcessamentoImagemError`."""
+    with pytest.raises(ProcessamentoImagemError, match="Arquivo não encontrado"):
+        pix.qrcode(caminho_logo=str(tmp_path / "nao_existe.png"))
+
+def test_cache_qrcode_aceita_logo_asset(pix, arquivo_logo):
+    """`CacheQRCode` usa o conteúdo de um `LogoAsset` como parte da chave."""
+    cache = CacheQRCode()
+    logo = LogoAsset(arquivo_logo)
+
+    primeiro = cache.png(pix.payload(), caminho_logo=logo)
+    assert cache.png(pix.payload(), caminho_logo=logo) is primeiro
+    assert cache.png(pix.payload(), caminho_logo=LogoAsset(Image.new("RGBA", (10, 10), "blue"))) != primeiro
+
+def test_imagem_carregada_e_preparada_uma_vez(pix, arquivo_logo, monkeypatch):
+    """A mesma imagem do Pillow é preparada (e identificada) uma única vez por lote."""
+    preparacoes = []
+    iniciar = LogoAsset.__init__
+
+    def contar(self, origem):
+        preparacoes.append(origem)
+        iniciar(self, origem)
+
+    monkeypatch.setattr(LogoAsset, "__init__", contar)
+    cache = CacheQRCode()
+    with Image.open(arquivo_logo) as carregada:
+        imagens = [pix.qrcode(caminho_logo=carregada) for _ in range(3)]
+        pngs = [cache.png(pix.payload(), caminho_logo=carregada) for _ in range(3)]
+
+    assert len(preparacoes) == 1
+    assert all(imagem.tobytes() == imagens[0].tobytes() for imagem in imagens)
+    assert all(png is pngs[0] for png in pngs)
+
+def test_imagem_coletada_libera_o_logo(pix):
+    """O logo preparado de uma imagem é descartado quando a imagem deixa de existir."""
+    import gc
+
+    imagem = Image.new("RGBA", (40, 40), "red")
+    pix.qrcode(caminho_logo=imagem)
+    assert len(modulo_logo._LOGOS_DE_IMAGENS) == 1
+
+    del imagem
+    gc.collect()
+    assert not modulo_logo._LOGOS_DE_IMAGENS
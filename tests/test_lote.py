@@ -0,0 +1,186 @@
+import pytest
+import csv
+from pathlib import Path
+
+from src.pixcore import lote
+
+@pytest.fixture
+def csv_misto(tmp_path: Path):
+    """Cria um CSV com linhas válidas, uma sem dados essenciais e uma com chave inválida."""
+    csv_path = tmp_path / "misto.csv"
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["valor", "txid", "nome", "cidade", "chave"])
+        writer.writerow(["10.50", "TXID001", "CLIENTE A", "SAO PAULO", "chave1@pix.com"])
+        writer.writerow(["", "TXID002", "CLIENTE B", "SAO PAULO", "chave2@pix.com"])
+        writer.writerow(["5,00", "TXID003", "CLIENTE C", "SAO PAULO", "chave-invalida"])
+        writer.writerow(["7.25", "TXID004", "CLIENTE D", "SAO PAULO", "chave4@pix.com"])
+    return csv_path
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_processar_csv_resultados_em_ordem(csv_misto, tmp_path: Path, workers):
+    """Verifica se os resultados seguem a ordem do arquivo, com ou sem processos paralelos."""
+    output_dir = tmp_path / "saida"
+
+    resultados = list(lote.processar_csv(str(csv_misto), str(output_dir), {}, workers=workers, tamanho_bloco=1))
+
+    assert [r.linha for r in resultados] == [2, 3, 4, 5]
+    assert [r.status for r in resultados] == [lote.SUCESSO, lote.IGNORADA, lote.ERRO, lote.SUCESSO]
+    assert (output_dir / "TXID001.png").exists()
+    assert (output_dir / "TXID004.png").exists()
+    assert not (output_dir / "TXID003.png").exists()
+
+def test_processar_csv_buffer_limitado(tmp_path: Path):
+    """Verifica se um buffer menor que o lote processa todas as linhas, na ordem."""
+    csv_path = tmp_path / "grande.csv"
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["valor", "txid", "nome", "cidade", "chave"])
+        for i in range(20):
+            writer.writerow([f"{i + 1}.00", f"TXID{i:03d}", "CLIENTE", "SAO PAULO", "chave@pix.com"])
+
+    output_dir = tmp_path / "saida"
+    resultados = list(lote.processar_csv(str(csv_path), str(output_dir), {}, workers=2, tamanho_bloco=3, tamanho_buffer=4))
+
+    assert [r.linha for r in resultados] == list(range(2, 22))
+    assert all(r.status == lote.SUCESSO for r in resultados)
+    assert len(list(output_dir.glob("*.png"))) == 20
+
+@pytest.fixture
+def csv_dez_linhas(tmp_path: Path):
+    """Cria um CSV válido com 10 cobranças."""
+    csv_path = tmp_path / "dez.csv"
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["valor", "txid", "nome", "cidade", "chave"])
+        for i in range(10):
+            writer.writerow([f"{i + 1}.00", f"TXID{i:03d}", "CLIENTE", "SAO PAULO", "chave@pix.com"])
+    return csv_path
+
+def test_processar_csv_retoma_lote_interrompido(csv_dez_linhas, tmp_path: Path):
+    """Verifica se, após uma interrupção, o lote continua a partir da primeira linha não concluída."""
+    output_dir = tmp_path / "saida"
+
+    execucao = lote.processar_csv(str(csv_dez_linhas), str(output_dir), {}, workers=1, tamanho_bloco=1, tamanho_buffer=1, retomar=True)
+    primeiros = [next(execucao) for _ in range(4)]
+    execucao.close()
+
+    assert [r.linha for r in primeiros] == [2, 3, 4, 5]
+    assert (output_dir / lote.ARQUIVO_JOURNAL).exists()
+
+    restantes = list(lote.processar_csv(str(csv_dez_linhas), str(output_dir), {}, workers=1, retomar=True))
+
+    assert restantes[0].linha > 5
+    assert restantes[-1].linha == 11
+    assert all(r.status == lote.SUCESSO for r in restantes)
+    assert len(list(output_dir.glob("*.png"))) == 10
+
+def test_processar_csv_retoma_apos_linha_invalida(tmp_path: Path):
+    """Uma linha com dados inválidos é registrada no journal e não prende a retomada nela."""
+    csv_path = tmp_path / "com_erro.csv"
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["valor", "txid", "nome", "cidade", "chave"])
+        for i in range(8):
+            chave = "chave-invalida" if i == 2 else "chave@pix.com"
+            writer.writerow([f"{i + 1}.00", f"TXID{i:03d}", "CLIENTE", "SAO PAULO", chave])
+    output_dir = tmp_path / "saida"
+
+    execucao = lote.processar_csv(str(csv_path), str(output_dir), {}, workers=1, tamanho_bloco=1, tamanho_buffer=1, retomar=True)
+    primeiros = [next(execucao) for _ in range(6)]
+    execucao.close()
+    assert primeiros[2].status == lote.ERRO
+
+    restantes = list(lote.processar_csv(str(csv_path), str(output_dir), {}, workers=1, retomar=True))
+
+    assert restantes[0].linha > 4
+    assert all(r.status == lote.SUCESSO for r in restantes)
+    assert restantes[-1].linha == 9
+
+def test_processar_csv_retomada_pula_arquivos_ja_gerados(csv_dez_linhas, tmp_path: Path):
+    """
+    Verifica se, ao retomar, as linhas após o ponto de retomada cujo arquivo já
+    existe com o mesmo payload não são geradas novamente.
+    """
+    output_dir = tmp_path / "saida"
+    list(lote.processar_csv(str(csv_dez_linhas), str(output_dir), {}, workers=1, retomar=True))
+
+    # Simula uma execução em que a linha 4 falhou: ela não aparece no journal.
+    journal = output_dir / lote.ARQUIVO_JOURNAL
+    registros = journal.read_text(encoding="utf-8").splitlines()
+    journal.write_text("\n".join([registros[0], registros[1], registros[2], registros[4]]) + "\n", encoding="utf-8")
+
+    resultados = list(lote.processar_csv(str(csv_dez_linhas), str(output_dir), {}, workers=1, retomar=True))
+
+    assert resultados[0].linha == 4
+    assert [r.status for r in resultados[:3]] == [lote.SUCESSO, lote.JA_GERADA, lote.SUCESSO]
+    assert resultados[-1].linha == 11
+
+def test_processar_csv_com_logo(csv_dez_linhas, tmp_path: Path):
+    """O logo é aplicado a todos os QR Codes, e um logo inexistente interrompe o lote antes de começar."""
+    from PIL import Image
+    from src.pixcore.exceptions import ProcessamentoImagemError
+
+    logo = tmp_path / "logo.png"
+    Image.new("RGBA", (40, 40), (255, 0, 0, 255)).save(logo)
+    output_dir = tmp_path / "saida"
+
+    resultados = list(lote.processar_csv(str(csv_dez_linhas), str(output_dir), {}, workers=1, caminho_logo=str(logo)))
+    assert all(r.status == lote.SUCESSO for r in resultados)
+    with Image.open(output_dir / "TXID000.png") as imagem:
+        assert imagem.getpixel((imagem.size[0] // 2, imagem.size[1] // 2)) == (255, 0, 0)
+
+    with pytest.raises(ProcessamentoImagemError):
+        list(lote.processar_csv(str(csv_dez_linhas), str(tmp_path / "outra"), {}, caminho_logo=str(tmp_path / "nao_existe.png")))
+
+def test_processar_csv_svg(csv_dez_linhas, tmp_path: Path):
+    """Com `formato="svg"`, cada linha gera um arquivo `[txid].svg`."""
+    output_dir = tmp_path / "saida"
+
+    resultados = list(lote.processar_csv(str(csv_dez_linhas), str(output_dir), {}, workers=1, formato="svg"))
+
+    assert all(r.status == lote.SUCESSO for r in resultados)
+    assert len(list(output_dir.glob("*.svg"))) == 10
+    assert not list(output_dir.glob("*.png"))
+    assert (output_dir / "TXID000.svg").read_text(encoding="utf-8").startswith("<?xml")
+
+    with pytest.raises(ValueError):
+        list(lote.processar_csv(str(csv_dez_linhas), str(output_dir), {}, formato="gif"))
+
+@pytest.mark.parametrize("saida, container", [("qrcodes.zip", None), ("qrcodes.pdf", None), ("folhas", "folhas")])
+def test_processar_csv_em_container(csv_dez_linhas, tmp_path: Path, saida, container):
+    """Com um container, os QR Codes são agrupados em poucos arquivos, na ordem do CSV."""
+    caminho = tmp_path / saida
+
+    resultados = list(lote.processar_csv(str(csv_dez_linhas), str(caminho), {}, workers=2, tamanho_bloco=3, container=container, por_pagina=4))
+
+    assert all(r.status == lote.SUCESSO for r in resultados)
+    if saida.endswith(".zip"):
+        import zipfile
+        with zipfile.ZipFile(caminho) as arquivo:
+            assert arquivo.namelist() == [f"TXID{i:03d}.png" for i in range(10)]
+    elif saida.endswith(".pdf"):
+        assert caminho.read_bytes().count(b"/Type /Page ") == 3
+    else:
+        assert sorted(p.name for p in caminho.iterdir()) == ["folha_00001.png", "folha_00002.png", "folha_00003.png", "indice.json"]
+
+def test_processar_csv_container_opcoes_incompativeis(csv_dez_linhas, tmp_path: Path):
+    """PDF e folhas exigem PNG, e a retomada só funciona com um diretório."""
+    with pytest.raises(ValueError):
+        list(lote.processar_csv(str(csv_dez_linhas), str(tmp_path / "qr.pdf"), {}, formato="svg"))
+    with pytest.raises(ValueError):
+        list(lote.processar_csv(str(csv_dez_linhas), str(tmp_path / "qr.zip"), {}, retomar=True))
+    assert not (tmp_path / "qr.pdf").exists()
+
+def test_gerar_payloads_trata_linhas_como_preparar_linha(csv_misto, tmp_path: Path):
+    """A geração de payloads e a de QR Codes classificam as linhas e montam os payloads da mesma forma."""
+    payloads = list(lote.gerar_payloads(str(csv_misto), {}))
+    tarefas = [lote.preparar_linha(n, row, {}, str(tmp_path)) for n, row, _ in lote.ler_csv(str(csv_misto))]
+
+    for (resultado, payload), tarefa in zip(payloads, tarefas):
+        if isinstance(tarefa, lote.TarefaLinha):
+            assert resultado.status == lote.SUCESSO
+            assert payload == tarefa.payload
+        else:
+            assert (resultado, payload) == (tarefa, None)
+    assert len(payloads) == len(tarefas) == 4
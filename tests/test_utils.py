@@ -1,5 +1,5 @@
 import pytest
-from src.pixcore.utils import calculate_crc16, parse_tlv
+from src.pixcore.utils import calculate_crc16, parse_tlv, scan_tlv, tlv_view, tlv_value, CRC16, _crc16_table_update, _crc16_update
 from src.pixcore.models import PixData
 
 @pytest.fixture
@@ -42,4 +42,124 @@ def test_parse_tlv_sucesso(pix_payload_valido):
         ('64', 46, '0005en_US0120Complete Company LLC0209SAO PAULO')
     ]
     
-    assert result == expected
\ No newline at end of file
+    assert result == expected
+
+def _crc16_bit_a_bit(payload: bytes) -> str:
+    """Implementação de referência (bit a bit) do CRC16-CCITT."""
+    crc = 0xFFFF
+    for byte in payload:
+        crc ^= (byte << 8)
+        for _ in range(8):
+            if (crc & 0x8000):
+                crc = (crc << 1) ^ 0x1021
+            else:
+                crc <<= 1
+    return format(crc & 0xFFFF, 'X').zfill(4)
+
+def test_calculate_crc16_compativel_com_referencia(pix_payload_valido):
+    """Verifica se o CRC16 tabelado gera o mesmo resultado do algoritmo bit a bit."""
+    payloads = ["", "A", pix_payload_valido[:-4], "6304", "SÃO PAULO" * 10]
+
+    for payload in payloads:
+        assert calculate_crc16(payload) == _crc16_bit_a_bit(payload.encode('utf-8'))
+
+def test_calculate_crc16_aceita_bytes_e_memoryview(pix_payload_valido):
+    """Verifica se str, bytes e memoryview produzem o mesmo CRC16."""
+    payload = pix_payload_valido[:-4]
+    dados = payload.encode('utf-8')
+
+    assert calculate_crc16(payload) == "2BE4"
+    assert calculate_crc16(dados) == "2BE4"
+    assert calculate_crc16(bytearray(dados)) == "2BE4"
+    assert calculate_crc16(memoryview(dados)) == "2BE4"
+
+def test_crc16_tabela_python_compativel_com_backend(pix_payload_valido):
+    """Verifica se a tabela em Python e o backend em C produzem o mesmo valor."""
+    dados = pix_payload_valido[:-4].encode('utf-8')
+
+    assert _crc16_table_update(dados, 0xFFFF) == _crc16_update(dados, 0xFFFF)
+
+def test_crc16_incremental_equivale_ao_calculo_completo(pix_payload_valido):
+    """Verifica se o estado incremental, copiado após um prefixo, gera o CRC correto."""
+    payload = pix_payload_valido[:-4]
+    prefixo, sufixo = payload[:70], payload[70:]
+
+    estado_prefixo = CRC16(prefixo)
+    estado = estado_prefixo.copy()
+    estado.update(sufixo.encode('utf-8'))
+
+    assert estado.digest() == calculate_crc16(payload)
+    assert estado_prefixo.digest() == calculate_crc16(prefixo)
+
+
+def test_scan_tlv_retorna_offsets_equivalentes_ao_parse_tlv(pix_payload_valido):
+    """Verifica se o scan_tlv localiza os mesmos campos do parse_tlv, por offsets."""
+    payload_sem_crc = pix_payload_valido[:-8]
+    view = tlv_view(payload_sem_crc)
+
+    campos = [(id_field, tlv_value(view, inicio, fim)) for id_field, inicio, fim in scan_tlv(view)]
+
+    assert campos == [(id_field, valor) for id_field, _, valor in parse_tlv(payload_sem_crc)]
+    assert [(id_field, payload_sem_crc[i:f]) for id_field, i, f in scan_tlv(payload_sem_crc)] == campos
+
+def test_scan_tlv_campos_aninhados_e_nao_ascii():
+    """Verifica a leitura de um template aninhado a partir do intervalo do pai, com texto não ASCII."""
+    payload = "5904JOSÉ62070503ABC"
+
+    for entrada in (payload, payload.encode('utf-8')):
+        view = tlv_view(entrada)
+        campos = list(scan_tlv(view))
+        assert [(id_field, tlv_value(view, i, f)) for id_field, i, f in campos] == [("59", "JOSÉ"), ("62", "0503ABC")]
+
+        _, inicio, fim = campos[1]
+        assert [(id_field, tlv_value(view, i, f)) for id_field, i, f in scan_tlv(view, inicio, fim)] == [("05", "ABC")]
+
+def test_scan_tlv_tamanho_invalido():
+    """Verifica se um tamanho não numérico gera DecodificacaoPayloadError."""
+    from src.pixcore.exceptions import DecodificacaoPayloadError
+
+    with pytest.raises(DecodificacaoPayloadError, match="'X1'"):
+        list(scan_tlv(b"5902BR59X1A"))
+
+def test_conversao_de_centavos_exata():
+    """Verifica a formatação e a leitura de centavos sem passar por float."""
+    from decimal import Decimal
+    from src.pixcore.utils import format_cents, parse_cents, to_cents
+
+    assert format_cents(15075) == "150.75"
+    assert format_cents(7) == "0.07"
+    assert parse_cents("150.75") == 15075
+    assert parse_cents("10") == 1000
+    assert parse_cents("0.5") == 50
+    assert to_cents(Decimal("19.90")) == 1990
+    assert to_cents(10) == 1000
+    for valor in (0.1, 19.9, 150.75, 1.005, 999.995):
+        assert format_cents(to_cents(valor)) == f"{valor:.2f}"
+
+    with pytest.raises(ValueError):
+        parse_cents("abc")
+    with pytest.raises(ValueError):
+        to_cents(float("nan"))
+
+def test_lru_cache_descarta_menos_usado_e_e_seguro_entre_threads():
+    """Verifica a política LRU e a consistência dos contadores com várias threads."""
+    from concurrent.futures import ThreadPoolExecutor
+    from src.pixcore.utils import LRUCache
+
+    cache = LRUCache(tamanho_maximo=2)
+    cache.obter_ou_calcular("a", str.upper)
+    cache.obter_ou_calcular("b", str.upper)
+    cache.obter_ou_calcular("a", str.upper)
+    cache.obter_ou_calcular("c", str.upper)
+
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.estatisticas().evictions == 1
+
+    cache = LRUCache(tamanho_maximo=8)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        resultados = list(executor.map(lambda i: cache.obter_ou_calcular(i % 16, str), range(4000)))
+
+    assert resultados == [str(i % 16) for i in range(4000)]
+    estatisticas = cache.estatisticas()
+    assert estatisticas.hits + estatisticas.misses == 4000
+    assert estatisticas.tamanho <= 8
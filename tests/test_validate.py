@@ -33,4 +33,70 @@ def test_validar_telefone_valido():
     assert validar_telefone("+55 (11) 99999-9999") == True
 
 def test_validar_telefone_invalido():
-    assert validar_telefone("telefone_invalido") == False
\ No newline at end of file
+    assert validar_telefone("telefone_invalido") == False
+
+
+def test_tipo_chave_usa_cache():
+    """Verifica se a classificação de uma chave repetida é atendida pelo cache."""
+    from src.pixcore import validate
+
+    validate.limpar_cache_chaves()
+    try:
+        assert validate.tipo_chave("10532435028") == "CPF"
+        assert validate.tipo_chave("10532435028") == "CPF"
+        assert validate.tipo_chave("+55 (11) 99999-8888") == "Telefone"
+
+        estatisticas = validate.estatisticas_cache_chaves()
+        assert (estatisticas.hits, estatisticas.misses, estatisticas.tamanho) == (1, 2, 2)
+
+        validate.configurar_cache_chaves(1)
+        assert validate.estatisticas_cache_chaves().evictions == 1
+        assert "10532435028" not in validate._CACHE_TIPO_CHAVE
+    finally:
+        validate.configurar_cache_chaves(1024)
+        validate.limpar_cache_chaves()
+
+@pytest.mark.parametrize("chave, esperado", [
+    ("a1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d", ("Chave Aleatória (EVP)", "a1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d")),
+    ("A1B2C3D4E5F64A7B8C9D0E1F2A3B4C5D", ("Chave Aleatória (EVP)", "a1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d")),
+    ("Cliente@Empresa.com.br", ("Email", "cliente@empresa.com.br")),
+    ("+55 (11) 99999-8888", ("Telefone", "+5511999998888")),
+    ("(48) 3333-4444", ("Telefone", "+554833334444")),
+    ("105.324.350-28", ("CPF", "10532435028")),
+    ("00.000.000/0001-91", ("CNPJ", "00000000000191")),
+    ("11999998888@", ("Telefone", "+5511999998888")),
+    ("a1b2c3d4-e5f6-4a7b-8c9d-0e1f2a3b4c5d\n", ("Tipo Desconhecido", None)),
+    ("chave_invalida", ("Tipo Desconhecido", None)),
+])
+def test_classificar_chave_tipo_e_normalizacao(chave, esperado):
+    """Verifica o tipo e a forma normalizada retornados pelo classificador de passada única."""
+    from src.pixcore import validate
+
+    assert validate.classificar_chave(chave) == esperado
+    assert validate._classificar_chave(chave)[0] == validate._classificar_sequencial(chave)
+
+@pytest.mark.parametrize("com_numpy", [True, False])
+def test_validar_documentos_many_igual_ao_escalar(monkeypatch, com_numpy):
+    """Verifica se as validações em lote retornam a mesma máscara das funções escalares."""
+    from src.pixcore import utils, validate
+
+    if com_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(utils, "_import_numpy", lambda: None)
+
+    cpfs = ["105.324.350-28", "10532435028", "10532435029", "00000000000", "123", "", None, "105.324.350-2a"]
+    cnpjs = ["00.000.000/0001-91", "00000000000191", "00000000000100", "11111111111111", "191", None]
+
+    assert validate.validar_cpf_many(cpfs) == [isinstance(c, str) and validate.validar_cpf(c) for c in cpfs]
+    assert validate.validar_cnpj_many(cnpjs) == [isinstance(c, str) and validate.validar_cnpj(c) for c in cnpjs]
+
+def test_validar_cpf_many_retorna_array_numpy():
+    """Verifica se uma entrada do NumPy retorna uma máscara do NumPy."""
+    numpy = pytest.importorskip("numpy")
+    from src.pixcore.validate import validar_cpf_many
+
+    mascara = validar_cpf_many(numpy.array(["10532435028", "10532435029"]))
+
+    assert isinstance(mascara, numpy.ndarray)
+    assert mascara.tolist() == [True, False]